@@ -26,5 +26,5 @@ ARCHIVE_FOLDER_PATTERN = re.compile(
 
 # Pattern for image filenames: {prefix}-{segment}-{frame}.png
 # Example: sparrow_cam-1488-0.png (segment 1488, frame 0)
-# Groups: (1) prefix, (2) segment number, (3) frame index
-IMAGE_FILENAME_PATTERN = re.compile(r"^(.+)-(\d+)-(\d+)\.png$")
+# Groups: (1) prefix, (2) segment number, (3) frame index; use fullmatch (the pattern is unanchored)
+IMAGE_FILENAME_PATTERN = re.compile(r"(.+)-(\d+)-(\d+)\.png", re.ASCII)
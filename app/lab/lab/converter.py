@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
+import os
+import re
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import cv2
@@ -12,6 +15,19 @@ from lab.constants import ARCHIVE_DIR, IMAGES_DIR
 
 ProgressCallback = Callable[[int, int, str], None]
 
+# PNG encoder parameters - the fastest zlib level, since encoding dominates per-frame time after decoding
+PNG_WRITE_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
+# Matches year/month/day folder names (ASCII digits only)
+_is_numeric_name = re.compile(r"[0-9]+").fullmatch
+
+# Number of .ts files converted in parallel. OpenCV releases the GIL while decoding and encoding,
+# so threads use all cores
+CONVERT_WORKERS = os.cpu_count() or 1
+
+# Cores shared between the parallel conversions' FFmpeg decoder threads
+_CPU_COUNT = os.cpu_count() or 1
+
 
 def get_unconverted_playlists(
     archive_path: Path = ARCHIVE_DIR,
@@ -31,42 +47,55 @@ def get_unconverted_playlists(
 
     images_path.mkdir(parents=True, exist_ok=True)
 
+    # Collect converted folders once, instead of checking each playlist's images folder
+    converted = {relative_path for relative_path, _ in _iter_playlist_folders(images_path)}
+
     unconverted: list[str] = []
 
-    # Walk the nested structure: year/month/day/folder
-    for year_dir in sorted(archive_path.iterdir()):
-        if not year_dir.is_dir() or not year_dir.name.isdigit():
-            continue
+    for relative_path, folder in _iter_playlist_folders(archive_path):
+        # Check if there are any .ts files to convert
+        if relative_path not in converted and _has_ts_file(folder):
+            unconverted.append(relative_path)
 
-        for month_dir in sorted(year_dir.iterdir()):
-            if not month_dir.is_dir() or not month_dir.name.isdigit():
-                continue
+    return unconverted
 
-            for day_dir in sorted(month_dir.iterdir()):
-                if not day_dir.is_dir() or not day_dir.name.isdigit():
-                    continue
 
-                for folder in sorted(day_dir.iterdir()):
-                    if not folder.is_dir():
-                        continue
+def _iter_playlist_folders(base_path: Path) -> Iterator[tuple[str, str]]:
+    """
+    Yield (relative_path, path) of every {year}/{month}/{day}/{folder_name} directory under base_path.
 
-                    # Check if corresponding images folder exists
-                    relative_path = f"{year_dir.name}/{month_dir.name}/{day_dir.name}/{folder.name}"
-                    images_folder = images_path / relative_path
+    Folders are yielded in sorted order. Year, month and day names must be numeric.
+    """
+    for year in _sorted_subdirs(str(base_path), numeric=True):
+        for month in _sorted_subdirs(year.path, numeric=True):
+            for day in _sorted_subdirs(month.path, numeric=True):
+                for folder in _sorted_subdirs(day.path):
+                    yield f"{year.name}/{month.name}/{day.name}/{folder.name}", folder.path
 
-                    if not images_folder.exists():
-                        # Check if there are any .ts files to convert
-                        ts_files = list(folder.glob("*.ts"))
-                        if ts_files:
-                            unconverted.append(relative_path)
 
-    return unconverted
+def _has_ts_file(path: str) -> bool:
+    """Check if a folder contains a .ts file, stopping at the first one found."""
+    with os.scandir(path) as entries:
+        return any(entry.name.endswith(".ts") for entry in entries)
+
+
+def _sorted_subdirs(path: str, numeric: bool = False) -> list[os.DirEntry[str]]:
+    """
+    List the subdirectories of path sorted by name, optionally only those with numeric names.
+
+    os.scandir entries usually know whether they are directories without an extra stat call.
+    """
+    with os.scandir(path) as entries:
+        # Filter on the name first, so non-numeric entries never need an is_dir() check
+        subdirs = [entry for entry in entries if (not numeric or _is_numeric_name(entry.name)) and entry.is_dir()]
+    return sorted(subdirs, key=lambda entry: entry.name)
 
 
 def convert_playlist_to_pngs(
     folder_path: Path,
     images_base_path: Path = IMAGES_DIR,
     on_file_progress: ProgressCallback | None = None,
+    sample_every: int = 1,
 ) -> int:
     """
     Convert all .ts files in folder_path to PNG frames.
@@ -75,16 +104,26 @@ def convert_playlist_to_pngs(
         folder_path: Absolute path to folder containing .ts files
         images_base_path: Base path for output images
         on_file_progress: Callback(current_file, total_files, filename)
+        sample_every: Extract only every Nth frame of each file (1 extracts all frames).
+                      Skipped frames are never decoded; PNG names keep the source frame index.
 
     Returns:
         Number of frames extracted.
     """
+    if sample_every < 1:
+        raise ValueError(f"sample_every must be at least 1, got {sample_every}")
     if not folder_path.exists():
         raise FileNotFoundError(f"Folder does not exist: {folder_path}")
     if not folder_path.is_dir():
         raise NotADirectoryError(f"Path is not a directory: {folder_path}")
 
-    ts_files = sorted(folder_path.glob("*.ts"))
+    # (name, path) strings of the .ts files, listed without building a Path per entry
+    with os.scandir(folder_path) as entries:
+        ts_files = sorted(
+            (entry.name, entry.path)
+            for entry in entries
+            if entry.name.endswith(".ts") and entry.is_file(follow_symlinks=False)
+        )
     if not ts_files:
         return 0
 
@@ -97,43 +136,76 @@ def convert_playlist_to_pngs(
 
     target_folder = images_base_path / relative_path
     target_folder.mkdir(parents=True, exist_ok=True)
+    target_folder_str = os.fspath(target_folder)
 
     fps: float | None = None
     total_frames = 0
 
-    for idx, ts_file in enumerate(ts_files):
-        if on_file_progress:
-            on_file_progress(idx + 1, len(ts_files), ts_file.name)
+    # Convert files in parallel, collecting results (and reporting progress) in file order.
+    # Each decoder gets its share of the cores, so concurrent captures don't oversubscribe them
+    workers = min(CONVERT_WORKERS, len(ts_files))
+    decoder_threads = max(1, _CPU_COUNT // workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda ts_file: _convert_ts_file(ts_file[1], target_folder_str, sample_every, decoder_threads),
+            ts_files,
+        )
+        for idx, ((name, _), (frames, file_fps)) in enumerate(zip(ts_files, results)):
+            if on_file_progress:
+                on_file_progress(idx + 1, len(ts_files), name)
 
-        cap = cv2.VideoCapture(str(ts_file))
-        if not cap.isOpened():
-            continue
+            if fps is None:
+                fps = file_fps
+            total_frames += frames
 
-        if fps is None:
-            fps = cap.get(cv2.CAP_PROP_FPS)
+    if fps is not None and fps > 0:
+        (target_folder / "stream_info.json").write_text(json.dumps({"fps": fps}))
 
-        frame_index = 0
-        while True:
-            success, frame = cap.read()
-            if not success:
-                break
+    return total_frames
 
-            output_path = target_folder / f"{ts_file.stem}-{frame_index}.png"
-            cv2.imwrite(str(output_path), frame)
-            frame_index += 1
 
-        cap.release()
-        total_frames += frame_index
+def _convert_ts_file(
+    ts_path: str, target_folder: str, sample_every: int, decoder_threads: int
+) -> tuple[int, float | None]:
+    """
+    Convert every sample_every-th frame of the .ts file at ts_path to PNGs in target_folder,
+    decoding with at most decoder_threads FFmpeg threads.
 
-    if fps is not None and fps > 0:
-        (target_folder / "stream_info.json").write_text(json.dumps({"fps": fps}))
+    Returns:
+        Tuple of (frames extracted, fps of the video or None if it could not be opened)
+    """
+    cap = cv2.VideoCapture(ts_path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_N_THREADS, decoder_threads])
+    if not cap.isOpened():
+        return 0, None
+
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    frames = 0
+
+    # Output path template filled with the frame index, escaping any "%" in the file name
+    path_template = os.path.join(
+        target_folder, os.path.basename(ts_path).removesuffix(".ts").replace("%", "%%") + "-%d.png"
+    )
+
+    # grab() only demuxes the next frame; retrieve() decodes it, so skipped frames cost little
+    frame_index = 0
+    while cap.grab():
+        if frame_index % sample_every == 0:
+            success, frame = cap.retrieve()
+            if not success:
+                break
 
-    return total_frames
+            cv2.imwrite(path_template % frame_index, frame, PNG_WRITE_PARAMS)
+            frames += 1
+        frame_index += 1
+
+    cap.release()
+    return frames, fps
 
 
 def convert_all_playlists(
     on_playlist_progress: ProgressCallback | None = None,
     on_file_progress: ProgressCallback | None = None,
+    sample_every: int = 1,
 ) -> tuple[int, int]:
     """
     Convert all unconverted playlists to PNG frames.
@@ -141,6 +213,7 @@ def convert_all_playlists(
     Args:
         on_playlist_progress: Callback(current_playlist, total_playlists, playlist_name)
         on_file_progress: Callback(current_file, total_files, filename)
+        sample_every: Extract only every Nth frame of each file (1 extracts all frames)
 
     Returns:
         Tuple of (playlists converted, total frames extracted)
@@ -159,6 +232,7 @@ def convert_all_playlists(
         frames = convert_playlist_to_pngs(
             folder_path,
             on_file_progress=on_file_progress,
+            sample_every=sample_every,
         )
         total_frames += frames
 
@@ -7,6 +7,9 @@ class UserFacingError(Exception):
         severity: Either "error" or "info" (default: "error").
     """
 
+    # Store the attributes in slots; BaseException only allocates its instance __dict__ on first use
+    __slots__ = ("title", "message", "severity")
+
     def __init__(self, title: str, message: str, severity: str = "error") -> None:
         super().__init__(message)
         self.title = title
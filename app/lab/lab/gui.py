@@ -1,5 +1,7 @@
 import functools
+import io
 import json
+import os
 import re
 import shutil
 import threading
@@ -7,7 +9,9 @@ import tkinter as tk
 from datetime import date, datetime
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
+from tkinter import font as tkfont
 
+from PIL import Image, ImageTk
 from processor.bird_detector import DEFAULT_DETECTION_PARAMS, BirdDetector
 
 from lab import annotations, evaluation, fine_tune
@@ -18,7 +22,19 @@ from lab.sync import SyncError, SyncManager, remove_hls_files, remove_recording,
 from lab.utils import BIRD_CLASS_TK_COLORS, Region, get_annotated_image_bytes
 
 MIN_SELECTION_SIZE = 100
+# Constant tail of the size line shown while dragging a detection region
+ROI_MIN_SIZE_SUFFIX = f"px (min: {MIN_SELECTION_SIZE}px)"
 MIN_ANNOTATION_SIZE = 10
+# Canvas tags grouping items that are deleted, hidden or raised together with a single canvas call
+ROI_ITEM_TAG = "roi_item"
+CROSSHAIR_TAG = "crosshair"
+DIMENSION_TAG = "dimension"
+# Crosshair redraws are coalesced to at most one per this many milliseconds (~60 Hz)
+CROSSHAIR_INTERVAL_MS = 16
+# Progress bar seeks load at most one frame per this many milliseconds (~30 Hz) while dragging
+SEEK_INTERVAL_MS = 33
+# Sync progress updates are coalesced to at most one redraw per this many milliseconds
+PROGRESS_INTERVAL_MS = 50
 
 
 def get_ordinal_suffix(day: int) -> str:
@@ -85,6 +101,55 @@ def parse_recording_folder_name(folder_name: str) -> tuple[str | None, str | Non
         return None, None
 
 
+def _subdirs(path: str, numeric: bool = False) -> list[os.DirEntry[str]]:
+    """List the subdirectories of path in directory order, optionally only those with numeric names.
+
+    os.scandir entries usually know whether they are directories without an extra stat call.
+    """
+    with os.scandir(path) as entries:
+        return [entry for entry in entries if (not numeric or entry.name.isdigit()) and entry.is_dir()]
+
+
+@functools.lru_cache(maxsize=16)
+def _scan_frame_paths(folder: Path, mtime_ns: int) -> tuple[Path, ...]:
+    """Scan a recording folder for frame PNGs sorted by (segment, frame), cached per folder mtime."""
+    frames: list[tuple[int, int, str]] = []
+
+    # Match each name once (the pattern already requires .png) and only build Paths for the sorted result
+    match_name = IMAGE_FILENAME_PATTERN.fullmatch
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            match = match_name(entry.name)
+            if match:
+                frames.append((int(match.group(2)), int(match.group(3)), entry.name))
+
+    # Sort by segment number, then frame index
+    frames.sort()
+    return tuple(folder / name for _, _, name in frames)
+
+
+@functools.lru_cache(maxsize=16)
+def _decode_frame(path: Path, mtime_ns: int) -> Image.Image:
+    """Decode a PNG frame with Pillow. Touches no Tk state, so neighbouring frames can be decoded ahead off-thread."""
+    with Image.open(path) as image:
+        image.load()
+    return image
+
+
+def _prefetch_frame(path: Path) -> None:
+    """Decode a frame into the cache ahead of navigation; any failure is left for the real load to report."""
+    try:
+        _decode_frame(path, path.stat().st_mtime_ns)
+    except Exception:  # nosec B110
+        pass
+
+
+@functools.lru_cache(maxsize=8)
+def _load_frame_photo(path: Path, mtime_ns: int) -> ImageTk.PhotoImage:
+    """Convert a decoded frame into a Tk image, cached so revisiting recent frames skips the conversion."""
+    return ImageTk.PhotoImage(_decode_frame(path, mtime_ns))
+
+
 class SyncOptionsDialog:
     """Modal dialog for selecting optional date range to filter sync."""
 
@@ -186,6 +251,10 @@ class SyncProgressDialog:
         self._sync_error: str | None = None
         self._confirm_event: threading.Event | None = None
         self._confirm_result: bool = False
+        self._pending_operation: tuple[int, int, str, str] | None = None
+        self._operation_scheduled = False
+        # Cleared when the dialog is destroyed; checked instead of a Tcl round-trip per update
+        self._alive = True
 
         # Create modal dialog
         self.dialog = tk.Toplevel(parent)
@@ -259,21 +328,34 @@ class SyncProgressDialog:
         self._on_cancel()
 
     def update_stream_progress(self, current: int, total: int, stream_name: str) -> None:
-        """Update overall stream progress (thread-safe via parent.after)."""
-        self.parent.after(0, self._do_update_stream, current, total, stream_name)
+        """Update overall stream progress (thread-safe via parent.after_idle)."""
+        self.parent.after_idle(self._do_update_stream, current, total, stream_name)
 
     def _do_update_stream(self, current: int, total: int, stream_name: str) -> None:
-        if self.dialog.winfo_exists():
+        if self._alive:
             self.stream_label.config(text=f"Stream {current}/{total}: {stream_name}")
             self.stream_progress["maximum"] = total
             self.stream_progress["value"] = current
 
     def update_operation_progress(self, current: int, total: int, operation: str, detail: str = "") -> None:
-        """Update current operation progress (thread-safe via parent.after)."""
-        self.parent.after(0, self._do_update_operation, current, total, operation, detail)
+        """Update current operation progress (thread-safe via parent.after).
+
+        Updates are coalesced: only the latest value is kept and at most one redraw is
+        scheduled per PROGRESS_INTERVAL_MS, so fast per-file callbacks cannot flood the Tk event queue.
+        """
+        self._pending_operation = (current, total, operation, detail)
+        if not self._operation_scheduled:
+            self._operation_scheduled = True
+            self.parent.after(PROGRESS_INTERVAL_MS, self._flush_operation)
+
+    def _flush_operation(self) -> None:
+        self._operation_scheduled = False
+        pending = self._pending_operation
+        if pending is not None:
+            self._do_update_operation(*pending)
 
     def _do_update_operation(self, current: int, total: int, operation: str, detail: str) -> None:
-        if self.dialog.winfo_exists():
+        if self._alive:
             self.operation_label.config(text=f"{operation}: {current}/{total}")
             self.operation_progress["maximum"] = total
             self.operation_progress["value"] = current
@@ -281,19 +363,23 @@ class SyncProgressDialog:
                 self.status_label.config(text=detail)
 
     def set_operation_status(self, status: str) -> None:
-        """Set operation status message (thread-safe via parent.after)."""
-        self.parent.after(0, self._do_set_operation_status, status)
+        """Set operation status message (thread-safe via parent.after_idle)."""
+        pending = self._pending_operation
+        if pending is not None:
+            # Keep the pending counts but don't let a stale file name overwrite this status
+            self._pending_operation = (*pending[:3], "")
+        self.parent.after_idle(self._do_set_operation_status, status)
 
     def _do_set_operation_status(self, status: str) -> None:
-        if self.dialog.winfo_exists():
+        if self._alive:
             self.status_label.config(text=status)
 
     def set_no_streams_to_sync(self) -> None:
         """Show message when no streams need syncing."""
-        self.parent.after(0, self._do_set_no_streams)
+        self.parent.after_idle(self._do_set_no_streams)
 
     def _do_set_no_streams(self) -> None:
-        if self.dialog.winfo_exists():
+        if self._alive:
             self.stream_label.config(text="No new streams to sync")
             self.stream_progress["value"] = 0
             self.operation_label.config(text="")
@@ -312,12 +398,12 @@ class SyncProgressDialog:
         """Pause sync and ask user to confirm before proceeding (thread-safe, blocks until user responds)."""
         self._confirm_event = threading.Event()
         self._confirm_result = False
-        self.parent.after(0, self._do_show_confirmation, count, from_date, to_date)
+        self.parent.after_idle(self._do_show_confirmation, count, from_date, to_date)
         self._confirm_event.wait()
         return self._confirm_result
 
     def _do_show_confirmation(self, count: int, from_date: date | None, to_date: date | None) -> None:
-        if not self.dialog.winfo_exists():
+        if not self._alive:
             if self._confirm_event:
                 self._confirm_event.set()
             return
@@ -350,10 +436,11 @@ class SyncProgressDialog:
 
     def close(self) -> None:
         """Close the dialog (thread-safe)."""
-        self.parent.after(0, self._do_close)
+        self.parent.after_idle(self._do_close)
 
     def _do_close(self) -> None:
-        if self.dialog.winfo_exists():
+        if self._alive:
+            self._alive = False
             self.dialog.grab_release()
             self.dialog.destroy()
 
@@ -371,15 +458,20 @@ def handle_user_error(method):
         try:
             return method(*args, **kwargs)
         except UserFacingError as exc:
-            if exc.severity == "info":
-                messagebox.showinfo(exc.title, exc.message)
-            else:
-                messagebox.showerror(exc.title, exc.message)
+            show_user_error(exc)
             return None
 
     return wrapper
 
 
+def show_user_error(exc: UserFacingError) -> None:
+    """Display a UserFacingError in an info or error popup, depending on its severity."""
+    if exc.severity == "info":
+        messagebox.showinfo(exc.title, exc.message)
+    else:
+        messagebox.showerror(exc.title, exc.message)
+
+
 def show_copyable_error(parent: tk.Misc, title: str, message: str) -> None:
     """Show an error dialog with selectable/copyable message text."""
     dialog = tk.Toplevel(parent)
@@ -802,9 +894,11 @@ class LabGUI:
     """Tkinter GUI for selecting PNGs in a storage directory and running detection."""
 
     def __init__(self) -> None:
-        # Initialize detector with default settings
+        # The detector is loaded in the background once the main loop is running, so the window paints first
         self.__selected_model_info: dict | None = None
-        self._init_detector()
+        self.detector: BirdDetector | None = None
+        self.__detector_thread: threading.Thread | None = None
+        self.__detector_error: UserFacingError | None = None  # Why the background load failed, if it did
 
         # Root
         self.root = tk.Tk()
@@ -813,24 +907,37 @@ class LabGUI:
 
         # State
         self.__selected_image: Path | None = None
-        self.__image_obj: tk.PhotoImage | None = None
+        self.__image_obj: ImageTk.PhotoImage | None = None
+        self.__image_size: tuple[int, int] = (0, 0)  # (width, height) of __image_obj, cached to avoid Tcl calls
+        self.__detection_shown = False  # True while __image_obj is an annotated detection result
+
+        # Background detection state (see detect_bird)
+        self.__detect_thread: threading.Thread | None = None
+        self.__detect_image: Path | None = None
         self.__selected_image_text = tk.StringVar(value="No file selected")
 
         # Selection state for regions of interest (supports multiple regions)
         self.__selection_start: tuple[int, int] | None = None
         self.__current_rect: int | None = None  # Canvas rectangle ID being drawn
-        self.__selection_rects: list[int] = []  # Canvas rectangle IDs for finalized selections
-        self.__selection_texts: list[int] = []  # Canvas text IDs for finalized ROI labels
-        self.__selection_bgs: list[int] = []  # Canvas rectangle IDs for finalized ROI label backgrounds
+        self.__drag_corner: tuple[int, int] | None = None  # Last corner drawn, to skip drags that change nothing
+        # Finalized selection rectangles and ROI labels are only tracked on the canvas, via ROI_ITEM_TAG
         self.__selection_regions: list[tuple[int, int, int, int]] = []  # List of (x1, y1, x2, y2)
+        # True while the canvas ROI items are exactly the drawn selection regions, so frame changes can keep them
+        self.__selections_drawn = True
 
-        # Crosshair lines for selection guidance
-        self.__crosshair_h: int | None = None  # Horizontal line ID
-        self.__crosshair_v: int | None = None  # Vertical line ID
+        # Crosshair for selection guidance: one polyline tracing both the horizontal and vertical line
+        self.__crosshair: int | None = None  # Canvas line ID
+        self.__crosshair_visible: bool = False  # The line is created once, then hidden/shown
+        self.__pending_crosshair: tuple[int, int] | None = None  # Latest cursor position not yet drawn
+        self.__crosshair_after_id: str | None = None  # Scheduled crosshair redraw
 
         # Dimension label shown while drawing selection
         self.__dimension_text: int | None = None  # Canvas text ID
         self.__dimension_bg: int | None = None  # Canvas rectangle ID for text background
+        self.__dimension_visible: bool = False  # Label items are created once, then hidden/shown
+        # Font of ROI labels, measured up front so the label background can be sized without a bbox query
+        self.__roi_font = tkfont.Font(root=self.root, family="TkDefaultFont", size=10, weight="bold")
+        self.__roi_line_height: int = self.__roi_font.metrics("linespace")
 
         # Annotation mode state
         self.__annotation_mode: bool = False
@@ -843,7 +950,10 @@ class LabGUI:
         self.__all_recordings: list[Path] = []  # All recordings sorted by date
         self.__frame_files: list[Path] = []  # All PNG files in current recording, sorted
         self.__current_frame_index: int = 0  # Index into frame_files
+        self.__prefetch_thread: threading.Thread | None = None  # Decodes the frame one more navigation step ahead
         self.__fps: int = 0  # Frames per second (read from stream_info.json or calculated from first segment)
+        self.__pending_seek_index: int = 0  # Latest progress bar position not yet loaded
+        self.__seek_after_id: str | None = None  # Scheduled seek load
 
         # UI components
         self.button_frame = tk.Frame(self.root)
@@ -957,37 +1067,18 @@ class LabGUI:
         # Navigation frame (hidden until recording is loaded)
         self.nav_frame = tk.Frame(self.root)
 
-        # Recording navigation buttons
-        self.prev_rec_btn = tk.Button(self.nav_frame, text="< Prev recording", command=self.prev_recording)
-        self.prev_rec_btn.pack(side="left", padx=(0, 8))
-
-        # Frame navigation buttons
-        self.nav_minus_5s_btn = tk.Button(self.nav_frame, text="-5s", command=lambda: self.navigate_seconds(-5))
-        self.nav_minus_5s_btn.pack(side="left", padx=(0, 2))
-
-        self.nav_minus_1s_btn = tk.Button(self.nav_frame, text="-1s", command=lambda: self.navigate_seconds(-1))
-        self.nav_minus_1s_btn.pack(side="left", padx=(0, 2))
-
-        self.nav_minus_5f_btn = tk.Button(self.nav_frame, text="-5f", command=lambda: self.navigate_frames(-5))
-        self.nav_minus_5f_btn.pack(side="left", padx=(0, 2))
-
-        self.nav_minus_1f_btn = tk.Button(self.nav_frame, text="-1f", command=lambda: self.navigate_frames(-1))
-        self.nav_minus_1f_btn.pack(side="left", padx=(0, 8))
-
-        self.nav_plus_1f_btn = tk.Button(self.nav_frame, text="+1f", command=lambda: self.navigate_frames(1))
-        self.nav_plus_1f_btn.pack(side="left", padx=(0, 2))
-
-        self.nav_plus_5f_btn = tk.Button(self.nav_frame, text="+5f", command=lambda: self.navigate_frames(5))
-        self.nav_plus_5f_btn.pack(side="left", padx=(0, 2))
-
-        self.nav_plus_1s_btn = tk.Button(self.nav_frame, text="+1s", command=lambda: self.navigate_seconds(1))
-        self.nav_plus_1s_btn.pack(side="left", padx=(0, 2))
-
-        self.nav_plus_5s_btn = tk.Button(self.nav_frame, text="+5s", command=lambda: self.navigate_seconds(5))
-        self.nav_plus_5s_btn.pack(side="left", padx=(0, 8))
-
-        self.next_rec_btn = tk.Button(self.nav_frame, text="Next recording >", command=self.next_recording)
-        self.next_rec_btn.pack(side="left")
+        # Navigation buttons; _apply_mode packs them from the widget registry, so none are packed here
+        nav_button = functools.partial(tk.Button, self.nav_frame)
+        self.prev_rec_btn = nav_button(text="< Prev recording", command=self.prev_recording)
+        self.nav_minus_5s_btn = nav_button(text="-5s", command=functools.partial(self.navigate_seconds, -5))
+        self.nav_minus_1s_btn = nav_button(text="-1s", command=functools.partial(self.navigate_seconds, -1))
+        self.nav_minus_5f_btn = nav_button(text="-5f", command=functools.partial(self.navigate_frames, -5))
+        self.nav_minus_1f_btn = nav_button(text="-1f", command=functools.partial(self.navigate_frames, -1))
+        self.nav_plus_1f_btn = nav_button(text="+1f", command=functools.partial(self.navigate_frames, 1))
+        self.nav_plus_5f_btn = nav_button(text="+5f", command=functools.partial(self.navigate_frames, 5))
+        self.nav_plus_1s_btn = nav_button(text="+1s", command=functools.partial(self.navigate_seconds, 1))
+        self.nav_plus_5s_btn = nav_button(text="+5s", command=functools.partial(self.navigate_seconds, 5))
+        self.next_rec_btn = nav_button(text="Next recording >", command=self.next_recording)
 
         # Canvas for image preview with selection support
         self.image_canvas = tk.Canvas(self.root, highlightthickness=0)
@@ -1120,6 +1211,8 @@ class LabGUI:
 
         # Update stats on initialization
         self.root.after(100, self._update_stats_display)
+        # Load the detector model with default settings after the first paint
+        self.root.after_idle(self._warm_up_detector)
 
         # Apply initial mode
         self._apply_mode()
@@ -1133,8 +1226,12 @@ class LabGUI:
         return Path(path) if path else None
 
     def set_selected_image(self, path: Path) -> None:
-        self.__selected_image = path.resolve()
-        self.__selected_image_text.set(str(self.__selected_image))
+        # Frame paths are scanned from an already resolved recording folder, so no per-frame resolve()
+        if path == self.__selected_image:
+            # Reloading the same frame; skip the StringVar write and the label update it triggers
+            return
+        self.__selected_image = path
+        self.__selected_image_text.set(str(path))
 
     def scan_recording_frames(self, folder: Path) -> list[Path]:
         """
@@ -1142,18 +1239,8 @@ class LabGUI:
 
         Returns list of Path objects sorted by (segment_number, frame_index).
         """
-        frames: list[tuple[int, int, Path]] = []
-
-        for png_file in folder.glob("*.png"):
-            match = IMAGE_FILENAME_PATTERN.match(png_file.name)
-            if match:
-                segment = int(match.group(2))
-                frame_idx = int(match.group(3))
-                frames.append((segment, frame_idx, png_file))
-
-        # Sort by segment number, then frame index
-        frames.sort(key=lambda x: (x[0], x[1]))
-        return [f[2] for f in frames]
+        # Adding or removing frames changes the folder mtime, so revisiting an unchanged recording skips the scan
+        return list(_scan_frame_paths(folder, folder.stat().st_mtime_ns))
 
     def _calculate_fps(self) -> int:
         """Return actual FPS for the current recording.
@@ -1187,24 +1274,17 @@ class LabGUI:
         recordings: list[Path] = []
 
         # Walk the nested structure: year/month/day/folder
-        for year_dir in sorted(IMAGES_DIR.iterdir()):
-            if not year_dir.is_dir() or not year_dir.name.isdigit():
-                continue
-
-            for month_dir in sorted(year_dir.iterdir()):
-                if not month_dir.is_dir() or not month_dir.name.isdigit():
-                    continue
-
-                for day_dir in sorted(month_dir.iterdir()):
-                    if not day_dir.is_dir() or not day_dir.name.isdigit():
-                        continue
-
-                    for folder in sorted(day_dir.iterdir()):
-                        if folder.is_dir():
-                            # Check if it has PNG files
-                            if any(folder.glob("*.png")):
-                                recordings.append(folder)
-
+        for year_dir in _subdirs(str(IMAGES_DIR), numeric=True):
+            for month_dir in _subdirs(year_dir.path, numeric=True):
+                for day_dir in _subdirs(month_dir.path, numeric=True):
+                    for folder in _subdirs(day_dir.path):
+                        # Check if it has PNG files, stopping at the first one
+                        with os.scandir(folder.path) as entries:
+                            if any(entry.name.endswith(".png") and entry.is_file() for entry in entries):
+                                recordings.append(Path(folder.path))
+
+        # Paths compare part by part, so one sort gives the same year/month/day/folder order as sorting each level
+        recordings.sort()
         return recordings
 
     def show_annotation_status(self) -> None:
@@ -1313,41 +1393,43 @@ class LabGUI:
         self.progress_bar.set(current)
 
     def _on_progress_seek(self, value: str) -> None:
-        """Handle progress bar seek."""
+        """Handle progress bar seek, loading only the latest position once per SEEK_INTERVAL_MS."""
         if not self.__frame_files:
             return
-        new_index = int(float(value))
-        if new_index != self.__current_frame_index:
-            self.load_frame(new_index)
+        self.__pending_seek_index = int(float(value))
+        if self.__seek_after_id is None:
+            self.__seek_after_id = self.root.after(SEEK_INTERVAL_MS, self._commit_seek)
+
+    def _commit_seek(self) -> None:
+        """Load the frame at the latest position the progress bar was dragged to."""
+        self.__seek_after_id = None
+        if self.__frame_files and self.__pending_seek_index != self.__current_frame_index:
+            self.load_frame(self.__pending_seek_index)
+
+    def _open_frame_image(self, path: Path) -> ImageTk.PhotoImage:
+        """Return the Tk image of a frame PNG, reusing a recent decode if the file hasn't changed."""
+        return _load_frame_photo(path, path.stat().st_mtime_ns)
+
+    def _set_image(self, image: ImageTk.PhotoImage | None) -> None:
+        """Set the displayed image, caching its size so event handlers don't query Tk for it."""
+        self.__image_obj = image
+        self.__image_size = (image.width(), image.height()) if image is not None else (0, 0)
+        self.__detection_shown = False
 
     def set_image_preview(self) -> None:
         if self.__image_obj is None:
             return
         # Resize canvas to match image
-        width = self.__image_obj.width()
-        height = self.__image_obj.height()
+        width, height = self.__image_size
         self.image_canvas.config(width=width, height=height)
 
-        # Clear previous image only
         if self.__canvas_image_id is not None:
-            self.image_canvas.delete(self.__canvas_image_id)
-
-        # Draw image on canvas
-        self.__canvas_image_id = self.image_canvas.create_image(0, 0, anchor="nw", image=self.__image_obj)
-
-        # Raise selection rectangles, ROI backgrounds and texts above the image so they remain visible
-        for rect_id in self.__selection_rects:
-            self.image_canvas.tag_raise(rect_id)
-        for bg_id in self.__selection_bgs:
-            self.image_canvas.tag_raise(bg_id)
-        for text_id in self.__selection_texts:
-            self.image_canvas.tag_raise(text_id)
-        if self.__current_rect is not None:
-            self.image_canvas.tag_raise(self.__current_rect)
-        if self.__dimension_bg is not None:
-            self.image_canvas.tag_raise(self.__dimension_bg)
-        if self.__dimension_text is not None:
-            self.image_canvas.tag_raise(self.__dimension_text)
+            # Swap the picture on the existing item; it keeps its place below every overlay
+            self.image_canvas.itemconfigure(self.__canvas_image_id, image=self.__image_obj)
+        else:
+            # Draw image on canvas and lower it once beneath any selections, labels and crosshairs
+            self.__canvas_image_id = self.image_canvas.create_image(0, 0, anchor="nw", image=self.__image_obj)
+            self.image_canvas.tag_lower(self.__canvas_image_id)
 
     def show_clear_button(self) -> None:
         if not self.clear_btn.winfo_ismapped():
@@ -1383,9 +1465,10 @@ class LabGUI:
         if self.__image_obj is None:
             return
         self.__selection_start = (event.x, event.y)
+        self.__drag_corner = None
         color = "green" if self.__annotation_mode else "blue"
         self.__current_rect = self.image_canvas.create_rectangle(
-            event.x, event.y, event.x, event.y, outline=color, width=2
+            event.x, event.y, event.x, event.y, outline=color, width=2, tags=ROI_ITEM_TAG
         )
 
     def on_selection_drag(self, event) -> None:
@@ -1396,12 +1479,12 @@ class LabGUI:
         x2, y2 = event.x, event.y
 
         if not self.__annotation_mode:
-            # Constrain to square: use the larger dimension for both
-            dx = x2 - x1
-            dy = y2 - y1
-            side = max(abs(dx), abs(dy))
-            x2 = x1 + side * (1 if dx >= 0 else -1)
-            y2 = y1 + side * (1 if dy >= 0 else -1)
+            x2, y2 = self._square_clamp(x1, y1, x2, y2)
+
+        # Moving along the shorter side of a square selection often leaves it unchanged; skip those redraws
+        if (x2, y2) == self.__drag_corner:
+            return
+        self.__drag_corner = (x2, y2)
 
         self.image_canvas.coords(self.__current_rect, x1, y1, x2, y2)
 
@@ -1409,24 +1492,25 @@ class LabGUI:
         if self.__annotation_mode:
             return
 
-        # Calculate normalized ROI coordinates
-        roi_x1, roi_x2 = min(x1, x2), max(x1, x2)
-        roi_y1, roi_y2 = min(y1, y2), max(y1, y2)
+        # Calculate normalized ROI coordinates (one comparison per axis instead of a min() and a max() call)
+        roi_x1, roi_x2 = (x1, x2) if x1 <= x2 else (x2, x1)
+        roi_y1, roi_y2 = (y1, y2) if y1 <= y2 else (y2, y1)
         # Position text at the top-left corner of the rectangle
         text_x = roi_x1 + 4
         text_y = roi_y1 + 4
-        side = max(abs(x2 - x1), abs(y2 - y1))
-        roi_str = f"ROI: ({roi_x1}, {roi_y1}, {roi_x2}, {roi_y2})\nSize: {side}px (min: {MIN_SELECTION_SIZE}px)"
+        # Detection selections are already constrained to a square
+        side = roi_x2 - roi_x1
+        roi_line = f"ROI: ({roi_x1}, {roi_y1}, {roi_x2}, {roi_y2})"
+        size_line = f"Size: {side}{ROI_MIN_SIZE_SUFFIX}"
+        roi_str = f"{roi_line}\n{size_line}"
+
+        # Background sized from the font metrics, so dragging never forces a canvas bbox query
+        bg_coords = self._roi_label_background(text_x, text_y, roi_line, size_line)
 
-        if self.__dimension_text is None:
-            # Create background rectangle first (so it's behind text)
+        if self.__dimension_text is None or self.__dimension_bg is None:
+            # Create background rectangle first (so it's behind text); both items are reused for later drags
             self.__dimension_bg = self.image_canvas.create_rectangle(
-                text_x - 2,
-                text_y - 2,
-                text_x + 2,
-                text_y + 2,
-                fill="white",
-                outline="",
+                *bg_coords, fill="white", outline="", tags=DIMENSION_TAG
             )
             self.__dimension_text = self.image_canvas.create_text(
                 text_x,
@@ -1434,19 +1518,32 @@ class LabGUI:
                 text=roi_str,
                 anchor="nw",
                 fill="blue",
-                font=("TkDefaultFont", 10, "bold"),
+                font=self.__roi_font,
+                tags=DIMENSION_TAG,
             )
-            # Update background to match text size
-            bbox = self.image_canvas.bbox(self.__dimension_text)
-            if bbox:
-                self.image_canvas.coords(self.__dimension_bg, bbox[0] - 2, bbox[1] - 2, bbox[2] + 2, bbox[3] + 2)
         else:
             self.image_canvas.coords(self.__dimension_text, text_x, text_y)
             self.image_canvas.itemconfig(self.__dimension_text, text=roi_str)
-            # Update background position and size
-            bbox = self.image_canvas.bbox(self.__dimension_text)
-            if bbox and self.__dimension_bg is not None:
-                self.image_canvas.coords(self.__dimension_bg, bbox[0] - 2, bbox[1] - 2, bbox[2] + 2, bbox[3] + 2)
+            self.image_canvas.coords(self.__dimension_bg, *bg_coords)
+            if not self.__dimension_visible:
+                # Show again above the rectangle being drawn
+                self.image_canvas.itemconfigure(DIMENSION_TAG, state="normal")
+                self.image_canvas.tag_raise(DIMENSION_TAG)
+        self.__dimension_visible = True
+
+    @staticmethod
+    def _square_clamp(x1: int, y1: int, x2: int, y2: int) -> tuple[int, int]:
+        """Constrain the corner (x2, y2) so the selection from (x1, y1) is a square of the larger dimension."""
+        dx = x2 - x1
+        dy = y2 - y1
+        side = max(abs(dx), abs(dy))
+        return (x1 + side if dx >= 0 else x1 - side), (y1 + side if dy >= 0 else y1 - side)
+
+    def _roi_label_background(self, text_x: int, text_y: int, *lines: str) -> tuple[int, int, int, int]:
+        """Return the coordinates of the white background behind ROI label lines anchored at (text_x, text_y)."""
+        width = max(self.__roi_font.measure(line) for line in lines)
+        height = self.__roi_line_height * len(lines)
+        return text_x - 2, text_y - 2, text_x + width + 2, text_y + height + 2
 
     def on_selection_end(self, event) -> None:
         """Finalize selection rectangle and add to the list of regions."""
@@ -1457,20 +1554,14 @@ class LabGUI:
         x2, y2 = event.x, event.y
 
         if not self.__annotation_mode:
-            # Constrain to square: use the larger dimension for both
-            dx = x2 - x1
-            dy = y2 - y1
-            side = max(abs(dx), abs(dy))
-            x2 = x1 + side * (1 if dx >= 0 else -1)
-            y2 = y1 + side * (1 if dy >= 0 else -1)
+            x2, y2 = self._square_clamp(x1, y1, x2, y2)
 
         # Normalize coordinates (ensure x1 < x2, y1 < y2)
         x1, x2 = min(x1, x2), max(x1, x2)
         y1, y2 = min(y1, y2), max(y1, y2)
 
         # Clamp to image bounds
-        img_width = self.__image_obj.width()
-        img_height = self.__image_obj.height()
+        img_width, img_height = self.__image_size
         x1 = max(0, min(x1, img_width))
         x2 = max(0, min(x2, img_width))
         y1 = max(0, min(y1, img_height))
@@ -1505,28 +1596,17 @@ class LabGUI:
                     annotations.AVAILABLE_CLASSES[0][1],
                 )
                 self.__annotation_items.append({"class_id": class_id, "x1": x1, "y1": y1, "x2": x2, "y2": y2})
-                self.__selection_rects.append(self.__current_rect)
+                self.__selections_drawn = False
                 self.__current_rect = None
                 self.hide_dimension_text()
                 idx = len(self.__annotation_items) - 1
                 self._add_annotation_row(idx)
             else:
                 self.__selection_regions.append((x1, y1, x2, y2))
-                self.__selection_rects.append(self.__current_rect)
                 self.__current_rect = None
-                if self.__dimension_text is not None:
-                    roi_str = f"ROI: ({x1}, {y1}, {x2}, {y2})\nSize: {size_label}"
-                    self.image_canvas.itemconfig(self.__dimension_text, text=roi_str)
-                    self.image_canvas.coords(self.__dimension_text, x1 + 4, y1 + 4)
-                    bbox = self.image_canvas.bbox(self.__dimension_text)
-                    if bbox and self.__dimension_bg is not None:
-                        self.image_canvas.coords(
-                            self.__dimension_bg, bbox[0] - 2, bbox[1] - 2, bbox[2] + 2, bbox[3] + 2
-                        )
-                        self.__selection_bgs.append(self.__dimension_bg)
-                        self.__dimension_bg = None
-                    self.__selection_texts.append(self.__dimension_text)
-                    self.__dimension_text = None
+                # Replace the reusable drag label with a permanent ROI label
+                self.hide_dimension_text()
+                self._draw_roi_label(x1, y1, f"ROI: ({x1}, {y1}, {x2}, {y2})\nSize: {size_label}")
                 self.show_clear_button()
         else:
             # Too small, delete the rectangle and text, show error
@@ -1539,13 +1619,10 @@ class LabGUI:
         self.__selection_start = None
 
     def hide_dimension_text(self) -> None:
-        """Remove the dimension text and background from the canvas."""
-        if self.__dimension_bg is not None:
-            self.image_canvas.delete(self.__dimension_bg)
-            self.__dimension_bg = None
-        if self.__dimension_text is not None:
-            self.image_canvas.delete(self.__dimension_text)
-            self.__dimension_text = None
+        """Hide the dimension text and background, keeping them for the next drag."""
+        if self.__dimension_visible:
+            self.image_canvas.itemconfigure(DIMENSION_TAG, state="hidden")
+            self.__dimension_visible = False
 
     def on_mouse_move(self, event) -> None:
         """Update crosshair lines to follow the mouse cursor."""
@@ -1556,8 +1633,7 @@ class LabGUI:
             self.hide_crosshairs()
             return
 
-        width = self.__image_obj.width()
-        height = self.__image_obj.height()
+        width, height = self.__image_size
         x, y = event.x, event.y
 
         # Only show crosshairs when cursor is within image bounds
@@ -1565,19 +1641,34 @@ class LabGUI:
             self.hide_crosshairs()
             return
 
-        # Create or update horizontal line
-        if self.__crosshair_h is None:
-            self.__crosshair_h = self.image_canvas.create_line(0, y, width, y, fill="blue", width=1, stipple="gray50")
-        else:
-            self.image_canvas.coords(self.__crosshair_h, 0, y, width, y)
-            self.image_canvas.tag_raise(self.__crosshair_h)
+        # Coalesce motion events: remember the latest position and redraw at most once per interval
+        self.__pending_crosshair = (x, y)
+        if self.__crosshair_after_id is None:
+            self.__crosshair_after_id = self.root.after(CROSSHAIR_INTERVAL_MS, self._flush_crosshair)
 
-        # Create or update vertical line
-        if self.__crosshair_v is None:
-            self.__crosshair_v = self.image_canvas.create_line(x, 0, x, height, fill="blue", width=1, stipple="gray50")
+    def _flush_crosshair(self) -> None:
+        """Draw the crosshair at the latest cursor position recorded by on_mouse_move."""
+        self.__crosshair_after_id = None
+        if self.__pending_crosshair is None or self.__image_obj is None:
+            return
+        x, y = self.__pending_crosshair
+        self.__pending_crosshair = None
+        width, height = self.__image_size
+
+        # Full-width horizontal line, back to the cursor, then the full-height vertical line
+        coords = [0, y, width, y, x, y, x, 0, x, height]
+        if self.__crosshair is None:
+            self.__crosshair = self.image_canvas.create_line(
+                coords, fill="blue", width=1, stipple="gray50", tags=CROSSHAIR_TAG
+            )
         else:
-            self.image_canvas.coords(self.__crosshair_v, x, 0, x, height)
-            self.image_canvas.tag_raise(self.__crosshair_v)
+            self.image_canvas.coords(self.__crosshair, coords)
+
+        if not self.__crosshair_visible:
+            self.image_canvas.itemconfigure(CROSSHAIR_TAG, state="normal")
+            # ROI items drawn while it was hidden would otherwise cover it
+            self.image_canvas.tag_raise(CROSSHAIR_TAG)
+            self.__crosshair_visible = True
 
     def on_mouse_leave(self, event) -> None:
         """Hide crosshairs when mouse leaves the canvas."""
@@ -1585,35 +1676,26 @@ class LabGUI:
 
     def hide_crosshairs(self) -> None:
         """Remove crosshair lines from the canvas."""
-        if self.__crosshair_h is not None:
-            self.image_canvas.delete(self.__crosshair_h)
-            self.__crosshair_h = None
-        if self.__crosshair_v is not None:
-            self.image_canvas.delete(self.__crosshair_v)
-            self.__crosshair_v = None
+        self.__pending_crosshair = None
+        if self.__crosshair_after_id is not None:
+            self.root.after_cancel(self.__crosshair_after_id)
+            self.__crosshair_after_id = None
+        if self.__crosshair_visible:
+            # Hide rather than delete, so the lines are reused when the cursor comes back
+            self.image_canvas.itemconfigure(CROSSHAIR_TAG, state="hidden")
+            self.__crosshair_visible = False
 
     def clear_all(self) -> None:
         """Clear all selection regions and reset image to remove detection rectangles."""
         # Clear selection rectangles
-        if self.__current_rect is not None:
-            self.image_canvas.delete(self.__current_rect)
-            self.__current_rect = None
-        for rect_id in self.__selection_rects:
-            self.image_canvas.delete(rect_id)
-        self.__selection_rects.clear()
-        for bg_id in self.__selection_bgs:
-            self.image_canvas.delete(bg_id)
-        self.__selection_bgs.clear()
-        for text_id in self.__selection_texts:
-            self.image_canvas.delete(text_id)
-        self.__selection_texts.clear()
+        self._delete_roi_items()
         self.__selection_regions.clear()
+        self.__selections_drawn = True
         self.__selection_start = None
-        self.hide_dimension_text()
 
         # Reset to original image to clear detection rectangles
         if self.__selected_image is not None:
-            self.__image_obj = tk.PhotoImage(file=self.__selected_image)
+            self._set_image(self._open_frame_image(self.__selected_image))
             self.set_image_preview()
 
         self._hide_legend()
@@ -1621,57 +1703,52 @@ class LabGUI:
 
     def clear_canvas_elements(self) -> None:
         """Clear all canvas elements but preserve selection regions data."""
-        if self.__current_rect is not None:
-            self.image_canvas.delete(self.__current_rect)
-            self.__current_rect = None
-        for rect_id in self.__selection_rects:
-            self.image_canvas.delete(rect_id)
-        self.__selection_rects.clear()
-        for bg_id in self.__selection_bgs:
-            self.image_canvas.delete(bg_id)
-        self.__selection_bgs.clear()
-        for text_id in self.__selection_texts:
-            self.image_canvas.delete(text_id)
-        self.__selection_texts.clear()
+        self._delete_roi_items()
         self.__selection_start = None
+
+    def _delete_roi_items(self) -> None:
+        """Delete every selection rectangle and ROI label with a single tagged delete, and hide the drag label."""
+        self.image_canvas.delete(ROI_ITEM_TAG)
+        self.__current_rect = None
+        self.__selections_drawn = False
         self.hide_dimension_text()
 
     def redraw_selections(self) -> None:
         """Redraw selection rectangles and labels from saved regions."""
         for x1, y1, x2, y2 in self.__selection_regions:
             # Draw selection rectangle
-            rect_id = self.image_canvas.create_rectangle(x1, y1, x2, y2, outline="blue", width=2)
-            self.__selection_rects.append(rect_id)
+            self.image_canvas.create_rectangle(x1, y1, x2, y2, outline="blue", width=2, tags=ROI_ITEM_TAG)
 
-            # Draw background for label
             side = x2 - x1
-            roi_str = f"ROI: ({x1}, {y1}, {x2}, {y2})\nSize: {side}px"
-            text_id = self.image_canvas.create_text(
-                x1 + 4,
-                y1 + 4,
-                text=roi_str,
-                anchor="nw",
-                fill="blue",
-                font=("TkDefaultFont", 10, "bold"),
-            )
-            bbox = self.image_canvas.bbox(text_id)
-            if bbox:
-                bg_id = self.image_canvas.create_rectangle(
-                    bbox[0] - 2,
-                    bbox[1] - 2,
-                    bbox[2] + 2,
-                    bbox[3] + 2,
-                    fill="white",
-                    outline="",
-                )
-                # Move background behind text
-                self.image_canvas.tag_lower(bg_id, text_id)
-                self.__selection_bgs.append(bg_id)
-            self.__selection_texts.append(text_id)
+            self._draw_roi_label(x1, y1, f"ROI: ({x1}, {y1}, {x2}, {y2})\nSize: {side}px")
+
+        # Keep the crosshair above the new items
+        self.image_canvas.tag_raise(CROSSHAIR_TAG)
+        self.__selections_drawn = True
 
         if self.__selection_regions:
             self.show_clear_button()
 
+    def _draw_roi_label(self, x1: int, y1: int, roi_str: str) -> None:
+        """Draw a finalized ROI label with a white background at the top-left corner of a region."""
+        text_x, text_y = x1 + 4, y1 + 4
+        # Draw background first so it stays behind the text
+        self.image_canvas.create_rectangle(
+            *self._roi_label_background(text_x, text_y, *roi_str.split("\n")),
+            fill="white",
+            outline="",
+            tags=ROI_ITEM_TAG,
+        )
+        self.image_canvas.create_text(
+            text_x,
+            text_y,
+            text=roi_str,
+            anchor="nw",
+            fill="blue",
+            font=self.__roi_font,
+            tags=ROI_ITEM_TAG,
+        )
+
     @handle_user_error
     def choose_recording(self) -> None:
         """Open a folder dialog and load the first frame from the selected recording."""
@@ -1679,14 +1756,15 @@ class LabGUI:
         if folder is None:
             return
 
-        # Scan for frame files
+        # Scan for frame files once per recording; frame navigation only indexes into this list
+        folder = folder.resolve()
         frames = self.scan_recording_frames(folder)
         if not frames:
             messagebox.showerror("Invalid Recording", "No valid PNG frames found in the selected folder.")
             return
 
         # Update recording state
-        self.__current_recording = folder.resolve()
+        self.__current_recording = folder
         self.__frame_files = frames
         self.__current_frame_index = 0
         self.__fps = self._calculate_fps()
@@ -1714,18 +1792,29 @@ class LabGUI:
         # Clamp index to valid range
         index = max(0, min(index, len(self.__frame_files) - 1))
 
-        # Update current frame index
+        # Update current frame index, remembering the stride so repeated steps (1f, 5f, 1s, 5s) can be prefetched
+        stride = (index - self.__current_frame_index) or 1
         self.__current_frame_index = index
 
         # Load the frame
         frame_path = self.__frame_files[index]
         self.set_selected_image(frame_path)
-        self.__image_obj = tk.PhotoImage(file=frame_path)
+        self._set_image(self._open_frame_image(frame_path))
 
-        # Clear canvas elements
-        self.clear_canvas_elements()
+        # Detection ROIs already on the canvas stay as they are; only the image underneath them is swapped
+        keep_selections = not self.__annotation_mode and self.__selections_drawn
+        if keep_selections:
+            # Only drop a selection that was still being dragged
+            if self.__current_rect is not None:
+                self.image_canvas.delete(self.__current_rect)
+                self.__current_rect = None
+            self.__selection_start = None
+            self.hide_dimension_text()
+        else:
+            self.clear_canvas_elements()
         self._hide_legend()
-        self.hide_clear_button()
+        if not (keep_selections and self.__selection_regions):
+            self.hide_clear_button()
         self.set_image_preview()
 
         if self.__annotation_mode:
@@ -1733,7 +1822,7 @@ class LabGUI:
             self.__annotation_items.clear()
             self._clear_annotation_list_ui()
             self._load_frame_annotations()
-        else:
+        elif not keep_selections:
             # Redraw selections on the new image (detection ROIs)
             self.redraw_selections()
 
@@ -1743,6 +1832,20 @@ class LabGUI:
         # Update annotation status label
         self.update_annotation_status()
 
+        self._prefetch_neighbour(index + stride)
+
+    def _prefetch_neighbour(self, index: int) -> None:
+        """Decode the frame at index in the background so the next navigation step only converts it for Tk."""
+        if not 0 <= index < len(self.__frame_files):
+            return
+        # Skip while a previous prefetch is still decoding rather than queueing up threads during fast scrubbing
+        if self.__prefetch_thread is not None and self.__prefetch_thread.is_alive():
+            return
+        self.__prefetch_thread = threading.Thread(
+            target=_prefetch_frame, args=(self.__frame_files[index],), daemon=True
+        )
+        self.__prefetch_thread.start()
+
     def navigate_frames(self, delta: int) -> None:
         """Navigate by a number of frames (positive or negative)."""
         if not self.__frame_files:
@@ -1814,11 +1917,12 @@ class LabGUI:
 
     def _load_recording(self, folder: Path) -> None:
         """Load a recording folder and show its first frame."""
+        folder = folder.resolve()
         frames = self.scan_recording_frames(folder)
         if not frames:
             return
 
-        self.__current_recording = folder.resolve()
+        self.__current_recording = folder
         self.__frame_files = frames
         self.__current_frame_index = 0
         self.__fps = self._calculate_fps()
@@ -1831,26 +1935,83 @@ class LabGUI:
 
         self._apply_mode()
 
-    @handle_user_error
     def detect_bird(self) -> None:
-        # Reset to original image first (clears any previous detection rectangles)
-        self.__image_obj = tk.PhotoImage(file=self.__selected_image)
-        self.set_image_preview()
+        """Run detection on the selected frame in a background thread, keeping the UI responsive."""
+        if self.__detect_thread is not None and self.__detect_thread.is_alive():
+            return
+        if self.__selected_image is None:
+            show_user_error(UserFacingError("No image selected", "Please select an image first."))
+            return
+        if self.detector is None:
+            if self.__detector_error is not None:
+                show_user_error(self.__detector_error)
+            else:
+                show_user_error(UserFacingError("Loading", "The detector is still loading, please try again.", "info"))
+            return
+
+        # Reset to original image first, but only if a previous detection result is on display
+        if self.__detection_shown:
+            self._set_image(self._open_frame_image(self.__selected_image))
+            self.set_image_preview()
 
-        regions = [Region(*coords) for coords in self.__selection_regions] if self.__selection_regions else None
+        # Read everything Tk-related here; the background thread must not touch widgets or variables
+        regions = list(map(Region._make, self.__selection_regions)) if self.__selection_regions else None
+        params = {"conf": self.conf_var.get(), "imgsz": self.imgsz_var.get(), "iou": self.iou_var.get()}
+        self.__detect_image = self.__selected_image
+        self.__detect_result: tuple[Image.Image, set[int]] | None = None
+        self.__detect_error: UserFacingError | None = None
+
+        self.detect_btn.config(state="disabled", text="Detecting...")
+        self.__detect_thread = threading.Thread(
+            target=self._run_detection, args=(self.detector, regions, params), daemon=True
+        )
+        self.__detect_thread.start()
+
+        # Poll for completion
+        self.root.after(50, self._check_detection_complete)
+
+    def _run_detection(self, detector: BirdDetector, regions: list[Region] | None, params: dict) -> None:
+        """Run detection and annotation in background thread."""
         detected_classes: set[int] = set()
-        self.__image_obj = tk.PhotoImage(
-            data=get_annotated_image_bytes(
-                self.detector,
-                self.__selected_image,
+        try:
+            image_bytes = get_annotated_image_bytes(
+                detector,
+                self.__detect_image,
                 regions=regions,
                 detected_classes_out=detected_classes,
-                conf=self.conf_var.get(),
-                imgsz=self.imgsz_var.get(),
-                iou=self.iou_var.get(),
-            ),
-            format="png",
-        )
+                **params,
+            )
+            # Decode the annotated PNG here too, leaving only the Tk image conversion for the main thread
+            with Image.open(io.BytesIO(image_bytes)) as image:
+                image.load()
+            self.__detect_result = (image, detected_classes)
+        except UserFacingError as e:
+            self.__detect_error = e
+        except Exception as e:
+            self.__detect_error = UserFacingError("Detection error", f"Unexpected error: {e}")
+
+    def _check_detection_complete(self) -> None:
+        """Poll for detection thread completion and show the annotated preview."""
+        if self.__detect_thread is not None and self.__detect_thread.is_alive():
+            # Still running, check again later
+            self.root.after(50, self._check_detection_complete)
+            return
+
+        self.detect_btn.config(state="normal", text="Detect Bird")
+
+        # Drop the result if another frame was loaded meanwhile
+        if self.__selected_image != self.__detect_image:
+            return
+
+        if self.__detect_error is not None:
+            show_user_error(self.__detect_error)
+            return
+
+        if self.__detect_result is None:
+            return
+        image, detected_classes = self.__detect_result
+        self._set_image(ImageTk.PhotoImage(image))
+        self.__detection_shown = True
         self.set_image_preview()
         self._show_legend(detected_classes)
         self.show_clear_button()
@@ -1940,12 +2101,8 @@ class LabGUI:
         # Create and show progress dialog
         self.__sync_dialog = SyncProgressDialog(self.root)
 
-        # Start sync thread
-        self.__sync_thread = threading.Thread(target=self._run_sync, args=(from_date, to_date), daemon=True)
-        self.__sync_thread.start()
-
-        # Poll for completion
-        self.root.after(100, self._check_sync_complete)
+        # Start sync thread; it hands completion back to the main loop itself, so nothing polls meanwhile
+        threading.Thread(target=self._run_sync, args=(from_date, to_date), daemon=True).start()
 
     def _run_sync(self, from_date: date | None, to_date: date | None) -> None:
         """Run sync, conversion, and cleanup in background thread (per-stream pipeline)."""
@@ -2017,15 +2174,13 @@ class LabGUI:
             dialog.set_error(str(e))
         except Exception as e:
             dialog.set_error(f"Unexpected error: {e}")
+        finally:
+            # Runs after the after_idle dialog updates posted above. A coalesced progress flush may
+            # still fire later, but it does nothing once the dialog is closed (see _alive)
+            self.root.after_idle(self._on_sync_done)
 
-    def _check_sync_complete(self) -> None:
-        """Poll for sync thread completion and cleanup."""
-        if self.__sync_thread.is_alive():
-            # Still running, check again later
-            self.root.after(100, self._check_sync_complete)
-            return
-
-        # Thread finished, cleanup
+    def _on_sync_done(self) -> None:
+        """Clean up after the sync thread finished and report the result."""
         dialog = self.__sync_dialog
         error = dialog.get_error()
         dialog.close()
@@ -2153,7 +2308,7 @@ class LabGUI:
         if self.__canvas_image_id is not None:
             self.image_canvas.delete(self.__canvas_image_id)
             self.__canvas_image_id = None
-        self.__image_obj = None
+        self._set_image(None)
 
         # Clear selections
         self.clear_all()
@@ -2220,21 +2375,15 @@ class LabGUI:
         self._rebuild_annotation_list()
 
     def _redraw_annotation_rects(self) -> None:
-        """Clear canvas rect/text/bg lists and redraw all annotation rects (without ROI labels)."""
-        for rect_id in self.__selection_rects:
-            self.image_canvas.delete(rect_id)
-        self.__selection_rects.clear()
-        for bg_id in self.__selection_bgs:
-            self.image_canvas.delete(bg_id)
-        self.__selection_bgs.clear()
-        for text_id in self.__selection_texts:
-            self.image_canvas.delete(text_id)
-        self.__selection_texts.clear()
+        """Delete the ROI canvas items and redraw all annotation rects (without ROI labels)."""
+        self._delete_roi_items()
 
         for item in self.__annotation_items:
             x1, y1, x2, y2 = item["x1"], item["y1"], item["x2"], item["y2"]
-            rect_id = self.image_canvas.create_rectangle(x1, y1, x2, y2, outline="green", width=2)
-            self.__selection_rects.append(rect_id)
+            self.image_canvas.create_rectangle(x1, y1, x2, y2, outline="green", width=2, tags=ROI_ITEM_TAG)
+
+        # Keep the crosshair above the new items
+        self.image_canvas.tag_raise(CROSSHAIR_TAG)
 
     def _clear_annotation_list_ui(self) -> None:
         """Remove all rows from annotation list and hide the frame."""
@@ -2283,8 +2432,7 @@ class LabGUI:
 
         existing_boxes = annotations.load_annotations(self.__selected_image, self.__current_recording)
         if existing_boxes and self.__image_obj is not None:
-            img_w = self.__image_obj.width()
-            img_h = self.__image_obj.height()
+            img_w, img_h = self.__image_size
             for box in existing_boxes:
                 px1, py1, px2, py2 = annotations.yolo_to_pixels(box, img_w, img_h)
                 self.__annotation_items.append(
@@ -2311,8 +2459,7 @@ class LabGUI:
         if self.__image_obj is None:
             return
 
-        img_w = self.__image_obj.width()
-        img_h = self.__image_obj.height()
+        img_w, img_h = self.__image_size
 
         boxes: list[annotations.AnnotationBox] = []
         for item in self.__annotation_items:
@@ -2333,7 +2480,7 @@ class LabGUI:
         self.__annotation_items.clear()
         self._clear_annotation_list_ui()
         self.clear_canvas_elements()
-        self.__image_obj = tk.PhotoImage(file=self.__selected_image)
+        self._set_image(self._open_frame_image(self.__selected_image))
         self.set_image_preview()
         self._load_frame_annotations()
 
@@ -2354,7 +2501,7 @@ class LabGUI:
         self.__annotation_items.clear()
         self._clear_annotation_list_ui()
         self.clear_canvas_elements()
-        self.__image_obj = tk.PhotoImage(file=self.__selected_image)
+        self._set_image(self._open_frame_image(self.__selected_image))
         self.set_image_preview()
 
         # Keep the annotation list frame visible (now empty)
@@ -2430,13 +2577,45 @@ class LabGUI:
             classes = list(range(len(self.__selected_model_info["classes"])))
             self.detector = BirdDetector(model_path=model_path, classes=classes)
 
+    def _warm_up_detector(self) -> None:
+        """Start loading the default detector in a background thread, keeping the UI responsive."""
+        if self.detector is not None:
+            return
+        self.__detector_thread = threading.Thread(target=self._run_detector_load, daemon=True)
+        self.__detector_thread.start()
+
+        # Poll for completion
+        self.root.after(100, self._check_detector_loaded)
+
+    def _run_detector_load(self) -> None:
+        """Load the detector in background thread, recording the error if it fails."""
+        try:
+            self._init_detector()
+        except Exception as e:
+            self.__detector_error = UserFacingError("Detector error", f"Failed to load the detector: {e}")
+
+    def _check_detector_loaded(self) -> None:
+        """Poll for detector load completion and show which model is in use."""
+        if self.__detector_thread is not None and self.__detector_thread.is_alive():
+            # Still running, check again later
+            self.root.after(100, self._check_detector_loaded)
+            return
+
+        self._update_selected_model_display()
+        if self.__detector_error is not None:
+            show_user_error(self.__detector_error)
+
     def open_model_select_dialog(self) -> None:
         """Open the model selection dialog."""
+        if self.__detector_thread is not None and self.__detector_thread.is_alive():
+            show_user_error(UserFacingError("Loading", "The detector is still loading, please try again.", "info"))
+            return
         dialog = ModelSelectDialog(self.root)
         result = dialog.wait()
         if result is not None:
             self.__selected_model_info = result
             self._init_detector()
+            self.__detector_error = None
             self._update_selected_model_display()
 
     # ------------------------------------------------------------------
@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
-import re
+import os
+import shlex
 import shutil
 import socket
 import stat
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 
 import paramiko
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
 from lab.constants import (
     ARCHIVE_DIR,
     ARCHIVE_FOLDER_PATTERN,
@@ -23,40 +32,82 @@ from lab.constants import (
     SSH_KEY_PATH,
 )
 
-# Pattern for date folders: YYYY, MM, DD (numeric)
-DATE_FOLDER_PATTERN = re.compile(r"^\d+$")
+# Remote archive root with a single trailing slash, for building remote paths by concatenation
+REMOTE_ARCHIVE_PREFIX = REMOTE_ARCHIVE_PATH.rstrip("/") + "/"
+
+# Extensions of HLS files (segments and playlists)
+HLS_EXTENSIONS = (".ts", ".m3u8")
+
+# Environment variable that enables zlib compression of SSH traffic when set to "1".
+# Helps on slow links with compressible playlists and listings; .ts segments barely compress
+SYNC_COMPRESS_ENV = "SYNC_COMPRESS"
+
+# Shortest possible archive folder name: {ISO-timestamp}_{uuid} without a prefix
+MIN_ARCHIVE_FOLDER_LENGTH = len("2026-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92")
+
+
+def _is_date_folder(name: str) -> bool:
+    """Check if name is a date folder: YYYY, MM or DD (ASCII digits only)."""
+    return 1 <= len(name) <= 4 and name.isascii() and name.isdigit()
+
+
+def _is_archive_folder(name: str) -> bool:
+    """Check if name is an archive folder, skipping the regex for names that cannot match."""
+    return len(name) >= MIN_ARCHIVE_FOLDER_LENGTH and "-" in name and ARCHIVE_FOLDER_PATTERN.match(name) is not None
 
 
 ProgressCallback = Callable[[int, int, str], None]
 
-# Maximum retry attempts for reconnection
-MAX_RETRIES = 15
+# Maximum download attempts per file, each failure followed by a reconnect
+MAX_RETRIES = 5
 
 # Connection timeout in seconds
 CONNECTION_TIMEOUT = 10
 
-# Delay between retry attempts (in seconds)
-RETRY_DELAY = 2
+# Delay before the first retry (in seconds), doubled after each further failure
+RETRY_DELAY = 1
+
+# Upper bound for the delay between retry attempts (in seconds)
+MAX_RETRY_DELAY = 30
+
+# SSH channel window size (in bytes) - large enough that transfers are not stalled waiting for window updates
+TRANSPORT_WINDOW_SIZE = 2**31 - 1
+
+# Number of files sync_all downloads in parallel, each on its own SFTP channel
+SYNC_WORKERS = 8
+
+# Maximum bytes read from an exec channel per recv call
+EXEC_READ_SIZE = 65536
+
+# Seconds an exec channel may stay silent before the command is abandoned for the SFTP fallback
+EXEC_TIMEOUT = 60
+
+# Buffer size for copying downloaded data to the local file (in bytes)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Files up to this size (in bytes), such as playlists, are fetched with one read request instead of a prefetch
+SMALL_FILE_SIZE = paramiko.SFTPFile.MAX_REQUEST_SIZE
 
 
 class SyncError(Exception):
     """Raised when sync operation fails."""
 
 
+@dataclass(slots=True, frozen=True)
 class FileToSync:
     """Represents a file to be synced from remote to local."""
 
-    def __init__(self, folder: str, filename: str) -> None:
-        self.folder = folder
-        self.filename = filename
-
-    @property
-    def remote_path(self) -> str:
-        return f"{REMOTE_ARCHIVE_PATH}/{self.folder}/{self.filename}"
+    folder: str
+    filename: str
+    # Remote size, when known from the folder listing, so small files can be fetched without a stat
+    size: int | None = None
+    # Built once on creation, since downloads touch them several times per file
+    remote_path: str = field(init=False, compare=False)
+    local_path: Path = field(init=False, compare=False)
 
-    @property
-    def local_path(self) -> Path:
-        return ARCHIVE_DIR / self.folder / self.filename
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "remote_path", f"{REMOTE_ARCHIVE_PATH}/{self.folder}/{self.filename}")
+        object.__setattr__(self, "local_path", ARCHIVE_DIR / self.folder / self.filename)
 
     def __repr__(self) -> str:
         return f"FileToSync({self.folder}/{self.filename})"
@@ -71,21 +122,32 @@ class SyncManager:
         self._socket: socket.socket | None = None
         self._host: str = ""
         self._user: str = ""
+        # Cleared when the server refuses exec channels, so removal falls back to SFTP
+        self._exec_supported: bool = True
+        # Parsed (host, user) keyed by the config file's mtime, so reconnects skip re-parsing
+        self._config_cache: tuple[int, tuple[str, str]] | None = None
+        # Guards reconnection and per-worker SFTP channels while sync_all downloads in parallel
+        self._connection_lock = threading.Lock()
+        self._worker_state = threading.local()
+        self._worker_sftps: list[paramiko.SFTPClient] = []
 
     def _load_config(self) -> tuple[str, str]:
-        """Load SSH host and user from config file."""
+        """Load SSH host and user from config file, reusing the last result while it is unchanged."""
         if not CONFIG_PATH.exists():
             raise SyncError(f"Config file not found: {CONFIG_PATH}")
 
-        with open(CONFIG_PATH) as f:
-            config = yaml.safe_load(f)
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+        if self._config_cache is not None and self._config_cache[0] == mtime:
+            return self._config_cache[1]
 
+        config = _parse_config(CONFIG_PATH)
         host = config.get("ansible_target_host")
         user = config.get("ansible_target_user")
 
         if not host or not user:
             raise SyncError("Missing ansible_target_host or ansible_target_user in config")
 
+        self._config_cache = (mtime, (host, user))
         return host, user
 
     def connect(self) -> None:
@@ -95,20 +157,17 @@ class SyncManager:
 
         self._host, self._user = self._load_config()
 
-        try:
-            pkey = paramiko.Ed25519Key.from_private_key_file(str(SSH_KEY_PATH))
-        except paramiko.SSHException:
-            # Fall back to RSA if Ed25519 fails
-            try:
-                pkey = paramiko.RSAKey.from_private_key_file(str(SSH_KEY_PATH))
-            except paramiko.SSHException as e:
-                raise SyncError(f"Failed to load SSH key: {e}") from e
+        pkey = _load_private_key(SSH_KEY_PATH)
 
         try:
             # Create socket with timeout to avoid hanging on unresponsive servers
             self._socket = socket.create_connection((self._host, 22), timeout=CONNECTION_TIMEOUT)
-            self._transport = paramiko.Transport(self._socket)
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._transport = paramiko.Transport(self._socket, default_window_size=TRANSPORT_WINDOW_SIZE)
             self._transport.set_keepalive(30)  # Send keepalive every 30 seconds
+            if os.environ.get(SYNC_COMPRESS_ENV) == "1":
+                # Must be negotiated during key exchange, so set it before connecting
+                self._transport.use_compression(True)
             self._transport.connect(username=self._user, pkey=pkey)
             self._sftp = paramiko.SFTPClient.from_transport(self._transport)
             # Set a longer timeout for file operations (30s for large files)
@@ -145,15 +204,11 @@ class SyncManager:
                 pass  # Ignore errors if already closed/broken
             self._socket = None
 
-    def _is_dir(self, path: str) -> bool:
-        """Check if remote path is a directory."""
+    def _require_connected(self) -> paramiko.SFTPClient:
+        """Return the open SFTP client, raising SyncError if not connected."""
         if self._sftp is None:
             raise SyncError("Not connected")
-        try:
-            stat_result = self._sftp.stat(path)
-            return stat_result.st_mode is not None and (stat_result.st_mode & 0o40000 != 0)
-        except OSError:
-            return False
+        return self._sftp
 
     def _remove_remote_folder_recursive(self, path: str) -> None:
         """
@@ -163,26 +218,81 @@ class SyncManager:
             path: Full remote path to the folder to remove.
 
         Raises:
-            SyncError: If not connected or removal fails.
+            SyncError: If not connected, the folder does not exist or removal fails.
         """
-        if self._sftp is None:
-            raise SyncError("Not connected")
+        sftp = self._require_connected()
+
+        # Listing doubles as the existence check, saving a separate stat round-trip
+        try:
+            entries = sftp.listdir_attr(path)
+        except FileNotFoundError as e:
+            raise SyncError(f"Remote folder does not exist: {path.removeprefix(REMOTE_ARCHIVE_PREFIX)}") from e
+        except OSError as e:
+            raise SyncError(f"Failed to remove remote folder {path}: {e}") from e
 
         try:
-            for entry in self._sftp.listdir_attr(path):
+            for entry in entries:
                 entry_path = f"{path}/{entry.filename}"
                 if entry.st_mode is not None and stat.S_ISDIR(entry.st_mode):
                     self._remove_remote_folder_recursive(entry_path)
                 else:
-                    self._sftp.remove(entry_path)
-            self._sftp.rmdir(path)
+                    sftp.remove(entry_path)
+            sftp.rmdir(path)
         except OSError as e:
             raise SyncError(f"Failed to remove remote folder {path}: {e}") from e
 
+    def _exec_remote_command(self, command: str) -> tuple[int, bytes] | None:
+        """
+        Run a shell command on the remote server over an SSH exec channel.
+
+        One exec request replaces what would otherwise be many SFTP round-trips.
+
+        Args:
+            command: Shell command line to run.
+
+        Returns:
+            Tuple of (exit_status, stdout), or None if the server does not allow exec
+            channels or stops responding, and the caller should fall back to SFTP.
+        """
+        if self._transport is None or not self._exec_supported:
+            return None
+
+        try:
+            channel = self._transport.open_session(timeout=CONNECTION_TIMEOUT)
+            try:
+                channel.settimeout(EXEC_TIMEOUT)
+                channel.exec_command(command)
+                chunks: list[bytes] = []
+                while data := channel.recv(EXEC_READ_SIZE):
+                    chunks.append(data)
+                return channel.recv_exit_status(), b"".join(chunks)
+            finally:
+                channel.close()
+        except paramiko.SSHException:
+            self._exec_supported = False
+            return None
+        except TimeoutError:
+            print(f"Remote command timed out: {command}")
+            return None
+
+    def _remove_remote_folder_via_exec(self, path: str) -> bool:
+        """
+        Remove a remote folder with a single ``rm -rf`` over an SSH exec channel.
+
+        Args:
+            path: Full remote path to the folder to remove.
+
+        Returns:
+            True if the server removed the folder, False if the caller should fall back
+            to recursive SFTP removal (including when the folder does not exist).
+        """
+        quoted = shlex.quote(path)
+        result = self._exec_remote_command(f"test -d {quoted} && rm -rf -- {quoted}")
+        return result is not None and result[0] == 0
+
     def _remove_empty_remote_date_dirs(self, relative_path: str) -> None:
         """Remove empty day/month/year directories on remote after recording removal."""
-        if self._sftp is None:
-            raise SyncError("Not connected")
+        sftp = self._require_connected()
 
         parts = Path(relative_path).parts
         if len(parts) < 4:
@@ -191,16 +301,16 @@ class SyncManager:
 
         try:
             day_path = f"{REMOTE_ARCHIVE_PATH}/{year}/{month}/{day}"
-            if not self._sftp.listdir(day_path):
-                self._sftp.rmdir(day_path)
+            if not sftp.listdir(day_path):
+                sftp.rmdir(day_path)
 
                 month_path = f"{REMOTE_ARCHIVE_PATH}/{year}/{month}"
-                if not self._sftp.listdir(month_path):
-                    self._sftp.rmdir(month_path)
+                if not sftp.listdir(month_path):
+                    sftp.rmdir(month_path)
 
                     year_path = f"{REMOTE_ARCHIVE_PATH}/{year}"
-                    if not self._sftp.listdir(year_path):
-                        self._sftp.rmdir(year_path)
+                    if not sftp.listdir(year_path):
+                        sftp.rmdir(year_path)
         except OSError:
             pass  # Best effort - don't fail if cleanup fails
 
@@ -215,100 +325,110 @@ class SyncManager:
         Raises:
             SyncError: If not connected or removal fails.
         """
-        if self._sftp is None:
-            raise SyncError("Not connected")
+        self._require_connected()
 
-        full_path = f"{REMOTE_ARCHIVE_PATH}/{relative_path}"
+        full_path = REMOTE_ARCHIVE_PREFIX + relative_path
 
-        # Verify the folder exists before attempting removal
-        if not self._is_dir(full_path):
-            raise SyncError(f"Remote folder does not exist: {relative_path}")
-
-        self._remove_remote_folder_recursive(full_path)
+        if not self._remove_remote_folder_via_exec(full_path):
+            self._remove_remote_folder_recursive(full_path)
 
     def _list_remote_archive_folders(self) -> list[str]:
         """
         List all archive folders on remote server.
 
+        Uses a single remote ``find`` when exec channels are available, otherwise walks
+        the year/month/day tree over SFTP.
+
         Returns paths relative to REMOTE_ARCHIVE_PATH in format:
         {year}/{month}/{day}/{folder_name}
         """
-        if self._sftp is None:
-            raise SyncError("Not connected")
+        sftp = self._require_connected()
+
+        exec_folders = self._list_remote_archive_folders_via_exec()
+        if exec_folders is not None:
+            return exec_folders
 
         folders: list[str] = []
 
         try:
-            years = self._sftp.listdir(REMOTE_ARCHIVE_PATH)
+            years = sftp.listdir_attr(REMOTE_ARCHIVE_PATH)
         except OSError as e:
             raise SyncError(f"Cannot list remote archive: {e}") from e
 
-        for year in years:
-            if not DATE_FOLDER_PATTERN.match(year):
-                continue
+        # listdir_attr returns each entry's mode with its name, so no per-entry stat is needed
+        for year in _remote_dir_names(years, _is_date_folder):
             year_path = f"{REMOTE_ARCHIVE_PATH}/{year}"
-            if not self._is_dir(year_path):
-                continue
 
             try:
-                months = self._sftp.listdir(year_path)
+                months = sftp.listdir_attr(year_path)
             except OSError:
                 continue
 
-            for month in months:
-                if not DATE_FOLDER_PATTERN.match(month):
-                    continue
+            for month in _remote_dir_names(months, _is_date_folder):
                 month_path = f"{year_path}/{month}"
-                if not self._is_dir(month_path):
-                    continue
 
                 try:
-                    days = self._sftp.listdir(month_path)
+                    days = sftp.listdir_attr(month_path)
                 except OSError:
                     continue
 
-                for day in days:
-                    if not DATE_FOLDER_PATTERN.match(day):
-                        continue
+                for day in _remote_dir_names(days, _is_date_folder):
                     day_path = f"{month_path}/{day}"
-                    if not self._is_dir(day_path):
-                        continue
 
                     try:
-                        archive_folders = self._sftp.listdir(day_path)
+                        archive_folders = sftp.listdir_attr(day_path)
                     except OSError:
                         continue
 
-                    for folder in archive_folders:
-                        if ARCHIVE_FOLDER_PATTERN.match(folder):
-                            folder_path = f"{day_path}/{folder}"
-                            if self._is_dir(folder_path):
-                                # Return relative path
-                                folders.append(f"{year}/{month}/{day}/{folder}")
+                    for folder in _remote_dir_names(archive_folders, _is_archive_folder):
+                        # Return relative path
+                        folders.append(f"{year}/{month}/{day}/{folder}")
 
         return folders
 
-    def _get_files_to_sync(self, remote_folder: str) -> list[str]:
+    def _list_remote_archive_folders_via_exec(self) -> list[str] | None:
         """
-        Get list of .ts and .m3u8 files in a remote folder.
+        List archive folders with one remote ``find`` over an SSH exec channel.
 
-        Returns filenames (not full paths).
+        Returns:
+            Relative folder paths, or None if the caller should fall back to the SFTP walk.
         """
-        if self._sftp is None:
-            raise SyncError("Not connected")
+        result = self._exec_remote_command(
+            f"find {shlex.quote(REMOTE_ARCHIVE_PATH)} -mindepth 4 -maxdepth 4 -type d -print0 2>/dev/null"
+        )
+        if result is None or result[0] != 0:
+            return None
+
+        folders: list[str] = []
+        # Names that are not valid UTF-8 survive decoding and are then rejected by the folder checks
+        for entry in result[1].decode(errors="surrogateescape").split("\0"):
+            if not entry.startswith(REMOTE_ARCHIVE_PREFIX):
+                continue
+            parts = entry[len(REMOTE_ARCHIVE_PREFIX) :].split("/")
+            if len(parts) != 4:
+                continue
+            year, month, day, folder = parts
+            if _is_date_folder(year) and _is_date_folder(month) and _is_date_folder(day) and _is_archive_folder(folder):
+                folders.append(f"{year}/{month}/{day}/{folder}")
+
+        return folders
+
+    def _get_file_attrs_to_sync(self, remote_folder: str) -> list[paramiko.SFTPAttributes]:
+        """
+        Get attributes (filename, size, mtime) of .ts and .m3u8 files in a remote folder.
+
+        Names and attributes come back from a single listing request.
+        """
+        sftp = self._require_connected()
 
         full_path = f"{REMOTE_ARCHIVE_PATH}/{remote_folder}"
-        files: list[str] = []
 
         try:
-            entries = self._sftp.listdir(full_path)
-            for entry in entries:
-                if entry.endswith(".ts") or entry.endswith(".m3u8"):
-                    files.append(entry)
+            entries = sftp.listdir_attr(full_path)
         except OSError:
-            pass
+            return []
 
-        return files
+        return [entry for entry in entries if entry.filename.endswith(HLS_EXTENSIONS)]
 
     def get_missing_folders(
         self,
@@ -325,6 +445,7 @@ class SyncManager:
         Returns list of relative paths like: {year}/{month}/{day}/{folder}
         """
         remote_folders = self._list_remote_archive_folders()
+        local_folders = self._list_local_archive_folders()
         missing: list[str] = []
 
         for folder in remote_folders:
@@ -341,12 +462,26 @@ class SyncManager:
                         if to_date is not None and folder_date > to_date:
                             continue
 
-            local_path = ARCHIVE_DIR / folder
-            if not local_path.exists():
+            if folder not in local_folders:
                 missing.append(folder)
 
         return missing
 
+    def _list_local_archive_folders(self) -> frozenset[str]:
+        """
+        List all archive folders in the local archive with one scan of the tree.
+
+        Returns paths relative to ARCHIVE_DIR in format:
+        {year}/{month}/{day}/{folder_name}
+        """
+        # Descend through year, month and day directories, then take every entry of each day
+        parents = [""]
+        for _ in range(3):
+            parents = [
+                f"{parent}{entry.name}/" for parent in parents for entry in _scan_local_dir(parent) if entry.is_dir()
+            ]
+        return frozenset(f"{parent}{entry.name}" for parent in parents for entry in _scan_local_dir(parent))
+
     def sync_folder(
         self,
         folder: str,
@@ -362,10 +497,9 @@ class SyncManager:
         Returns:
             Number of files downloaded.
         """
-        if self._sftp is None:
-            raise SyncError("Not connected")
+        sftp = self._require_connected()
 
-        files = self._get_files_to_sync(folder)
+        files = self._get_file_attrs_to_sync(folder)
         if not files:
             return 0
 
@@ -374,7 +508,8 @@ class SyncManager:
 
         remote_base = f"{REMOTE_ARCHIVE_PATH}/{folder}"
 
-        for idx, filename in enumerate(files):
+        for idx, attr in enumerate(files):
+            filename = attr.filename
             remote_file = f"{remote_base}/{filename}"
             local_file = local_folder / filename
 
@@ -382,7 +517,7 @@ class SyncManager:
                 on_file_progress(idx + 1, len(files), filename)
 
             try:
-                self._sftp.get(remote_file, str(local_file))
+                _download_remote_file(sftp, remote_file, local_file, attr.st_size)
             except OSError as e:
                 raise SyncError(f"Failed to download {filename}: {e}") from e
 
@@ -400,9 +535,8 @@ class SyncManager:
         files_to_sync: list[FileToSync] = []
 
         for folder in missing_folders:
-            files = self._get_files_to_sync(folder)
-            for filename in files:
-                files_to_sync.append(FileToSync(folder, filename))
+            for attr in self._get_file_attrs_to_sync(folder):
+                files_to_sync.append(FileToSync(folder, attr.filename, attr.st_size))
 
         return files_to_sync
 
@@ -424,11 +558,94 @@ class SyncManager:
         time.sleep(0.5)
         self.connect()
 
+    def _init_sftp_worker(self) -> None:
+        """Mark the calling thread as a worker that uses its own SFTP channel."""
+        self._worker_state.active = True
+
+    def _sftp_for_current_thread(self) -> paramiko.SFTPClient:
+        """
+        Return the SFTP client to use on the calling thread.
+
+        Worker threads (parallel downloads in sync_all) each open their own SFTP
+        channel on the shared transport so their requests are not serialized on one
+        channel. Other callers use the main client.
+
+        Raises:
+            SyncError: If not connected.
+        """
+        with self._connection_lock:
+            sftp = self._require_connected()
+            if not getattr(self._worker_state, "active", False) or self._transport is None:
+                return sftp
+
+            if getattr(self._worker_state, "transport", None) is not self._transport:
+                sftp = _open_sftp_channel(self._transport)
+                self._worker_state.sftp = sftp
+                self._worker_state.transport = self._transport
+                self._worker_sftps.append(sftp)
+
+            return self._worker_state.sftp
+
+    def _discard_sftp_for_current_thread(self) -> None:
+        """
+        Close the SFTP client the calling thread uses, so the next attempt opens a fresh one.
+
+        Must be called with the connection lock held.
+        """
+        if getattr(self._worker_state, "active", False):
+            sftp = getattr(self._worker_state, "sftp", None)
+            self._worker_state.sftp = None
+            self._worker_state.transport = None
+            if sftp in self._worker_sftps:
+                self._worker_sftps.remove(sftp)
+        else:
+            sftp = self._sftp
+            self._sftp = None
+
+        if sftp is not None:
+            try:
+                sftp.close()
+            except Exception:  # nosec B110
+                pass  # Ignore errors if already closed/broken
+
+    def _soft_reconnect(self) -> None:
+        """
+        Reopen the main SFTP client, reusing the SSH transport while it is still alive.
+
+        Opening an SFTP channel costs one round trip, while a full reconnect repeats the
+        TCP and SSH handshakes and authentication. Falls back to a full reconnect when the
+        transport is dead.
+        """
+        transport = self._transport
+        if transport is None or not transport.is_active():
+            self._reconnect()
+            return
+
+        print("Reopening SFTP session...")
+        if self._sftp is not None:
+            try:
+                self._sftp.close()
+            except Exception:  # nosec B110
+                pass  # Ignore errors if already closed/broken
+        self._sftp = _open_sftp_channel(transport)
+
+    def _close_worker_sftps(self) -> None:
+        """Close the SFTP channels opened by worker threads."""
+        with self._connection_lock:
+            for sftp in self._worker_sftps:
+                try:
+                    sftp.close()
+                except Exception:  # nosec B110
+                    pass  # Ignore errors if already closed/broken
+            self._worker_sftps.clear()
+
     def _download_file_with_retry(self, file: FileToSync) -> None:
         """
         Download a single file with retry logic.
 
-        If download fails, reconnects and retries up to MAX_RETRIES times.
+        If download fails with a connection error, reconnects and retries, making up to
+        MAX_RETRIES attempts with an exponentially growing delay between them. A missing
+        remote file fails immediately since retrying cannot fix it.
         """
         # Ensure local directory exists
         file.local_path.parent.mkdir(parents=True, exist_ok=True)
@@ -436,57 +653,64 @@ class SyncManager:
         last_error: Exception | None = None
 
         for attempt in range(MAX_RETRIES):
+            transport = self._transport
             try:
-                if self._sftp is None:
-                    self._reconnect()
+                with self._connection_lock:
+                    if self._sftp is None:
+                        self._soft_reconnect()
+                sftp = self._sftp_for_current_thread()
+                transport = self._transport
 
-                self._sftp.get(file.remote_path, str(file.local_path))
+                _download_remote_file(sftp, file.remote_path, file.local_path, file.size)
                 return  # Success
-            except Exception as e:
+            except FileNotFoundError as e:
+                _remove_partial_file(file.local_path)
+                raise SyncError(f"Remote file not found: {file.filename}") from e
+            except (OSError, EOFError, paramiko.SSHException, SyncError) as e:
                 last_error = e
                 print(f"Download failed (attempt {attempt + 1}/{MAX_RETRIES}): {file.filename} - {e}")
 
-                # Properly close all connections before retrying
-                try:
-                    self.disconnect()
-                except Exception:  # nosec B110
-                    pass
-                finally:
-                    # Ensure all handles are cleared
-                    self._sftp = None
-                    self._transport = None
-                    self._socket = None
-
-                # Delete partial file if it exists
-                if file.local_path.exists():
-                    try:
-                        file.local_path.unlink()
-                    except OSError:
-                        pass
+                # Drop the SFTP channel this attempt used. Tear down the whole connection only
+                # if the transport died, unless another worker has already replaced it
+                with self._connection_lock:
+                    if self._transport is transport:
+                        self._discard_sftp_for_current_thread()
+                        if transport is None or not transport.is_active():
+                            try:
+                                self.disconnect()
+                            except Exception:  # nosec B110
+                                pass
+                            finally:
+                                # Ensure all handles are cleared
+                                self._sftp = None
+                                self._transport = None
+                                self._socket = None
+
+                _remove_partial_file(file.local_path)
 
                 if attempt < MAX_RETRIES - 1:
-                    # Wait before retrying to give the network/server time to recover
-                    print(f"Waiting {RETRY_DELAY}s before retry...")
-                    time.sleep(RETRY_DELAY)
-
-                    # Reconnect and retry
-                    try:
-                        self._reconnect()
-                    except Exception as reconnect_error:
-                        print(f"Reconnect failed: {reconnect_error}")
-                        # Continue to next attempt, will try reconnect again
-
-        # All retries exhausted - ensure cleanup before raising
-        try:
-            self.disconnect()
-        except Exception:  # nosec B110
-            pass
+                    # Back off exponentially to give the network/server time to recover
+                    delay = min(RETRY_DELAY * 2**attempt, MAX_RETRY_DELAY)
+                    print(f"Waiting {delay}s before retry...")
+                    time.sleep(delay)
+
+                    # Reconnect and retry (only one worker reconnects a dropped connection)
+                    with self._connection_lock:
+                        if self._sftp is None:
+                            try:
+                                self._soft_reconnect()
+                            except Exception as reconnect_error:
+                                print(f"Reconnect failed: {reconnect_error}")
+                                # Continue to next attempt, will try reconnect again
+
+        # All retries exhausted. Leave the shared connection to the caller, other workers may still use it
         raise SyncError(f"Failed to download {file.filename} after {MAX_RETRIES} attempts") from last_error
 
     def sync_single_folder(
         self,
         folder: str,
         on_file_progress: ProgressCallback | None = None,
+        progress_batch_size: int = 1,
     ) -> int:
         """
         Download all .ts and .m3u8 files from a single remote folder with retry logic.
@@ -494,6 +718,8 @@ class SyncManager:
         Args:
             folder: Relative path like {year}/{month}/{day}/{folder_name}
             on_file_progress: Callback(current_file, total_files, filename)
+            progress_batch_size: Call on_file_progress once per this many files
+                                 (and always for the last file)
 
         Returns:
             Number of files downloaded.
@@ -501,16 +727,20 @@ class SyncManager:
         Raises:
             SyncError: If download fails after all retries.
         """
-        files = self._get_files_to_sync(folder)
+        files = self._get_file_attrs_to_sync(folder)
         if not files:
             return 0
 
+        total_files = len(files)
+        last_reported = 0
+
         # Download files one by one with retry
-        for idx, filename in enumerate(files):
-            if on_file_progress:
-                on_file_progress(idx + 1, len(files), filename)
+        for idx, attr in enumerate(files, start=1):
+            if on_file_progress and (idx - last_reported >= progress_batch_size or idx == total_files):
+                on_file_progress(idx, total_files, attr.filename)
+                last_reported = idx
 
-            file = FileToSync(folder, filename)
+            file = FileToSync(folder, attr.filename, attr.st_size)
             self._download_file_with_retry(file)
 
         return len(files)
@@ -519,16 +749,19 @@ class SyncManager:
         self,
         on_download_progress: ProgressCallback | None = None,
         on_folder_start: Callable[[str], None] | None = None,
+        max_workers: int = SYNC_WORKERS,
     ) -> tuple[list[str], int]:
         """
         Sync all missing folders from remote server.
 
-        Downloads files one by one with retry logic. If a download fails,
-        the connection is reset and download resumes from the failed file.
+        Downloads files concurrently, each worker on its own SFTP channel, with retry
+        logic. If a download fails, the connection is reset and download resumes from
+        the failed file. Callbacks are invoked in file order as downloads complete.
 
         Args:
             on_download_progress: Callback(current_file, total_files, filename)
-            on_folder_start: Callback(folder_name) when starting a new folder
+            on_folder_start: Callback(folder_name) when reaching a new folder
+            max_workers: Maximum number of files downloaded in parallel
 
         Returns:
             Tuple of (list of synced folder paths, total files downloaded)
@@ -543,21 +776,25 @@ class SyncManager:
         synced_folders: set[str] = set()
         current_folder: str | None = None
 
-        # Download files one by one
-        for idx, file in enumerate(files_to_sync):
-            # Notify when starting a new folder
-            if file.folder != current_folder:
-                current_folder = file.folder
-                if on_folder_start:
-                    on_folder_start(file.folder)
-
-            # Update progress
-            if on_download_progress:
-                on_download_progress(idx + 1, total_files, file.filename)
-
-            # Download with retry
-            self._download_file_with_retry(file)
-            synced_folders.add(file.folder)
+        # Download files in parallel, collecting results in order
+        executor = ThreadPoolExecutor(max_workers=max_workers, initializer=self._init_sftp_worker)
+        try:
+            downloads = executor.map(self._download_file_with_retry, files_to_sync)
+            for idx, (file, _) in enumerate(zip(files_to_sync, downloads)):
+                # Notify when reaching a new folder
+                if file.folder != current_folder:
+                    current_folder = file.folder
+                    if on_folder_start:
+                        on_folder_start(file.folder)
+
+                # Update progress
+                if on_download_progress:
+                    on_download_progress(idx + 1, total_files, file.filename)
+
+                synced_folders.add(file.folder)
+        finally:
+            executor.shutdown(cancel_futures=True)
+            self._close_worker_sftps()
 
         return list(synced_folders), total_files
 
@@ -569,6 +806,97 @@ class SyncManager:
         self.disconnect()
 
 
+def _download_remote_file(
+    sftp: paramiko.SFTPClient, remote_path: str, local_path: Path, size: int | None = None
+) -> None:
+    """
+    Download a remote file, keeping many read requests in flight instead of waiting on each block.
+
+    Files known to be at most SMALL_FILE_SIZE are read with a single request instead.
+
+    Args:
+        sftp: Connected SFTP client.
+        remote_path: Full remote path of the file.
+        local_path: Local path to write to.
+        size: Remote file size if already known, which saves a stat round trip before prefetching.
+    """
+    with sftp.open(remote_path, "rb") as remote_file:
+        if size is not None and size <= SMALL_FILE_SIZE:
+            local_path.write_bytes(remote_file.read(size))
+            return
+
+        remote_file.set_pipelined(True)
+        remote_file.prefetch(size)
+        with open(local_path, "wb") as local_file:
+            shutil.copyfileobj(remote_file, local_file, DOWNLOAD_CHUNK_SIZE)
+
+
+def _remote_dir_names(entries: list[paramiko.SFTPAttributes], is_valid_name: Callable[[str], bool]) -> list[str]:
+    """Return the names of directory entries from a listdir_attr result that pass is_valid_name."""
+    return [
+        entry.filename
+        for entry in entries
+        if is_valid_name(entry.filename) and entry.st_mode is not None and stat.S_ISDIR(entry.st_mode)
+    ]
+
+
+def _load_private_key(path: Path) -> paramiko.PKey:
+    """
+    Load an SSH private key, trying the key types with the cheapest signatures first.
+
+    Raises:
+        SyncError: If the file is not a valid Ed25519, ECDSA or RSA key.
+    """
+    last_error: paramiko.SSHException | None = None
+    for key_class in (paramiko.Ed25519Key, paramiko.ECDSAKey, paramiko.RSAKey):
+        try:
+            return key_class.from_private_key_file(str(path))
+        except paramiko.SSHException as e:
+            last_error = e
+    raise SyncError(f"Failed to load SSH key: {last_error}") from last_error
+
+
+def _parse_config(path: Path) -> dict:
+    """Parse a YAML config file, treating an empty file as an empty config."""
+    with open(path) as f:
+        return yaml.load(f, Loader=YamlLoader) or {}  # nosec B506 - YamlLoader is a safe loader
+
+
+def _open_sftp_channel(transport: paramiko.Transport) -> paramiko.SFTPClient:
+    """
+    Open an SFTP client on a new channel of an existing transport.
+
+    Raises:
+        paramiko.SSHException: If the channel cannot be opened.
+    """
+    sftp = paramiko.SFTPClient.from_transport(transport)
+    if sftp is None:
+        raise paramiko.SSHException("Failed to open SFTP channel")
+    # Set a longer timeout for file operations (30s for large files)
+    channel = sftp.get_channel()
+    if channel:
+        channel.settimeout(30)
+    return sftp
+
+
+def _remove_partial_file(path: Path) -> None:
+    """Delete a partially downloaded file if it exists."""
+    if path.exists():
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _scan_local_dir(relative_path: str) -> list[os.DirEntry[str]]:
+    """List the entries of a directory under ARCHIVE_DIR, or nothing if it cannot be read."""
+    try:
+        with os.scandir(os.path.join(ARCHIVE_DIR, relative_path)) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
 def _remove_empty_date_dirs(base_path: Path, relative_path: str) -> None:
     """Remove empty day/month/year directories under base_path after recording removal."""
     parts = Path(relative_path).parts
@@ -593,6 +921,13 @@ def _remove_empty_date_dirs(base_path: Path, relative_path: str) -> None:
         pass
 
 
+def _bulk_rmtree(paths: Iterable[Path]) -> None:
+    """Remove several local directory trees in one pass, skipping those that don't exist."""
+    for path in paths:
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+
+
 def remove_recording(relative_path: str) -> None:
     """
     Remove a recording from remote server and local storage.
@@ -613,16 +948,11 @@ def remove_recording(relative_path: str) -> None:
         sync.remove_remote_folder(relative_path)
         sync._remove_empty_remote_date_dirs(relative_path)
 
-    # Step 2: Remote removal succeeded, now remove local archive folder
-    local_archive_path = ARCHIVE_DIR / relative_path
-    if local_archive_path.exists():
-        shutil.rmtree(local_archive_path)
-    _remove_empty_date_dirs(ARCHIVE_DIR, relative_path)
+    # Step 2: Remote removal succeeded, now remove local archive and images folders together
+    _bulk_rmtree([ARCHIVE_DIR / relative_path, IMAGES_DIR / relative_path])
 
-    # Step 3: Remove local images folder
-    local_images_path = IMAGES_DIR / relative_path
-    if local_images_path.exists():
-        shutil.rmtree(local_images_path)
+    # Step 3: Clean up date directories left empty in both trees
+    _remove_empty_date_dirs(ARCHIVE_DIR, relative_path)
     _remove_empty_date_dirs(IMAGES_DIR, relative_path)
 
 
@@ -663,9 +993,10 @@ def remove_hls_files(relative_path: str) -> int:
         return 0
 
     count = 0
-    for file in folder.iterdir():
-        if file.suffix in (".ts", ".m3u8"):
-            file.unlink()
-            count += 1
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name.endswith(HLS_EXTENSIONS):
+                os.unlink(entry.path)
+                count += 1
 
     return count
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import base64
-from dataclasses import dataclass
+import functools
+import os
 from pathlib import Path
+from typing import NamedTuple
 
 import cv2
+import numpy as np
 from processor.bird_detector import BirdDetector
 from processor.types import DetectionBox
 
@@ -31,9 +33,22 @@ def _hex_to_bgr(hex_color: str) -> tuple[int, int, int]:
 
 _DEFAULT_BOX_COLOR: tuple[int, int, int] = _hex_to_bgr(_DEFAULT_TK_COLOR)
 
+# Low zlib effort for preview PNGs: much faster to encode, only slightly larger (Tk PhotoImage cannot show JPEG)
+_PREVIEW_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
 
-@dataclass
-class Region:
+# Edge width in pixels of the detection boxes drawn by annotate_frame
+_BOX_THICKNESS = 2
+
+# cv2.imread flags per supported load_frame scale; reduced modes downscale inside the decoder
+_IMREAD_FLAGS: dict[int, int] = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+class Region(NamedTuple):
     """A rectangular region defined by (x1, y1, x2, y2) coordinates."""
 
     x1: int
@@ -42,12 +57,15 @@ class Region:
     y2: int
 
 
+@functools.lru_cache(maxsize=8)
+def _resolved_boundary(boundary_dir: Path) -> str:
+    return os.path.realpath(boundary_dir)
+
+
 def is_outside_storage(boundary_dir: Path, path: Path) -> bool:
-    try:
-        path.relative_to(boundary_dir)
-        return False
-    except ValueError:
-        return True
+    boundary = _resolved_boundary(boundary_dir)
+    candidate = os.path.realpath(path)
+    return not (candidate == boundary or candidate.startswith(boundary + os.sep))
 
 
 def validate_selected_image(selected_path: Path) -> None:
@@ -58,20 +76,73 @@ def validate_selected_image(selected_path: Path) -> None:
         raise UserFacingError("Invalid file", "Only .png files are allowed.")
 
 
-def load_frame(image_path: Path):
-    frame = cv2.imread(str(image_path))
+@functools.lru_cache(maxsize=16)
+def _load_frame_cached(path: str, mtime_ns: int, flags: int):
+    # Keyed by mtime so a rewritten file is decoded again; call cache_clear() to drop all entries.
+    # Reading the bytes ourselves and decoding from memory opens the file once, unlike cv2.imread
+    try:
+        data = np.fromfile(path, dtype=np.uint8)
+    except OSError:
+        return None
+    if data.size == 0:
+        # cv2.imdecode raises on an empty buffer rather than returning None like cv2.imread
+        return None
+    frame = cv2.imdecode(data, flags)
+    if frame is not None:
+        # The cached array is shared by every caller, so writes to it must fail loudly
+        frame.flags.writeable = False
+    return frame
+
+
+def load_frame(image_path: Path, scale: int = 1):
+    """Load an image as a BGR frame, optionally decoded at 1/scale of its resolution.
+
+    Decoded frames are cached per path, modification time and scale, so the returned
+    array may be shared between calls and is read-only; copy it before modifying.
+
+    Args:
+        image_path: Path to the image file.
+        scale: Downscale factor applied while decoding; one of 1, 2, 4 or 8.
+
+    Raises:
+        ValueError: If scale is not supported.
+        UserFacingError: If the image cannot be read.
+    """
+    flags = _IMREAD_FLAGS.get(scale)
+    if flags is None:
+        raise ValueError(f"scale must be one of {sorted(_IMREAD_FLAGS)}")
+    try:
+        mtime_ns = os.stat(image_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    frame = None if mtime_ns is None else _load_frame_cached(str(image_path), mtime_ns, flags)
     if frame is None:
         raise UserFacingError("Load error", f"Could not read image at {image_path}")
     return frame
 
 
-def annotate_frame(frame, boxes: list):
-    annotated = frame.copy()
-    for box in boxes:
+def annotate_frame(frame, boxes: list, in_place: bool = False):
+    # in_place draws straight onto frame, skipping the full-frame copy. Frames from load_frame are
+    # cached and shared, so only pass it for frames the caller owns
+    annotated = frame if in_place else frame.copy()
+    if not boxes:
+        return annotated
+    height, width = annotated.shape[:2]
+    t = _BOX_THICKNESS
+    # Clip all boxes to the frame in one pass; x2/y2 are made exclusive (they are inclusive, as in cv2.rectangle)
+    coords = np.array([box[:4] for box in boxes], dtype=np.int64) + (0, 0, 1, 1)
+    clipped = np.clip(coords, 0, (width, height, width, height)).tolist()
+    for box, (x1, y1, x2, y2) in zip(boxes, clipped):
+        if x1 >= x2 or y1 >= y2:
+            continue
         class_id = getattr(box, "class_id", None)
         tk_color = BIRD_CLASS_TK_COLORS.get(class_id, _DEFAULT_TK_COLOR)
         color = _hex_to_bgr(tk_color)
-        cv2.rectangle(annotated, (box[0], box[1]), (box[2], box[3]), color=color, thickness=2)
+        # Paint the four edges as slice fills
+        annotated[y1 : y1 + t, x1:x2] = color
+        annotated[max(y2 - t, y1) : y2, x1:x2] = color
+        annotated[y1:y2, x1 : x1 + t] = color
+        annotated[y1:y2, max(x2 - t, x1) : x2] = color
     return annotated
 
 
@@ -81,16 +152,20 @@ def get_annotated_image_bytes(
     *,
     regions: list[Region] | None = None,
     detected_classes_out: set[int] | None = None,
+    scale: int = 1,
     **kwargs,
 ) -> bytes:
     if image_path is None:
         raise UserFacingError("No image selected", "Please select an image first.")
-    frame = load_frame(image_path)
+    frame = load_frame(image_path, scale)
 
     boxes: list[DetectionBox] = []
     if regions:
         # Run detection on each selected region
         for region in regions:
+            if scale != 1:
+                # Regions are in full-resolution coordinates; map them onto the reduced frame
+                region = Region(region.x1 // scale, region.y1 // scale, region.x2 // scale, region.y2 // scale)
             cropped = frame[region.y1 : region.y2, region.x1 : region.x2]
             region_boxes = detector.detect_boxes(cropped, **kwargs)
             # Offset box coordinates back to full image coordinates
@@ -116,8 +191,8 @@ def get_annotated_image_bytes(
 
     annotated = annotate_frame(frame, boxes)
 
-    success, encoded = cv2.imencode(".png", annotated)
+    success, encoded = cv2.imencode(".png", annotated, _PREVIEW_PNG_PARAMS)
     if not success:
         raise UserFacingError("Preview error", "Could not render annotated preview.")
 
-    return base64.b64encode(encoded.tobytes())
+    return encoded.tobytes()
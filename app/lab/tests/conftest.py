@@ -1,9 +1,13 @@
 import logging
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import cv2
+import paramiko
 import pytest
 
+from lab.sync import SyncManager
+
 
 @pytest.fixture
 def data_dir():
@@ -19,6 +23,14 @@ def bird_frame(data_dir):
     return frame
 
 
+@pytest.fixture
+def connected_manager():
+    """Return a SyncManager wired to a mock SFTP client, as (manager, mock_sftp)."""
+    manager = SyncManager()
+    manager._sftp = MagicMock(spec=paramiko.SFTPClient)
+    return manager, manager._sftp
+
+
 @pytest.fixture
 def caplog(caplog):
     """Configure caplog for all tests."""
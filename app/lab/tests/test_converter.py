@@ -1,17 +1,27 @@
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import cv2
 import pytest
 
 from lab.converter import convert_all_playlists, convert_playlist_to_pngs, get_unconverted_playlists
 
 
-def create_mock_video_capture(read_side_effects, fps=30.0):
-    """Create a mock VideoCapture with FPS support."""
+def create_mock_video_capture(frame_results, fps=30.0):
+    """Create a mock VideoCapture with FPS support that yields (success, frame) results via grab()/retrieve()."""
     mock_cap = MagicMock()
     mock_cap.isOpened.return_value = True
-    mock_cap.read.side_effect = read_side_effects
+    results = iter(frame_results)
+    grabbed = {}
+
+    def grab():
+        success, grabbed["frame"] = next(results)
+        return success
+
+    mock_cap.grab.side_effect = grab
+    mock_cap.retrieve.side_effect = lambda: (True, grabbed["frame"])
     mock_cap.get.return_value = fps
     return mock_cap
 
@@ -111,6 +121,21 @@ class TestGetUnconvertedPlaylists:
             assert "2024/01/15/playlist1" in result
             assert len(result) == 1
 
+    def test_ignores_non_ascii_digit_year_folders(self):
+        """Should ignore year folders made of non-ASCII digits."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            archive_path = tmpdir_path / "archive"
+            images_path = tmpdir_path / "images"
+
+            (archive_path / "\u0662\u0660\u0662\u0664" / "01" / "15" / "playlist1").mkdir(parents=True)
+            (archive_path / "\u0662\u0660\u0662\u0664" / "01" / "15" / "playlist1" / "video.ts").write_text("")
+            images_path.mkdir()
+
+            result = get_unconverted_playlists(archive_path, images_path)
+
+            assert result == []
+
     def test_returns_only_playlists_with_ts_files(self):
         """Should only return playlists that contain .ts files."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -203,6 +228,37 @@ class TestGetUnconvertedPlaylists:
             assert "2024/01/15/playlist1" in result
             assert len(result) == 1
 
+    def test_returns_playlists_in_sorted_order(self):
+        """Should return playlists sorted by year, month, day and folder name."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            archive_path = tmpdir_path / "archive"
+            images_path = tmpdir_path / "images"
+
+            for relative_path in ("2024/02/01/b", "2023/12/31/a", "2024/01/15/c", "2024/01/15/a"):
+                (archive_path / relative_path).mkdir(parents=True)
+                (archive_path / relative_path / "video.ts").write_text("")
+
+            result = get_unconverted_playlists(archive_path, images_path)
+
+            assert result == ["2023/12/31/a", "2024/01/15/a", "2024/01/15/c", "2024/02/01/b"]
+
+    def test_skips_playlist_after_its_ts_files_are_removed(self):
+        """Should stop reporting a playlist once its .ts files are deleted, e.g. by remove_hls_files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            archive_path = tmpdir_path / "archive"
+            images_path = tmpdir_path / "images"
+            playlist_dir = archive_path / "2024" / "01" / "15" / "playlist1"
+
+            playlist_dir.mkdir(parents=True)
+            (playlist_dir / "video.ts").write_text("")
+            assert get_unconverted_playlists(archive_path, images_path) == ["2024/01/15/playlist1"]
+
+            (playlist_dir / "video.ts").unlink()
+
+            assert get_unconverted_playlists(archive_path, images_path) == []
+
 
 class TestConvertPlaylistToPngs:
     """Tests for convert_playlist_to_pngs function."""
@@ -281,6 +337,22 @@ class TestConvertPlaylistToPngs:
                     assert "video-0.png" in calls[0][0][0]
                     assert "video-1.png" in calls[1][0][0]
 
+    def test_names_output_files_with_percent_in_stem(self):
+        """Should keep a literal '%' in the .ts file stem when naming PNG files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            folder_path = tmpdir_path / "input"
+            folder_path.mkdir()
+            (folder_path / "100%d.ts").write_text("dummy")
+
+            mock_cap = create_mock_video_capture([(True, b"frame1"), (False, None)])
+
+            with patch("lab.converter.cv2.VideoCapture", return_value=mock_cap):
+                with patch("lab.converter.cv2.imwrite") as mock_imwrite:
+                    convert_playlist_to_pngs(folder_path, tmpdir_path / "images")
+
+            assert Path(mock_imwrite.call_args[0][0]).name == "100%d-0.png"
+
     def test_starts_frame_index_at_zero(self):
         """Should start frame indexing at 0."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -319,11 +391,10 @@ class TestConvertPlaylistToPngs:
 
                     convert_playlist_to_pngs(folder_path, images_path)
 
-                    # Should be called twice (once for each file), in sorted order
+                    # Should be called twice (once for each file); files may be opened in parallel
                     assert mock_video_capture.call_count == 2
-                    calls = mock_video_capture.call_args_list
-                    assert "video1.ts" in calls[0][0][0]
-                    assert "video2.ts" in calls[1][0][0]
+                    opened = sorted(Path(call[0][0]).name for call in mock_video_capture.call_args_list)
+                    assert opened == ["video1.ts", "video2.ts"]
 
     def test_returns_zero_frames_when_no_ts_files_found(self):
         """Should return 0 frames when no .ts files are found."""
@@ -472,6 +543,70 @@ class TestConvertPlaylistToPngs:
                     assert calls[0][0] == (1, 2, "video1.ts")
                     assert calls[1][0] == (2, 2, "video2.ts")
 
+    def test_samples_every_nth_frame(self):
+        """Should decode and write only every Nth frame, keeping source frame indices in names."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            folder_path = tmpdir_path / "input"
+            images_path = tmpdir_path / "images"
+
+            folder_path.mkdir()
+
+            mock_cap = create_mock_video_capture([(True, f"frame{i}".encode()) for i in range(7)] + [(False, None)])
+
+            with patch("lab.converter.cv2.VideoCapture", return_value=mock_cap):
+                with patch("lab.converter.cv2.imwrite") as mock_imwrite:
+                    (folder_path / "video.ts").write_text("dummy")
+
+                    total_frames = convert_playlist_to_pngs(folder_path, images_path, sample_every=3)
+
+                    assert total_frames == 3
+                    assert mock_cap.grab.call_count == 8
+                    assert mock_cap.retrieve.call_count == 3
+                    names = [Path(call[0][0]).name for call in mock_imwrite.call_args_list]
+                    assert names == ["video-0.png", "video-3.png", "video-6.png"]
+                    assert [call[0][1] for call in mock_imwrite.call_args_list] == [b"frame0", b"frame3", b"frame6"]
+
+    def test_raises_value_error_for_invalid_sample_every(self):
+        """Should reject a sampling interval below 1."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError):
+                convert_playlist_to_pngs(Path(tmpdir), Path(tmpdir) / "images", sample_every=0)
+
+    def test_writes_pngs_with_fast_compression(self):
+        """Should pass the fast PNG compression parameters to imwrite."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            folder_path = tmpdir_path / "input"
+            folder_path.mkdir()
+            (folder_path / "video.ts").write_text("dummy")
+
+            mock_cap = create_mock_video_capture([(True, b"frame1"), (False, None)])
+
+            with patch("lab.converter.cv2.VideoCapture", return_value=mock_cap):
+                with patch("lab.converter.cv2.imwrite") as mock_imwrite:
+                    convert_playlist_to_pngs(folder_path, tmpdir_path / "images")
+
+            assert mock_imwrite.call_args[0][2] == [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
+    def test_opens_video_with_ffmpeg_backend(self):
+        """Should open .ts files with the FFmpeg backend explicitly."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            folder_path = tmpdir_path / "input"
+            folder_path.mkdir()
+            (folder_path / "video.ts").write_text("dummy")
+
+            mock_cap = create_mock_video_capture([(False, None)])
+
+            with patch("lab.converter._CPU_COUNT", 4):
+                with patch("lab.converter.cv2.VideoCapture", return_value=mock_cap) as mock_video_capture:
+                    convert_playlist_to_pngs(folder_path, tmpdir_path / "images")
+
+            mock_video_capture.assert_called_once_with(
+                str(folder_path / "video.ts"), cv2.CAP_FFMPEG, [cv2.CAP_PROP_N_THREADS, 4]
+            )
+
     def test_returns_total_frames_count(self):
         """Should return total number of frames converted."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -482,19 +617,16 @@ class TestConvertPlaylistToPngs:
             folder_path.mkdir()
 
             # First file: 2 frames, second file: 3 frames
-            mock_cap = create_mock_video_capture(
-                [
-                    (True, b"frame1"),
-                    (True, b"frame2"),
-                    (False, None),
-                    (True, b"frame1"),
-                    (True, b"frame2"),
-                    (True, b"frame3"),
-                    (False, None),
-                ]
-            )
-
-            with patch("lab.converter.cv2.VideoCapture", return_value=mock_cap):
+            mock_caps = {
+                "video1.ts": create_mock_video_capture([(True, b"frame1"), (True, b"frame2"), (False, None)]),
+                "video2.ts": create_mock_video_capture(
+                    [(True, b"frame1"), (True, b"frame2"), (True, b"frame3"), (False, None)]
+                ),
+            }
+
+            with patch(
+                "lab.converter.cv2.VideoCapture", side_effect=lambda path, backend, params: mock_caps[Path(path).name]
+            ):
                 with patch("lab.converter.cv2.imwrite"):
                     (folder_path / "video1.ts").write_text("dummy")
                     (folder_path / "video2.ts").write_text("dummy")
@@ -503,6 +635,40 @@ class TestConvertPlaylistToPngs:
 
                     assert total_frames == 5
 
+    def test_converts_files_in_parallel(self):
+        """Should convert several .ts files at the same time and report progress in file order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            folder_path = tmpdir_path / "input"
+            folder_path.mkdir()
+            for name in ("video1.ts", "video2.ts"):
+                (folder_path / name).write_text("dummy")
+
+            # Neither file can be opened until both are being converted at the same time
+            barrier = threading.Barrier(2, timeout=5)
+
+            def open_capture(path, backend, params):
+                barrier.wait()
+                return create_mock_video_capture([(True, b"frame"), (False, None)])
+
+            progress_callback = MagicMock()
+
+            with patch("lab.converter.CONVERT_WORKERS", 2):
+                with patch("lab.converter._CPU_COUNT", 4):
+                    with patch("lab.converter.cv2.VideoCapture", side_effect=open_capture) as mock_video_capture:
+                        with patch("lab.converter.cv2.imwrite"):
+                            frames = convert_playlist_to_pngs(
+                                folder_path, tmpdir_path / "images", on_file_progress=progress_callback
+                            )
+
+            assert frames == 2
+            # The four cores are split between the two concurrent decoders
+            assert all(call[0][2] == [cv2.CAP_PROP_N_THREADS, 2] for call in mock_video_capture.call_args_list)
+            assert [call[0] for call in progress_callback.call_args_list] == [
+                (1, 2, "video1.ts"),
+                (2, 2, "video2.ts"),
+            ]
+
     def test_handles_folder_path_not_under_archive_dir(self):
         """Should handle folder paths not under ARCHIVE_DIR."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,47 @@
+"""Unit tests for the Tk-free background work in lab/gui.py."""
+
+from unittest.mock import Mock
+
+from processor.types import DetectionBox
+
+from lab.exception import UserFacingError
+from lab.gui import LabGUI
+
+
+def create_detection_gui(image_path) -> LabGUI:
+    """Create a LabGUI without a Tk root, holding only the state _run_detection uses."""
+    gui = LabGUI.__new__(LabGUI)
+    gui._LabGUI__detect_image = image_path
+    gui._LabGUI__detect_result = None
+    gui._LabGUI__detect_error = None
+    return gui
+
+
+class TestRunDetection:
+    """Tests for LabGUI._run_detection."""
+
+    def test_run_detection_decodes_annotated_preview(self, data_dir, bird_frame):
+        """Should decode the annotated PNG into an image and record the detected classes."""
+        detector = Mock()
+        detector.detect_boxes.return_value = [DetectionBox(10, 10, 50, 50, 2, 0.9)]
+        gui = create_detection_gui(data_dir / "bird.png")
+
+        gui._run_detection(detector, None, {})
+
+        assert gui._LabGUI__detect_error is None
+        image, detected_classes = gui._LabGUI__detect_result
+        height, width = bird_frame.shape[:2]
+        assert image.size == (width, height)
+        assert detected_classes == {2}
+
+    def test_run_detection_records_user_facing_error(self, data_dir):
+        """Should keep a UserFacingError from detection for the main thread to show."""
+        detector = Mock()
+        detector.detect_boxes.return_value = []
+        gui = create_detection_gui(data_dir / "bird.png")
+
+        gui._run_detection(detector, None, {})
+
+        assert gui._LabGUI__detect_result is None
+        assert isinstance(gui._LabGUI__detect_error, UserFacingError)
+        assert gui._LabGUI__detect_error.title == "No bird detected"
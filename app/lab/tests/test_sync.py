@@ -1,19 +1,31 @@
 """Tests for lab.sync module."""
 
+import io
+import math
+import stat
+import threading
 from datetime import date
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, call, mock_open, patch
 
 import paramiko
 import pytest
 
-from lab.constants import ARCHIVE_DIR, REMOTE_ARCHIVE_PATH
+from lab.constants import ARCHIVE_DIR, IMAGES_DIR, REMOTE_ARCHIVE_PATH
 from lab.sync import (
     ARCHIVE_FOLDER_PATTERN,
-    DATE_FOLDER_PATTERN,
+    EXEC_TIMEOUT,
+    MAX_RETRIES,
+    REMOTE_ARCHIVE_PREFIX,
+    SMALL_FILE_SIZE,
+    TRANSPORT_WINDOW_SIZE,
     FileToSync,
     SyncError,
     SyncManager,
+    _is_archive_folder,
+    _is_date_folder,
+    _load_private_key,
     _remove_empty_date_dirs,
     remove_hls_files,
     remove_recording,
@@ -21,6 +33,56 @@ from lab.sync import (
 )
 
 
+def create_dir_entry(name: str) -> SimpleNamespace:
+    """Create a lightweight DirEntry stand-in with name and path attributes."""
+    return SimpleNamespace(name=name, path=f"/archive/{name}")
+
+
+def create_scandir(entries: list[SimpleNamespace]) -> MagicMock:
+    """Create an os.scandir stand-in that yields entries when used as a context manager."""
+    scandir = MagicMock()
+    scandir.__enter__.return_value = entries
+    return scandir
+
+
+def create_file_attrs(filename: str, size: int = 0) -> paramiko.SFTPAttributes:
+    """Create SFTP attributes as returned by listdir_attr."""
+    attr = paramiko.SFTPAttributes()
+    attr.filename = filename
+    attr.st_mode = stat.S_IFREG | 0o644
+    attr.st_size = size
+    return attr
+
+
+def create_dir_attrs(names: list[str]) -> list[paramiko.SFTPAttributes]:
+    """Create SFTP attributes for directories as returned by listdir_attr."""
+    attrs = []
+    for name in names:
+        attr = paramiko.SFTPAttributes()
+        attr.filename = name
+        attr.st_mode = stat.S_IFDIR | 0o755
+        attrs.append(attr)
+    return attrs
+
+
+def create_config(host: str | None = None, user: str | None = None) -> dict:
+    """Create a parsed config dict with the given SSH target host and user."""
+    config = {}
+    if host is not None:
+        config["ansible_target_host"] = host
+    if user is not None:
+        config["ansible_target_user"] = user
+    return config
+
+
+def create_mock_sftp(data: bytes = b"") -> MagicMock:
+    """Create a mock SFTP client whose open() yields a remote file containing data."""
+    mock_sftp = MagicMock(spec=paramiko.SFTPClient)
+    remote_file = mock_sftp.open.return_value.__enter__.return_value
+    remote_file.read.side_effect = io.BytesIO(data).read
+    return mock_sftp
+
+
 class TestArchiveFolderPattern:
     """Tests for ARCHIVE_FOLDER_PATTERN regex."""
 
@@ -45,19 +107,40 @@ class TestArchiveFolderPattern:
         assert ARCHIVE_FOLDER_PATTERN.match(name)
 
 
-class TestDateFolderPattern:
-    """Tests for DATE_FOLDER_PATTERN regex."""
+class TestIsDateFolder:
+    """Tests for _is_date_folder function."""
 
     def test_matches_numeric_folder(self):
         """Should match numeric folder names."""
-        assert DATE_FOLDER_PATTERN.match("2024")
-        assert DATE_FOLDER_PATTERN.match("01")
-        assert DATE_FOLDER_PATTERN.match("15")
+        assert _is_date_folder("2024")
+        assert _is_date_folder("01")
+        assert _is_date_folder("15")
 
     def test_does_not_match_non_numeric(self):
         """Should not match non-numeric folder names."""
-        assert not DATE_FOLDER_PATTERN.match("january")
-        assert not DATE_FOLDER_PATTERN.match("2024a")
+        assert not _is_date_folder("january")
+        assert not _is_date_folder("2024a")
+
+    def test_does_not_match_empty_too_long_or_non_ascii(self):
+        """Should not match empty names, names longer than a year or non-ASCII digits."""
+        assert not _is_date_folder("")
+        assert not _is_date_folder("20240")
+        assert not _is_date_folder("\u0661\u0662")
+
+
+class TestIsArchiveFolder:
+    """Tests for _is_archive_folder function."""
+
+    def test_matches_archive_folder(self):
+        """Should match archive folder names with and without prefix."""
+        assert _is_archive_folder("2026-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92")
+        assert _is_archive_folder("auto_2026-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92")
+
+    def test_does_not_match_short_or_invalid_names(self):
+        """Should reject names that are too short or do not match the pattern."""
+        assert not _is_archive_folder("playlist1")
+        assert not _is_archive_folder("x" * 60)
+        assert not _is_archive_folder("2026-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d9")
 
 
 class TestFileToSync:
@@ -86,6 +169,19 @@ class TestFileToSync:
         file = FileToSync("2024/01/15/playlist1", "video.ts")
         assert repr(file) == "FileToSync(2024/01/15/playlist1/video.ts)"
 
+    def test_paths_built_once(self):
+        """Should build paths on creation and return the same objects on every access."""
+        file = FileToSync("2024/01/15/playlist1", "video.ts")
+        assert file.local_path is file.local_path
+        assert file.remote_path is file.remote_path
+
+    def test_is_immutable_and_hashable(self):
+        """Should be frozen and usable as a dict key."""
+        file = FileToSync("2024/01/15/playlist1", "video.ts")
+        with pytest.raises(AttributeError):
+            file.filename = "other.ts"  # type: ignore[misc]
+        assert {file: 1}[FileToSync("2024/01/15/playlist1", "video.ts")] == 1
+
 
 class TestSyncManager:
     """Tests for SyncManager class."""
@@ -111,6 +207,32 @@ class TestSyncManager:
                 assert host == "192.168.1.100"
                 assert user == "pi"
 
+    def test_load_config_cached(self):
+        """Should parse the config once and re-read it only after its mtime changes."""
+        with patch("lab.sync.CONFIG_PATH") as mock_config_path:
+            mock_config_path.exists.return_value = True
+            mock_config_path.stat.return_value.st_mtime_ns = 1
+            with patch("lab.sync._parse_config", return_value=create_config("192.168.1.100", "pi")) as mock_parse:
+                manager = SyncManager()
+
+                assert manager._load_config() == ("192.168.1.100", "pi")
+                assert manager._load_config() == ("192.168.1.100", "pi")
+                assert mock_parse.call_count == 1
+
+                mock_config_path.stat.return_value.st_mtime_ns = 2
+                assert manager._load_config() == ("192.168.1.100", "pi")
+                assert mock_parse.call_count == 2
+
+    def test_load_config_empty_file(self):
+        """Should raise SyncError when the config file is empty."""
+        with patch("lab.sync.CONFIG_PATH") as mock_config_path:
+            mock_config_path.exists.return_value = True
+            with patch("builtins.open", mock_open(read_data="")):
+                manager = SyncManager()
+
+                with pytest.raises(SyncError, match="Missing ansible_target_host"):
+                    manager._load_config()
+
     def test_load_config_missing_file(self):
         """Should raise SyncError when config file is missing."""
         with patch("lab.sync.CONFIG_PATH") as mock_config_path:
@@ -124,11 +246,9 @@ class TestSyncManager:
 
     def test_load_config_missing_host(self):
         """Should raise SyncError when host is missing from config."""
-        config_yaml = "ansible_target_user: pi\n"
-
         with patch("lab.sync.CONFIG_PATH") as mock_config_path:
             mock_config_path.exists.return_value = True
-            with patch("builtins.open", mock_open(read_data=config_yaml)):
+            with patch("lab.sync._parse_config", return_value=create_config(user="pi")):
                 manager = SyncManager()
 
                 with pytest.raises(SyncError) as excinfo:
@@ -138,11 +258,9 @@ class TestSyncManager:
 
     def test_load_config_missing_user(self):
         """Should raise SyncError when user is missing from config."""
-        config_yaml = "ansible_target_host: 192.168.1.100\n"
-
         with patch("lab.sync.CONFIG_PATH") as mock_config_path:
             mock_config_path.exists.return_value = True
-            with patch("builtins.open", mock_open(read_data=config_yaml)):
+            with patch("lab.sync._parse_config", return_value=create_config(host="192.168.1.100")):
                 manager = SyncManager()
 
                 with pytest.raises(SyncError) as excinfo:
@@ -157,11 +275,9 @@ class TestSyncManager:
         assert manager._sftp is None
         assert manager._transport is None
 
-    def test_disconnect_closes_sftp(self):
+    def test_disconnect_closes_sftp(self, connected_manager):
         """Should close SFTP connection."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
 
         manager.disconnect()
 
@@ -171,7 +287,7 @@ class TestSyncManager:
     def test_disconnect_closes_transport(self):
         """Should close transport connection."""
         manager = SyncManager()
-        mock_transport = MagicMock()
+        mock_transport = MagicMock(spec=paramiko.Transport)
         manager._transport = mock_transport
 
         manager.disconnect()
@@ -179,56 +295,6 @@ class TestSyncManager:
         mock_transport.close.assert_called_once()
         assert manager._transport is None
 
-    def test_is_dir_not_connected(self):
-        """Should raise SyncError when not connected."""
-        manager = SyncManager()
-
-        with pytest.raises(SyncError) as excinfo:
-            manager._is_dir("/some/path")
-
-        assert "Not connected" in str(excinfo.value)
-
-    def test_is_dir_directory(self):
-        """Should identify directories correctly."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
-
-        # Mock stat result for a directory (mode & 0o40000 != 0)
-        mock_stat = MagicMock()
-        mock_stat.st_mode = 0o40755  # Directory with permissions
-        mock_sftp.stat.return_value = mock_stat
-
-        result = manager._is_dir("/some/path")
-
-        assert result is True
-
-    def test_is_dir_file(self):
-        """Should identify files correctly."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
-
-        # Mock stat result for a file (mode & 0o40000 == 0)
-        mock_stat = MagicMock()
-        mock_stat.st_mode = 0o100644  # Regular file
-        mock_sftp.stat.return_value = mock_stat
-
-        result = manager._is_dir("/some/path")
-
-        assert result is False
-
-    def test_is_dir_path_not_found(self):
-        """Should return False when path is not found."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
-        mock_sftp.stat.side_effect = OSError("File not found")
-
-        result = manager._is_dir("/nonexistent/path")
-
-        assert result is False
-
     def test_connect_ssh_key_not_found(self):
         """Should raise SyncError when SSH key is not found."""
         with patch("lab.sync.SSH_KEY_PATH") as mock_key_path:
@@ -242,24 +308,51 @@ class TestSyncManager:
 
     def test_connect_invalid_ssh_key(self):
         """Should raise SyncError when SSH key is invalid."""
+        calls = []
+
+        def invalid_key(key_type):
+            def side_effect(path):
+                calls.append(key_type)
+                raise paramiko.SSHException("Invalid key")
+
+            return side_effect
+
         with patch("lab.sync.SSH_KEY_PATH") as mock_key_path:
             mock_key_path.exists.return_value = True
-            with patch("lab.sync.paramiko.Ed25519Key.from_private_key_file") as mock_ed25519:
-                mock_ed25519.side_effect = paramiko.SSHException("Invalid key")
+            with patch("lab.sync.paramiko.Ed25519Key.from_private_key_file", side_effect=invalid_key("ed25519")):
+                with patch("lab.sync.paramiko.ECDSAKey.from_private_key_file", side_effect=invalid_key("ecdsa")):
+                    with patch("lab.sync.paramiko.RSAKey.from_private_key_file", side_effect=invalid_key("rsa")):
+                        with patch("lab.sync.CONFIG_PATH") as mock_config_path:
+                            mock_config_path.exists.return_value = True
+                            with patch("lab.sync._parse_config", return_value=create_config("host", "user")):
+                                manager = SyncManager()
+
+                                with pytest.raises(SyncError) as excinfo:
+                                    manager.connect()
+
+                                assert "Failed to load SSH key" in str(excinfo.value)
+                                assert calls == ["ed25519", "ecdsa", "rsa"]
+
+    def test_connect_prefers_ed25519(self):
+        """Should use an Ed25519 key without trying the other key types."""
+        with patch("lab.sync.paramiko.Ed25519Key.from_private_key_file") as mock_ed25519:
+            with patch("lab.sync.paramiko.ECDSAKey.from_private_key_file") as mock_ecdsa:
                 with patch("lab.sync.paramiko.RSAKey.from_private_key_file") as mock_rsa:
-                    mock_rsa.side_effect = paramiko.SSHException("Invalid key")
-                    with patch("lab.sync.CONFIG_PATH") as mock_config_path:
-                        mock_config_path.exists.return_value = True
-                        with patch(
-                            "builtins.open",
-                            mock_open(read_data="ansible_target_host: host\nansible_target_user: user\n"),
-                        ):
-                            manager = SyncManager()
+                    pkey = _load_private_key(Path("/secrets/ssh_key"))
 
-                            with pytest.raises(SyncError) as excinfo:
-                                manager.connect()
+        assert pkey is mock_ed25519.return_value
+        mock_ecdsa.assert_not_called()
+        mock_rsa.assert_not_called()
+
+    def test_connect_falls_back_to_ecdsa(self):
+        """Should use an ECDSA key when the file is not an Ed25519 key."""
+        with patch("lab.sync.paramiko.Ed25519Key.from_private_key_file", side_effect=paramiko.SSHException("Bad")):
+            with patch("lab.sync.paramiko.ECDSAKey.from_private_key_file") as mock_ecdsa:
+                with patch("lab.sync.paramiko.RSAKey.from_private_key_file") as mock_rsa:
+                    pkey = _load_private_key(Path("/secrets/ssh_key"))
 
-                            assert "Failed to load SSH key" in str(excinfo.value)
+        assert pkey is mock_ecdsa.return_value
+        mock_rsa.assert_not_called()
 
     def test_connect_connection_failed(self):
         """Should raise SyncError when connection fails."""
@@ -270,10 +363,7 @@ class TestSyncManager:
                     mock_transport.return_value.connect.side_effect = Exception("Connection refused")
                     with patch("lab.sync.CONFIG_PATH") as mock_config_path:
                         mock_config_path.exists.return_value = True
-                        with patch(
-                            "builtins.open",
-                            mock_open(read_data="ansible_target_host: host\nansible_target_user: user\n"),
-                        ):
+                        with patch("lab.sync._parse_config", return_value=create_config("host", "user")):
                             manager = SyncManager()
 
                             with pytest.raises(SyncError) as excinfo:
@@ -281,44 +371,63 @@ class TestSyncManager:
 
                             assert "Failed to connect" in str(excinfo.value)
 
-    def test_connect_success(self):
-        """Should establish connection successfully."""
+    @pytest.mark.parametrize("env, compress", [({"SYNC_COMPRESS": "1"}, True), ({}, False)])
+    def test_connect_enables_compression_when_env_set(self, env, compress):
+        """Should request SSH compression before the handshake only when SYNC_COMPRESS=1."""
+        manager = SyncManager()
+
         with patch("lab.sync.SSH_KEY_PATH") as mock_key_path:
             mock_key_path.exists.return_value = True
-            with patch("lab.sync.paramiko.Ed25519Key.from_private_key_file") as mock_ed25519:
-                with patch("lab.sync.socket.create_connection") as mock_socket:
-                    with patch("lab.sync.paramiko.Transport") as mock_transport_class:
-                        with patch("lab.sync.paramiko.SFTPClient.from_transport") as mock_sftp_from_transport:
-                            with patch("lab.sync.CONFIG_PATH") as mock_config_path:
-                                mock_config_path.exists.return_value = True
-
-                                # Setup mocks
-                                mock_pkey = MagicMock()
-                                mock_ed25519.return_value = mock_pkey
-                                mock_sock = MagicMock()
-                                mock_socket.return_value = mock_sock
-                                mock_transport = MagicMock()
-                                mock_transport_class.return_value = mock_transport
-                                mock_sftp = MagicMock()
-                                mock_sftp_from_transport.return_value = mock_sftp
-                                mock_channel = MagicMock()
-                                mock_sftp.get_channel.return_value = mock_channel
-
-                                with patch(
-                                    "builtins.open",
-                                    mock_open(
-                                        read_data="ansible_target_host: testhost\nansible_target_user: testuser\n"
-                                    ),
-                                ):
-                                    manager = SyncManager()
+            with patch.object(manager, "_load_config", return_value=("testhost", "testuser")):
+                with patch("lab.sync.paramiko.Ed25519Key.from_private_key_file"):
+                    with patch("lab.sync.socket.create_connection"):
+                        with patch("lab.sync.paramiko.Transport") as mock_transport_class:
+                            with patch("lab.sync.paramiko.SFTPClient.from_transport"):
+                                with patch.dict("lab.sync.os.environ", env, clear=True):
                                     manager.connect()
 
-                                    # Verify connection was established
-                                    assert manager._sftp == mock_sftp
-                                    assert manager._transport == mock_transport
-                                    assert manager._socket == mock_sock
-                                    assert manager._host == "testhost"
-                                    assert manager._user == "testuser"
+        mock_transport = mock_transport_class.return_value
+        if compress:
+            mock_transport.use_compression.assert_called_once_with(True)
+            calls = [name for name, _, _ in mock_transport.method_calls]
+            assert calls.index("use_compression") < calls.index("connect")
+        else:
+            mock_transport.use_compression.assert_not_called()
+
+    def test_connect_success(self):
+        """Should establish connection successfully."""
+        with patch.multiple(
+            "lab.sync",
+            SSH_KEY_PATH=DEFAULT,
+            CONFIG_PATH=DEFAULT,
+            paramiko=DEFAULT,
+            socket=DEFAULT,
+            _parse_config=DEFAULT,
+        ) as mocks:
+            mocks["SSH_KEY_PATH"].exists.return_value = True
+            mocks["CONFIG_PATH"].exists.return_value = True
+            mocks["_parse_config"].return_value = create_config("testhost", "testuser")
+            mock_socket = mocks["socket"]
+            mock_sock = mock_socket.create_connection.return_value
+            mock_transport_class = mocks["paramiko"].Transport
+            mock_sftp = mocks["paramiko"].SFTPClient.from_transport.return_value
+
+            manager = SyncManager()
+            manager.connect()
+
+        # Verify connection was established
+        assert manager._sftp == mock_sftp
+        assert manager._transport == mock_transport_class.return_value
+        assert manager._socket == mock_sock
+        assert manager._host == "testhost"
+        assert manager._user == "testuser"
+        mock_transport_class.return_value.connect.assert_called_once_with(
+            username="testuser", pkey=mocks["paramiko"].Ed25519Key.from_private_key_file.return_value
+        )
+
+        # Verify transfer tuning
+        mock_sock.setsockopt.assert_called_once_with(mock_socket.IPPROTO_TCP, mock_socket.TCP_NODELAY, 1)
+        mock_transport_class.assert_called_once_with(mock_sock, default_window_size=TRANSPORT_WINDOW_SIZE)
 
     def test_list_remote_archive_folders_not_connected(self):
         """Should raise SyncError when not connected."""
@@ -329,137 +438,216 @@ class TestSyncManager:
 
         assert "Not connected" in str(excinfo.value)
 
-    def test_list_remote_archive_folders_cannot_list(self):
+    def test_list_remote_archive_folders_cannot_list(self, connected_manager):
         """Should raise SyncError when cannot list remote archive."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
-        mock_sftp.listdir.side_effect = OSError("Permission denied")
+        manager, mock_sftp = connected_manager
+        mock_sftp.listdir_attr.side_effect = OSError("Permission denied")
 
         with pytest.raises(SyncError) as excinfo:
             manager._list_remote_archive_folders()
 
         assert "Cannot list remote archive" in str(excinfo.value)
 
-    def test_list_remote_archive_folders_success(self):
+    def test_list_remote_archive_folders_success(self, connected_manager):
         """Should list remote archive folders successfully."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
 
         # Mock the nested directory structure
-        mock_sftp.listdir.side_effect = [
-            ["2024"],  # years
-            ["01"],  # months in 2024
-            ["15"],  # days in 01/2024
-            [  # folders in 15/01/2024
-                "auto_2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92",
-                "sync_2024-01-15T123000Z_1a2b3c4d-5e6f-4d9b-82f5-1a2b3c4d5e6f",
-            ],
+        mock_sftp.listdir_attr.side_effect = [
+            create_dir_attrs(["2024"]),  # years
+            create_dir_attrs(["01"]),  # months in 2024
+            create_dir_attrs(["15"]),  # days in 01/2024
+            create_dir_attrs(
+                [  # folders in 15/01/2024
+                    "auto_2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92",
+                    "sync_2024-01-15T123000Z_1a2b3c4d-5e6f-4d9b-82f5-1a2b3c4d5e6f",
+                ]
+            ),
         ]
 
-        # Mock _is_dir to return True for directories
-        manager._is_dir = MagicMock(return_value=True)
-
         folders = manager._list_remote_archive_folders()
 
         assert len(folders) == 2
         assert "2024/01/15/auto_2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92" in folders
         assert "2024/01/15/sync_2024-01-15T123000Z_1a2b3c4d-5e6f-4d9b-82f5-1a2b3c4d5e6f" in folders
 
-    def test_list_remote_archive_folders_filters_non_numeric(self):
+    def test_list_remote_archive_folders_filters_non_numeric(self, connected_manager):
         """Should filter out non-numeric year/month/day folders."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
 
         # Mock with some non-numeric directories
-        mock_sftp.listdir.side_effect = [
-            ["2024", "backup"],  # "backup" should be filtered
-            ["01", "february"],  # "february" should be filtered
-            ["15"],  # valid day
-            ["2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92"],
+        mock_sftp.listdir_attr.side_effect = [
+            create_dir_attrs(["2024", "backup"]),  # "backup" should be filtered
+            create_dir_attrs(["01", "february"]),  # "february" should be filtered
+            create_dir_attrs(["15"]),  # valid day
+            create_dir_attrs(["2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92"]),
         ]
 
-        manager._is_dir = MagicMock(return_value=True)
-
         folders = manager._list_remote_archive_folders()
 
         # Should only include valid path
         assert len(folders) == 1
         assert "2024/01/15/2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92" in folders
 
-    def test_list_remote_archive_folders_filters_non_archives(self):
+    def test_list_remote_archive_folders_filters_non_archives(self, connected_manager):
         """Should filter out folders that don't match archive pattern."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
 
         # Mock with valid directory structure but invalid archive folder names
-        mock_sftp.listdir.side_effect = [
-            ["2024"],
-            ["01"],
-            ["15"],
-            ["not_an_archive", "2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92"],
+        mock_sftp.listdir_attr.side_effect = [
+            create_dir_attrs(["2024"]),
+            create_dir_attrs(["01"]),
+            create_dir_attrs(["15"]),
+            create_dir_attrs(["not_an_archive", "2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92"]),
         ]
 
-        manager._is_dir = MagicMock(return_value=True)
-
         folders = manager._list_remote_archive_folders()
 
         # Should only include valid archive folder
         assert len(folders) == 1
         assert "2024/01/15/2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92" in folders
 
-    def test_list_remote_archive_folders_skips_files(self):
+    def test_list_remote_archive_folders_skips_files(self, connected_manager):
         """Should skip files and only process directories."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
 
-        mock_sftp.listdir.side_effect = [
-            ["2024"],
-            ["01"],
-            ["15"],
-            ["2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92", "readme.txt"],
+        mock_sftp.listdir_attr.side_effect = [
+            create_dir_attrs(["2024"]),
+            create_dir_attrs(["01"]),
+            create_dir_attrs(["15"]),
+            # A file whose name matches the archive pattern must still be skipped
+            create_dir_attrs(["2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92"])
+            + [create_file_attrs("2024-01-15T080000Z_1a2b3c4d-5e6f-4d9b-82f5-1a2b3c4d5e6f")],
         ]
 
-        # Mock _is_dir to return True for archive, False for readme.txt
-        def is_dir_side_effect(path):
-            return "readme.txt" not in path
-
-        manager._is_dir = MagicMock(side_effect=is_dir_side_effect)
-
         folders = manager._list_remote_archive_folders()
 
         # Should only include directory, not file
         assert len(folders) == 1
         assert "2024/01/15/2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92" in folders
 
-    def test_get_files_to_sync_not_connected(self):
+    def test_list_remote_archive_folders_uses_exec_find(self, connected_manager):
+        """Should list archive folders with a single remote find when exec is available."""
+        manager, mock_sftp = connected_manager
+        mock_transport = MagicMock(spec=paramiko.Transport)
+        manager._transport = mock_transport
+        mock_channel = mock_transport.open_session.return_value
+        output = "\0".join(
+            [
+                f"{REMOTE_ARCHIVE_PREFIX}2024/01/15/auto_2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92",
+                f"{REMOTE_ARCHIVE_PREFIX}2024/01/15/not_an_archive",
+                f"{REMOTE_ARCHIVE_PREFIX}backup/01/15/2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92",
+                f"{REMOTE_ARCHIVE_PREFIX}2024/01/16/2024-01-16T080000Z_1a2b3c4d-5e6f-4d9b-82f5-1a2b3c4d5e6f",
+                "",
+            ]
+        ).encode()
+        # Output may arrive split across several recv calls
+        mock_channel.recv.side_effect = [output[:50], output[50:], b""]
+        mock_channel.recv_exit_status.return_value = 0
+
+        folders = manager._list_remote_archive_folders()
+
+        assert folders == [
+            "2024/01/15/auto_2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92",
+            "2024/01/16/2024-01-16T080000Z_1a2b3c4d-5e6f-4d9b-82f5-1a2b3c4d5e6f",
+        ]
+        command = mock_channel.exec_command.call_args[0][0]
+        assert command.startswith(f"find {REMOTE_ARCHIVE_PATH} -mindepth 4 -maxdepth 4 -type d -print0")
+        mock_sftp.listdir_attr.assert_not_called()
+
+    def test_list_remote_archive_folders_skips_undecodable_names(self, connected_manager):
+        """Should ignore folder names that are not valid UTF-8 instead of failing the listing."""
+        manager, _mock_sftp = connected_manager
+        mock_transport = MagicMock(spec=paramiko.Transport)
+        manager._transport = mock_transport
+        mock_channel = mock_transport.open_session.return_value
+        valid = f"{REMOTE_ARCHIVE_PREFIX}2024/01/16/2024-01-16T080000Z_1a2b3c4d-5e6f-4d9b-82f5-1a2b3c4d5e6f"
+        mock_channel.recv.side_effect = [
+            f"{REMOTE_ARCHIVE_PREFIX}2024/01/15/".encode() + b"bad\xff\0" + valid.encode() + b"\0",
+            b"",
+        ]
+        mock_channel.recv_exit_status.return_value = 0
+
+        folders = manager._list_remote_archive_folders()
+
+        assert folders == ["2024/01/16/2024-01-16T080000Z_1a2b3c4d-5e6f-4d9b-82f5-1a2b3c4d5e6f"]
+
+    def test_exec_remote_command_times_out(self):
+        """Should give up on a stalled exec channel and let the caller fall back to SFTP."""
+        manager = SyncManager()
+        mock_transport = MagicMock(spec=paramiko.Transport)
+        manager._transport = mock_transport
+        mock_channel = mock_transport.open_session.return_value
+        mock_channel.recv.side_effect = TimeoutError()
+
+        with patch("builtins.print"):
+            result = manager._exec_remote_command("true")
+
+        assert result is None
+        mock_channel.settimeout.assert_called_once_with(EXEC_TIMEOUT)
+        mock_channel.close.assert_called_once()
+        assert manager._exec_supported is True
+
+    def test_list_remote_archive_folders_falls_back_to_sftp(self, connected_manager):
+        """Should walk the tree over SFTP when the remote find fails."""
+        manager, mock_sftp = connected_manager
+        mock_transport = MagicMock(spec=paramiko.Transport)
+        manager._transport = mock_transport
+        mock_transport.open_session.return_value.recv.return_value = b""
+        mock_transport.open_session.return_value.recv_exit_status.return_value = 1
+
+        mock_sftp.listdir_attr.side_effect = [
+            create_dir_attrs(["2024"]),
+            create_dir_attrs(["01"]),
+            create_dir_attrs(["15"]),
+            create_dir_attrs(["2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92"]),
+        ]
+
+        folders = manager._list_remote_archive_folders()
+
+        assert folders == ["2024/01/15/2024-01-15T064557Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92"]
+
+    def test_list_remote_archive_folders_does_not_stat_entries(self, connected_manager):
+        """Should read entry modes from the listing instead of stat-ing each entry."""
+        manager, mock_sftp = connected_manager
+
+        archive_folders = [f"2024-01-15T0{i}0000Z_5d83d036-3f12-4d9b-82f5-4d7eb1ab0d92" for i in range(4)]
+        mock_sftp.listdir_attr.side_effect = [
+            create_dir_attrs(["2024"]),
+            create_dir_attrs(["01"]),
+            create_dir_attrs(["15"]),
+            create_dir_attrs(archive_folders),
+        ]
+
+        folders = manager._list_remote_archive_folders()
+
+        assert folders == [f"2024/01/15/{folder}" for folder in archive_folders]
+        assert mock_sftp.listdir_attr.call_count == 4
+        mock_sftp.stat.assert_not_called()
+        mock_sftp.lstat.assert_not_called()
+
+    def test_get_file_attrs_to_sync_not_connected(self):
         """Should raise SyncError when not connected."""
         manager = SyncManager()
 
         with pytest.raises(SyncError) as excinfo:
-            manager._get_files_to_sync("2024/01/15/playlist1")
+            manager._get_file_attrs_to_sync("2024/01/15/playlist1")
 
         assert "Not connected" in str(excinfo.value)
 
-    def test_get_files_to_sync_returns_ts_and_m3u8_files(self):
+    def test_get_file_attrs_to_sync_returns_ts_and_m3u8_files(self, connected_manager):
         """Should return .ts and .m3u8 files only."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
-
-        mock_sftp.listdir.return_value = [
-            "video.ts",
-            "playlist.m3u8",
-            "readme.txt",
-            "index.html",
-            "segment1.ts",
+        manager, mock_sftp = connected_manager
+
+        mock_sftp.listdir_attr.return_value = [
+            create_file_attrs("video.ts"),
+            create_file_attrs("playlist.m3u8"),
+            create_file_attrs("readme.txt"),
+            create_file_attrs("index.html"),
+            create_file_attrs("segment1.ts"),
         ]
 
-        files = manager._get_files_to_sync("2024/01/15/playlist1")
+        files = [attr.filename for attr in manager._get_file_attrs_to_sync("2024/01/15/playlist1")]
 
         assert len(files) == 3
         assert "video.ts" in files
@@ -467,14 +655,12 @@ class TestSyncManager:
         assert "segment1.ts" in files
         assert "readme.txt" not in files
 
-    def test_get_files_to_sync_handles_error(self):
+    def test_get_file_attrs_to_sync_handles_error(self, connected_manager):
         """Should return empty list when listdir fails."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
-        mock_sftp.listdir.side_effect = OSError("Permission denied")
+        manager, mock_sftp = connected_manager
+        mock_sftp.listdir_attr.side_effect = OSError("Permission denied")
 
-        files = manager._get_files_to_sync("2024/01/15/playlist1")
+        files = manager._get_file_attrs_to_sync("2024/01/15/playlist1")
 
         assert files == []
 
@@ -489,16 +675,8 @@ class TestSyncManager:
                 "2024/01/16/playlist2",
             ]
 
-            # Mock Path objects: playlist1 exists, playlist2 doesn't
-            mock_path1 = MagicMock()
-            mock_path1.exists.return_value = True
-
-            mock_path2 = MagicMock()
-            mock_path2.exists.return_value = False
-
-            with patch("lab.sync.ARCHIVE_DIR") as mock_archive_dir:
-                mock_archive_dir.__truediv__.side_effect = [mock_path1, mock_path2]
-
+            # playlist1 exists locally, playlist2 doesn't
+            with patch.object(manager, "_list_local_archive_folders", return_value=frozenset({"2024/01/15/playlist1"})):
                 missing = manager.get_missing_folders()
 
                 assert len(missing) == 1
@@ -515,17 +693,8 @@ class TestSyncManager:
                 "2024/01/17/playlist3",
             ]
 
-            # All folders don't exist locally
-            mock_path1 = MagicMock()
-            mock_path1.exists.return_value = False
-            mock_path2 = MagicMock()
-            mock_path2.exists.return_value = False
-            mock_path3 = MagicMock()
-            mock_path3.exists.return_value = False
-
-            with patch("lab.sync.ARCHIVE_DIR") as mock_archive_dir:
-                mock_archive_dir.__truediv__.side_effect = [mock_path1, mock_path2, mock_path3]
-
+            # No folders exist locally
+            with patch.object(manager, "_list_local_archive_folders", return_value=frozenset()):
                 # Only folders on or after 2024-01-16 should be included
                 missing = manager.get_missing_folders(from_date=date(2024, 1, 16))
 
@@ -545,17 +714,8 @@ class TestSyncManager:
                 "2024/01/17/playlist3",
             ]
 
-            # All folders don't exist locally
-            mock_path1 = MagicMock()
-            mock_path1.exists.return_value = False
-            mock_path2 = MagicMock()
-            mock_path2.exists.return_value = False
-            mock_path3 = MagicMock()
-            mock_path3.exists.return_value = False
-
-            with patch("lab.sync.ARCHIVE_DIR") as mock_archive_dir:
-                mock_archive_dir.__truediv__.side_effect = [mock_path1, mock_path2, mock_path3]
-
+            # No folders exist locally
+            with patch.object(manager, "_list_local_archive_folders", return_value=frozenset()):
                 # Only folders on or before 2024-01-16 should be included
                 missing = manager.get_missing_folders(to_date=date(2024, 1, 16))
 
@@ -576,14 +736,8 @@ class TestSyncManager:
                 "2024/01/18/playlist4",
             ]
 
-            # All folders don't exist locally
-            mock_paths = [MagicMock() for _ in range(4)]
-            for mock_path in mock_paths:
-                mock_path.exists.return_value = False
-
-            with patch("lab.sync.ARCHIVE_DIR") as mock_archive_dir:
-                mock_archive_dir.__truediv__.side_effect = mock_paths
-
+            # No folders exist locally
+            with patch.object(manager, "_list_local_archive_folders", return_value=frozenset()):
                 # Only folders between 2024-01-16 and 2024-01-17 should be included
                 missing = manager.get_missing_folders(
                     from_date=date(2024, 1, 16),
@@ -606,14 +760,8 @@ class TestSyncManager:
                 "2024/01/15/playlist2",  # Valid date format
             ]
 
-            mock_path1 = MagicMock()
-            mock_path1.exists.return_value = False
-            mock_path2 = MagicMock()
-            mock_path2.exists.return_value = False
-
-            with patch("lab.sync.ARCHIVE_DIR") as mock_archive_dir:
-                mock_archive_dir.__truediv__.side_effect = [mock_path1, mock_path2]
-
+            # No folders exist locally
+            with patch.object(manager, "_list_local_archive_folders", return_value=frozenset()):
                 # When from_date is set but folder has invalid date format,
                 # it's included because the date filter skips invalid dates
                 missing = manager.get_missing_folders(from_date=date(2024, 1, 15))
@@ -622,6 +770,27 @@ class TestSyncManager:
                 assert "invalid/folder/path/playlist1" in missing
                 assert "2024/01/15/playlist2" in missing
 
+    def test_list_local_archive_folders(self, tmp_path):
+        """Should list every {year}/{month}/{day}/{folder} entry in the local archive."""
+        (tmp_path / "2024/01/15/playlist1").mkdir(parents=True)
+        (tmp_path / "2024/01/15/playlist2").mkdir(parents=True)
+        (tmp_path / "2024/02/01/playlist3").mkdir(parents=True)
+        # Files above the folder level are not descended into
+        (tmp_path / "2024/notes.txt").write_text("")
+        manager = SyncManager()
+
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            folders = manager._list_local_archive_folders()
+
+        assert folders == {"2024/01/15/playlist1", "2024/01/15/playlist2", "2024/02/01/playlist3"}
+
+    def test_list_local_archive_folders_missing_archive(self, tmp_path):
+        """Should return an empty set when the local archive does not exist."""
+        manager = SyncManager()
+
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path / "missing"):
+            assert manager._list_local_archive_folders() == frozenset()
+
     def test_sync_folder_not_connected(self):
         """Should raise SyncError when not connected."""
         manager = SyncManager()
@@ -631,33 +800,27 @@ class TestSyncManager:
 
         assert "Not connected" in str(excinfo.value)
 
-    def test_sync_folder_no_files(self):
+    def test_sync_folder_no_files(self, connected_manager):
         """Should return 0 when no files to sync."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
 
-        with patch.object(manager, "_get_files_to_sync") as mock_get_files:
+        with patch.object(manager, "_get_file_attrs_to_sync") as mock_get_files:
             mock_get_files.return_value = []
 
             files_synced = manager.sync_folder("2024/01/15/playlist1")
 
             assert files_synced == 0
 
-    def test_sync_folder_calls_callback(self):
+    def test_sync_folder_calls_callback(self, tmp_path):
         """Should call progress callback for each file."""
         manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager._sftp = create_mock_sftp()
 
         progress_callback = MagicMock()
 
-        with patch.object(manager, "_get_files_to_sync") as mock_get_files:
-            mock_get_files.return_value = ["video1.ts", "video2.ts"]
-            with patch("lab.sync.ARCHIVE_DIR") as mock_archive_dir:
-                mock_local_folder = MagicMock()
-                mock_archive_dir.__truediv__.return_value = mock_local_folder
-
+        with patch.object(manager, "_get_file_attrs_to_sync") as mock_get_files:
+            mock_get_files.return_value = [create_file_attrs("video1.ts"), create_file_attrs("video2.ts")]
+            with patch("lab.sync.ARCHIVE_DIR", tmp_path):
                 files_synced = manager.sync_folder(
                     "2024/01/15/playlist1",
                     on_file_progress=progress_callback,
@@ -665,16 +828,33 @@ class TestSyncManager:
 
                 assert files_synced == 2
                 assert progress_callback.call_count == 2
+                assert (tmp_path / "2024/01/15/playlist1" / "video1.ts").exists()
 
-    def test_sync_folder_download_failure(self):
-        """Should raise SyncError when download fails."""
+    def test_sync_folder_uses_pipelined_read(self, tmp_path):
+        """Should download through a pipelined, prefetched remote file instead of sftp.get."""
         manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
-        mock_sftp.get.side_effect = OSError("Connection lost")
+        manager._sftp = create_mock_sftp(b"segment data")
+        remote_file = manager._sftp.open.return_value.__enter__.return_value
+
+        with patch.object(
+            manager, "_get_file_attrs_to_sync", return_value=[create_file_attrs("video.ts", SMALL_FILE_SIZE + 1)]
+        ):
+            with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+                manager.sync_folder("2024/01/15/playlist1")
+
+        manager._sftp.open.assert_called_once_with(f"{REMOTE_ARCHIVE_PATH}/2024/01/15/playlist1/video.ts", "rb")
+        remote_file.set_pipelined.assert_called_once_with(True)
+        assert remote_file.prefetch.called
+        assert not manager._sftp.get.called
+        assert (tmp_path / "2024/01/15/playlist1" / "video.ts").read_bytes() == b"segment data"
+
+    def test_sync_folder_download_failure(self, connected_manager):
+        """Should raise SyncError when download fails."""
+        manager, mock_sftp = connected_manager
+        mock_sftp.open.side_effect = OSError("Connection lost")
 
-        with patch.object(manager, "_get_files_to_sync") as mock_get_files:
-            mock_get_files.return_value = ["video.ts"]
+        with patch.object(manager, "_get_file_attrs_to_sync") as mock_get_files:
+            mock_get_files.return_value = [create_file_attrs("video.ts")]
             with patch("lab.sync.ARCHIVE_DIR") as mock_archive_dir:
                 mock_local_folder = MagicMock()
                 mock_archive_dir.__truediv__.return_value = mock_local_folder
@@ -689,14 +869,14 @@ class TestSyncManager:
         manager = SyncManager()
 
         with patch.object(manager, "get_missing_folders") as mock_get_missing:
-            with patch.object(manager, "_get_files_to_sync") as mock_get_files:
+            with patch.object(manager, "_get_file_attrs_to_sync") as mock_get_files:
                 mock_get_missing.return_value = ["2024/01/15/playlist1", "2024/01/16/playlist2"]
 
                 def get_files_side_effect(folder):
                     if "playlist1" in folder:
-                        return ["video1.ts", "playlist.m3u8"]
+                        return [create_file_attrs("video1.ts"), create_file_attrs("playlist.m3u8")]
                     else:
-                        return ["video2.ts"]
+                        return [create_file_attrs("video2.ts")]
 
                 mock_get_files.side_effect = get_files_side_effect
 
@@ -707,6 +887,18 @@ class TestSyncManager:
                 assert any(f.filename == "video2.ts" for f in files)
                 assert any(f.filename == "playlist.m3u8" for f in files)
 
+    def test_gather_keeps_remote_sizes(self):
+        """Should carry the size from the folder listing into each FileToSync."""
+        manager = SyncManager()
+
+        with patch.object(manager, "get_missing_folders", return_value=["2024/01/15/playlist1"]):
+            with patch.object(manager, "_get_file_attrs_to_sync") as mock_get_files:
+                mock_get_files.return_value = [create_file_attrs("video1.ts", 100)]
+
+                files = manager._gather_files_to_sync()
+
+        assert [(f.filename, f.size) for f in files] == [("video1.ts", 100)]
+
     def test_reconnect(self):
         """Should disconnect and reconnect to server."""
         manager = SyncManager()
@@ -719,38 +911,138 @@ class TestSyncManager:
                     mock_disconnect.assert_called_once()
                     mock_connect.assert_called_once()
 
-    def test_download_file_with_retry_success(self):
+    def test_soft_reconnect_reuses_transport(self):
+        """Should reopen only the SFTP client when the transport is still active."""
+        manager = SyncManager()
+        old_sftp = MagicMock(spec=paramiko.SFTPClient)
+        mock_transport = MagicMock(spec=paramiko.Transport)
+        mock_transport.is_active.return_value = True
+        manager._sftp = old_sftp
+        manager._transport = mock_transport
+        new_sftp = MagicMock(spec=paramiko.SFTPClient)
+
+        with patch("lab.sync.paramiko.SFTPClient.from_transport", return_value=new_sftp) as mock_from_transport:
+            with patch("lab.sync.paramiko.Transport") as mock_transport_class:
+                with patch.object(manager, "_reconnect") as mock_reconnect:
+                    with patch("builtins.print"):
+                        manager._soft_reconnect()
+
+        mock_from_transport.assert_called_once_with(mock_transport)
+        mock_transport_class.assert_not_called()
+        mock_reconnect.assert_not_called()
+        old_sftp.close.assert_called_once()
+        assert manager._sftp is new_sftp
+        assert manager._transport is mock_transport
+
+    def test_hard_reconnect_on_dead_transport(self):
+        """Should fall back to a full reconnect when the transport is no longer active."""
+        manager = SyncManager()
+        mock_transport = MagicMock(spec=paramiko.Transport)
+        mock_transport.is_active.return_value = False
+        manager._transport = mock_transport
+
+        with patch("lab.sync.paramiko.SFTPClient.from_transport") as mock_from_transport:
+            with patch.object(manager, "_reconnect") as mock_reconnect:
+                manager._soft_reconnect()
+
+        mock_reconnect.assert_called_once()
+        mock_from_transport.assert_not_called()
+
+    def test_download_file_with_retry_keeps_live_transport(self, tmp_path):
+        """Should reopen the SFTP client on the same transport after a transient error."""
+        manager = SyncManager()
+        failing_sftp = create_mock_sftp()
+        failing_sftp.open.side_effect = paramiko.SSHException("Channel closed")
+        working_sftp = create_mock_sftp(b"segment data")
+        mock_transport = MagicMock(spec=paramiko.Transport)
+        mock_transport.is_active.return_value = True
+        manager._sftp = failing_sftp
+        manager._transport = mock_transport
+
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            file = FileToSync("2024/01/15/playlist1", "video.ts")
+
+            with patch("lab.sync.paramiko.SFTPClient.from_transport", return_value=working_sftp):
+                with patch.object(manager, "_reconnect") as mock_reconnect:
+                    with patch("lab.sync.time.sleep"):
+                        with patch("builtins.print"):
+                            manager._download_file_with_retry(file)
+
+            assert file.local_path.read_bytes() == b"segment data"
+
+        mock_reconnect.assert_not_called()
+        mock_transport.close.assert_not_called()
+        failing_sftp.close.assert_called_once()
+        assert manager._transport is mock_transport
+
+    def test_download_file_with_retry_success(self, tmp_path):
         """Should successfully download file on first attempt."""
         manager = SyncManager()
-        mock_sftp = MagicMock()
+        mock_sftp = create_mock_sftp(b"segment data")
         manager._sftp = mock_sftp
 
-        file = FileToSync("2024/01/15/playlist1", "video.ts")
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            file = FileToSync("2024/01/15/playlist1", "video.ts")
+
+            manager._download_file_with_retry(file)
+
+            mock_sftp.open.assert_called_once_with(file.remote_path, "rb")
+            assert file.local_path.read_bytes() == b"segment data"
+
+    def test_download_uses_pipelined_read(self, tmp_path):
+        """Should enable pipelining and prefetch on the remote file handle."""
+        manager = SyncManager()
+        mock_sftp = create_mock_sftp(b"segment data")
+        manager._sftp = mock_sftp
+        remote_file = mock_sftp.open.return_value.__enter__.return_value
+
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            manager._download_file_with_retry(FileToSync("2024/01/15/playlist1", "video.ts"))
 
-        with patch("lab.sync.ARCHIVE_DIR") as mock_archive_dir:
-            mock_local_path = MagicMock()
-            mock_local_path.parent = MagicMock()
-            mock_archive_dir.__truediv__.return_value = mock_local_path
+        remote_file.set_pipelined.assert_called_with(True)
+        assert remote_file.prefetch.called
 
+    def test_download_prefetches_known_size(self, tmp_path):
+        """Should pass the already-listed remote size to prefetch instead of stat-ing the file again."""
+        manager = SyncManager()
+        mock_sftp = create_mock_sftp(b"segment data")
+        manager._sftp = mock_sftp
+        remote_file = mock_sftp.open.return_value.__enter__.return_value
+
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            manager._download_file_with_retry(FileToSync("2024/01/15/playlist1", "video.ts", size=SMALL_FILE_SIZE + 1))
+
+        remote_file.prefetch.assert_called_once_with(SMALL_FILE_SIZE + 1)
+
+    def test_download_small_file_fast_path(self, tmp_path):
+        """Should fetch a small file with a single read instead of prefetching it."""
+        manager = SyncManager()
+        mock_sftp = create_mock_sftp(b"#EXTM3U\n" * 128)
+        manager._sftp = mock_sftp
+        remote_file = mock_sftp.open.return_value.__enter__.return_value
+
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            file = FileToSync("2024/01/15/playlist1", "playlist.m3u8", size=1024)
             manager._download_file_with_retry(file)
 
-            assert mock_sftp.get.called
+            assert file.local_path.read_bytes() == b"#EXTM3U\n" * 128
+
+        remote_file.read.assert_called_once_with(1024)
+        remote_file.prefetch.assert_not_called()
+        mock_sftp.stat.assert_not_called()
+        mock_sftp.get.assert_not_called()
 
-    def test_download_file_with_retry_fails_and_reconnects(self):
+    def test_download_file_with_retry_fails_and_reconnects(self, tmp_path):
         """Should reconnect and retry on download failure."""
         manager = SyncManager()
-        mock_sftp = MagicMock()
+        mock_sftp = create_mock_sftp(b"segment data")
         manager._sftp = mock_sftp
 
         # First call fails, second succeeds
-        mock_sftp.get.side_effect = [Exception("Connection lost"), None]
-
-        file = FileToSync("2024/01/15/playlist1", "video.ts")
+        mock_sftp.open.side_effect = [OSError("Connection lost"), mock_sftp.open.return_value]
 
-        with patch("lab.sync.ARCHIVE_DIR") as mock_archive_dir:
-            mock_local_path = MagicMock()
-            mock_local_path.parent = MagicMock()
-            mock_archive_dir.__truediv__.return_value = mock_local_path
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            file = FileToSync("2024/01/15/playlist1", "video.ts")
 
             with patch.object(manager, "_reconnect") as mock_reconnect:
                 # After reconnect, update sftp
@@ -759,10 +1051,116 @@ class TestSyncManager:
 
                 mock_reconnect.side_effect = reconnect_side_effect
 
-                manager._download_file_with_retry(file)
+                with patch("builtins.print"):
+                    manager._download_file_with_retry(file)
 
                 mock_reconnect.assert_called_once()
-                assert mock_sftp.get.call_count == 2
+                assert mock_sftp.open.call_count == 2
+                assert file.local_path.read_bytes() == b"segment data"
+
+    def test_download_retries_with_backoff(self, tmp_path):
+        """Should double the delay between attempts, capped at MAX_RETRY_DELAY."""
+        manager = SyncManager()
+        mock_sftp = create_mock_sftp()
+        manager._sftp = mock_sftp
+        mock_sftp.open.side_effect = OSError("Connection lost")
+
+        def reconnect_side_effect():
+            manager._sftp = mock_sftp
+
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            file = FileToSync("2024/01/15/playlist1", "video.ts")
+
+            with patch.object(manager, "_reconnect", side_effect=reconnect_side_effect):
+                with patch("lab.sync.MAX_RETRY_DELAY", 4):
+                    with patch("lab.sync.time.sleep") as mock_sleep:
+                        with patch("builtins.print"):
+                            with pytest.raises(SyncError):
+                                manager._download_file_with_retry(file)
+
+        assert mock_sleep.call_args_list == [call(1), call(2), call(4), call(4)]
+
+    def test_download_gives_up_after_max_attempts(self, tmp_path):
+        """Should raise SyncError after MAX_RETRIES failed attempts."""
+        manager = SyncManager()
+        mock_sftp = create_mock_sftp()
+        manager._sftp = mock_sftp
+        mock_sftp.open.side_effect = OSError("Connection lost")
+
+        def reconnect_side_effect():
+            manager._sftp = mock_sftp
+
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            file = FileToSync("2024/01/15/playlist1", "video.ts")
+
+            with patch.object(manager, "_reconnect", side_effect=reconnect_side_effect) as mock_reconnect:
+                with patch("lab.sync.time.sleep"):
+                    with patch("builtins.print"):
+                        with pytest.raises(SyncError, match=f"after {MAX_RETRIES} attempts") as excinfo:
+                            manager._download_file_with_retry(file)
+
+            assert not file.local_path.exists()
+
+        assert mock_sftp.open.call_count == MAX_RETRIES
+        assert mock_reconnect.call_count == MAX_RETRIES - 1
+        assert isinstance(excinfo.value.__cause__, OSError)
+
+    def test_download_gives_up_without_disconnecting(self, tmp_path):
+        """Should keep the shared connection open when a worker runs out of retries."""
+        manager = SyncManager()
+        mock_sftp = create_mock_sftp()
+        mock_transport = MagicMock()
+        mock_transport.is_active.return_value = True
+        manager._sftp = mock_sftp
+        manager._transport = mock_transport
+        mock_sftp.open.side_effect = OSError("Connection lost")
+
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            file = FileToSync("2024/01/15/playlist1", "video.ts")
+
+            with patch.object(manager, "disconnect") as mock_disconnect:
+                with patch("lab.sync._open_sftp_channel", return_value=mock_sftp):
+                    with patch("lab.sync.time.sleep"):
+                        with patch("builtins.print"):
+                            with pytest.raises(SyncError):
+                                manager._download_file_with_retry(file)
+
+        mock_disconnect.assert_not_called()
+        assert manager._transport is mock_transport
+
+    def test_download_file_with_retry_missing_remote_file_fails_immediately(self, tmp_path):
+        """Should raise SyncError without reconnecting when the remote file does not exist."""
+        manager = SyncManager()
+        mock_sftp = create_mock_sftp()
+        manager._sftp = mock_sftp
+        mock_sftp.open.side_effect = FileNotFoundError(2, "No such file")
+
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            file = FileToSync("2024/01/15/playlist1", "video.ts")
+
+            with patch.object(manager, "_reconnect") as mock_reconnect:
+                with pytest.raises(SyncError, match="Remote file not found"):
+                    manager._download_file_with_retry(file)
+
+                mock_reconnect.assert_not_called()
+                assert mock_sftp.open.call_count == 1
+                assert not file.local_path.exists()
+
+    def test_download_file_with_retry_does_not_retry_unexpected_errors(self, tmp_path):
+        """Should propagate non-connection errors without retrying."""
+        manager = SyncManager()
+        mock_sftp = create_mock_sftp()
+        manager._sftp = mock_sftp
+        mock_sftp.open.side_effect = ValueError("Unexpected")
+
+        with patch("lab.sync.ARCHIVE_DIR", tmp_path):
+            file = FileToSync("2024/01/15/playlist1", "video.ts")
+
+            with patch.object(manager, "_reconnect") as mock_reconnect:
+                with pytest.raises(ValueError, match="Unexpected"):
+                    manager._download_file_with_retry(file)
+
+                mock_reconnect.assert_not_called()
 
     def test_sync_all_no_files(self):
         """Should return empty result when no files to sync."""
@@ -797,6 +1195,80 @@ class TestSyncManager:
                 assert total_files == 3
                 assert mock_download.call_count == 3
 
+    def test_sync_all_runs_concurrently(self):
+        """Should download files on more than one worker thread."""
+        manager = SyncManager()
+        thread_ids = set()
+        calls = []
+        lock = threading.Lock()
+        # The first two downloads only finish once both are in flight at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def record_thread(file):
+            with lock:
+                thread_ids.add(threading.get_ident())
+                calls.append(file)
+                is_first_two = len(calls) <= 2
+            if is_first_two:
+                barrier.wait()
+
+        with patch.object(manager, "_gather_files_to_sync") as mock_gather:
+            with patch.object(manager, "_download_file_with_retry", side_effect=record_thread):
+                mock_gather.return_value = [FileToSync("2024/01/15/playlist1", f"video{i}.ts") for i in range(10)]
+
+                synced_folders, total_files = manager.sync_all(max_workers=4)
+
+                assert total_files == 10
+                assert synced_folders == ["2024/01/15/playlist1"]
+                assert len(thread_ids) >= 2
+
+    def test_sync_all_propagates_download_error(self):
+        """Should raise the first download error and close worker channels."""
+        manager = SyncManager()
+        mock_worker_sftp = MagicMock(spec=paramiko.SFTPClient)
+        manager._worker_sftps.append(mock_worker_sftp)
+
+        with patch.object(manager, "_gather_files_to_sync") as mock_gather:
+            with patch.object(manager, "_download_file_with_retry") as mock_download:
+                mock_gather.return_value = [FileToSync("2024/01/15/playlist1", "video1.ts")]
+                mock_download.side_effect = SyncError("Download failed")
+
+                with pytest.raises(SyncError, match="Download failed"):
+                    manager.sync_all()
+
+                mock_worker_sftp.close.assert_called_once()
+                assert manager._worker_sftps == []
+
+    def test_sftp_for_current_thread_opens_channel_per_worker(self):
+        """Should give each download worker its own SFTP channel on the shared transport."""
+        manager = SyncManager()
+        manager._sftp = MagicMock(spec=paramiko.SFTPClient)
+        manager._transport = MagicMock(spec=paramiko.Transport)
+        worker_sftps = []
+
+        def worker():
+            manager._init_sftp_worker()
+            worker_sftps.append(manager._sftp_for_current_thread())
+            # Repeated calls on the same worker reuse its channel
+            worker_sftps.append(manager._sftp_for_current_thread())
+
+        with patch(
+            "lab.sync.paramiko.SFTPClient.from_transport", side_effect=lambda t: MagicMock(spec=paramiko.SFTPClient)
+        ) as mock_from:
+            threads = [threading.Thread(target=worker) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert mock_from.call_count == 2
+            assert worker_sftps[0] is worker_sftps[1]
+            assert worker_sftps[2] is worker_sftps[3]
+            assert worker_sftps[0] is not worker_sftps[2]
+            assert manager._sftp not in worker_sftps
+            # The main thread keeps using the main client
+            assert manager._sftp_for_current_thread() is manager._sftp
+
     def test_sync_all_calls_folder_callback(self):
         """Should call folder_start callback for each new folder."""
         manager = SyncManager()
@@ -828,38 +1300,30 @@ class TestSyncManager:
                 mock_connect.assert_called_once()
                 mock_disconnect.assert_called_once()
 
-    def test_list_remote_archive_folders_handles_listdir_errors(self):
+    def test_list_remote_archive_folders_handles_listdir_errors(self, connected_manager):
         """Should continue on listdir errors in nested directories."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
 
         # First listdir call (years) succeeds, month listdir fails
-        mock_sftp.listdir.side_effect = [
-            ["2024"],  # years - success
+        mock_sftp.listdir_attr.side_effect = [
+            create_dir_attrs(["2024"]),  # years - success
             OSError("Permission denied"),  # months - fail
         ]
 
-        manager._is_dir = MagicMock(return_value=True)
-
         folders = manager._list_remote_archive_folders()
 
         # Should handle error gracefully and return empty list
         assert folders == []
 
-    def test_list_remote_archive_folders_skips_non_dirs_at_year_level(self):
+    def test_list_remote_archive_folders_skips_non_dirs_at_year_level(self, connected_manager):
         """Should skip non-directory entries at year level."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
 
-        mock_sftp.listdir.side_effect = [
-            ["2024"],  # years
+        # "2024" is a file, not a directory
+        mock_sftp.listdir_attr.side_effect = [
+            [create_file_attrs("2024")],  # years
         ]
 
-        # _is_dir returns False for year_path to skip it
-        manager._is_dir = MagicMock(return_value=False)
-
         folders = manager._list_remote_archive_folders()
 
         assert folders == []
@@ -897,11 +1361,9 @@ class TestRemoteRemovalMethods:
 
         assert "Not connected" in str(excinfo.value)
 
-    def test_remove_remote_folder_recursive_single_file(self):
+    def test_remove_remote_folder_recursive_single_file(self, connected_manager):
         """Should remove a single file in a folder."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
 
         # Mock listdir_attr to return one file
         mock_attr = MagicMock()
@@ -914,11 +1376,9 @@ class TestRemoteRemovalMethods:
         mock_sftp.remove.assert_called_once_with("/remote/path/file.txt")
         mock_sftp.rmdir.assert_called_once_with("/remote/path")
 
-    def test_remove_remote_folder_recursive_with_subdirectory(self):
+    def test_remove_remote_folder_recursive_with_subdirectory(self, connected_manager):
         """Should recursively remove folders and files."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
 
         # First call returns a subdirectory
         subdir_attr = MagicMock()
@@ -941,11 +1401,9 @@ class TestRemoteRemovalMethods:
         assert mock_sftp.remove.call_count == 1
         assert mock_sftp.rmdir.call_count == 2
 
-    def test_remove_remote_folder_recursive_handles_os_error(self):
+    def test_remove_remote_folder_recursive_handles_os_error(self, connected_manager):
         """Should raise SyncError on OS error."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
         mock_sftp.listdir_attr.side_effect = OSError("Permission denied")
 
         with pytest.raises(SyncError) as excinfo:
@@ -962,33 +1420,82 @@ class TestRemoteRemovalMethods:
 
         assert "Not connected" in str(excinfo.value)
 
-    def test_remove_remote_folder_folder_not_found(self):
+    def test_remove_remote_folder_folder_not_found(self, connected_manager):
         """Should raise SyncError when folder doesn't exist."""
-        manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager, mock_sftp = connected_manager
 
-        with patch.object(manager, "_is_dir", return_value=False):
-            with pytest.raises(SyncError) as excinfo:
-                manager.remove_remote_folder("2024/01/15/playlist1")
+        mock_sftp.listdir_attr.side_effect = FileNotFoundError(2, "No such file")
 
-            assert "Remote folder does not exist" in str(excinfo.value)
+        with pytest.raises(SyncError) as excinfo:
+            manager.remove_remote_folder("2024/01/15/playlist1")
 
-    def test_remove_remote_folder_success(self):
+        assert str(excinfo.value) == "Remote folder does not exist: 2024/01/15/playlist1"
+        mock_sftp.rmdir.assert_not_called()
+
+    def test_remove_remote_folder_success(self, connected_manager):
         """Should remove remote folder successfully."""
+        manager, mock_sftp = connected_manager
+
+        with patch.object(manager, "_remove_remote_folder_recursive") as mock_recursive:
+            manager.remove_remote_folder("2024/01/15/playlist1")
+
+            mock_recursive.assert_called_once()
+            # Should be called with full path
+            call_args = mock_recursive.call_args[0][0]
+            assert "2024/01/15/playlist1" in call_args
+            assert call_args.startswith(REMOTE_ARCHIVE_PATH)
+            assert call_args == REMOTE_ARCHIVE_PREFIX + "2024/01/15/playlist1"
+            # Existence is checked by the removal itself, not a separate stat
+            mock_sftp.lstat.assert_not_called()
+            mock_sftp.stat.assert_not_called()
+
+    def test_remove_remote_folder_uses_exec_when_available(self, connected_manager):
+        """Should remove the folder with a single rm -rf exec instead of recursive SFTP calls."""
+        manager, mock_sftp = connected_manager
+        mock_transport = MagicMock(spec=paramiko.Transport)
+        manager._transport = mock_transport
+        mock_channel = mock_transport.open_session.return_value
+        mock_channel.recv.return_value = b""
+        mock_channel.recv_exit_status.return_value = 0
+
+        manager.remove_remote_folder("2024/01/15/playlist1")
+
+        full_path = REMOTE_ARCHIVE_PREFIX + "2024/01/15/playlist1"
+        mock_channel.exec_command.assert_called_once_with(f"test -d {full_path} && rm -rf -- {full_path}")
+        mock_channel.close.assert_called_once()
+        mock_sftp.listdir_attr.assert_not_called()
+        mock_sftp.rmdir.assert_not_called()
+
+    def test_remove_remote_folder_falls_back_when_exec_fails(self):
+        """Should fall back to recursive SFTP removal when the remote command exits with an error."""
         manager = SyncManager()
-        mock_sftp = MagicMock()
-        manager._sftp = mock_sftp
+        manager._sftp = MagicMock(spec=paramiko.SFTPClient)
+        mock_transport = MagicMock(spec=paramiko.Transport)
+        manager._transport = mock_transport
+        mock_transport.open_session.return_value.recv.return_value = b""
+        mock_transport.open_session.return_value.recv_exit_status.return_value = 1
 
-        with patch.object(manager, "_is_dir", return_value=True):
-            with patch.object(manager, "_remove_remote_folder_recursive") as mock_recursive:
-                manager.remove_remote_folder("2024/01/15/playlist1")
+        with patch.object(manager, "_remove_remote_folder_recursive") as mock_recursive:
+            manager.remove_remote_folder("2024/01/15/playlist1")
 
-                mock_recursive.assert_called_once()
-                # Should be called with full path
-                call_args = mock_recursive.call_args[0][0]
-                assert "2024/01/15/playlist1" in call_args
-                assert call_args.startswith(REMOTE_ARCHIVE_PATH)
+            mock_recursive.assert_called_once_with(REMOTE_ARCHIVE_PREFIX + "2024/01/15/playlist1")
+            assert manager._exec_supported is True
+
+    def test_remove_remote_folder_disables_exec_when_refused(self):
+        """Should fall back to SFTP and stop trying exec when the server refuses exec channels."""
+        manager = SyncManager()
+        manager._sftp = MagicMock(spec=paramiko.SFTPClient)
+        mock_transport = MagicMock(spec=paramiko.Transport)
+        manager._transport = mock_transport
+        mock_transport.open_session.side_effect = paramiko.SSHException("Administratively prohibited")
+
+        with patch.object(manager, "_remove_remote_folder_recursive") as mock_recursive:
+            manager.remove_remote_folder("2024/01/15/playlist1")
+            manager.remove_remote_folder("2024/01/15/playlist2")
+
+            assert mock_recursive.call_count == 2
+            assert manager._exec_supported is False
+            mock_transport.open_session.assert_called_once()
 
 
 class TestRemoveRecording:
@@ -1017,7 +1524,7 @@ class TestRemoveRecording:
             mock_sync_class.return_value.__enter__.return_value = mock_sync_instance
 
             with patch("lab.sync.shutil.rmtree") as mock_rmtree:
-                with patch.object(Path, "exists", return_value=True):
+                with patch("lab.sync.os.path.isdir", return_value=True):
                     remove_recording(relative_path)
 
                     # Should call rmtree for both archive and images
@@ -1032,12 +1539,13 @@ class TestRemoveRecording:
             mock_sync_class.return_value.__enter__.return_value = mock_sync_instance
 
             with patch("lab.sync.shutil.rmtree") as mock_rmtree:
-                with patch.object(Path, "exists", return_value=True):
+                with patch("lab.sync.os.path.isdir", return_value=True):
                     remove_recording(relative_path)
 
                     # Should attempt to remove both paths
                     called_paths = [call[0][0] for call in mock_rmtree.call_args_list]
                     assert len(called_paths) == 2
+                    assert all(call.kwargs == {"ignore_errors": True} for call in mock_rmtree.call_args_list)
 
     def test_remove_recording_skips_nonexistent_local_paths(self):
         """Should gracefully skip removal if local paths don't exist."""
@@ -1048,13 +1556,23 @@ class TestRemoveRecording:
             mock_sync_class.return_value.__enter__.return_value = mock_sync_instance
 
             with patch("lab.sync.shutil.rmtree") as mock_rmtree:
-                with patch.object(Path, "exists", return_value=False):
+                with patch("lab.sync.os.path.isdir", return_value=False):
                     # Should not raise, even if local paths don't exist
                     remove_recording(relative_path)
 
                     # rmtree should never be called since paths don't exist
                     mock_rmtree.assert_not_called()
 
+    def test_remove_recording_bulk_rmtree_single_walk(self):
+        """Should remove archive and images folders with a single combined call."""
+        relative_path = "2026/01/15/auto_2026-01-15T06:45:57Z_uuid"
+
+        with patch("lab.sync.SyncManager"):
+            with patch("lab.sync._bulk_rmtree") as mock_bulk_rmtree:
+                remove_recording(relative_path)
+
+                mock_bulk_rmtree.assert_called_once_with([ARCHIVE_DIR / relative_path, IMAGES_DIR / relative_path])
+
     def test_remove_recording_calls_sync_manager_as_context(self):
         """Should use SyncManager as context manager."""
         relative_path = "2026/01/15/auto_2026-01-15T06:45:57Z_uuid"
@@ -1064,7 +1582,7 @@ class TestRemoveRecording:
             mock_sync_class.return_value.__enter__ = MagicMock(return_value=mock_sync_instance)
             mock_sync_class.return_value.__exit__ = MagicMock(return_value=None)
 
-            with patch.object(Path, "exists", return_value=False):
+            with patch("lab.sync.os.path.isdir", return_value=False):
                 remove_recording(relative_path)
 
                 # Should enter and exit context
@@ -1087,12 +1605,12 @@ class TestRemoveRecording:
 
             with patch("lab.sync.shutil.rmtree") as mock_rmtree:
 
-                def track_rmtree(path):
+                def track_rmtree(path, ignore_errors=False):
                     call_sequence.append(("rmtree", str(path)))
 
                 mock_rmtree.side_effect = track_rmtree
 
-                with patch.object(Path, "exists", return_value=True):
+                with patch("lab.sync.os.path.isdir", return_value=True):
                     remove_recording(relative_path)
 
                     # First call should be remove_remote
@@ -1110,7 +1628,7 @@ class TestSyncSingleFolder:
         manager = SyncManager()
         folder = "2024/01/15/playlist1"
 
-        with patch.object(manager, "_get_files_to_sync") as mock_get_files:
+        with patch.object(manager, "_get_file_attrs_to_sync") as mock_get_files:
             mock_get_files.return_value = []
 
             result = manager.sync_single_folder(folder)
@@ -1123,9 +1641,13 @@ class TestSyncSingleFolder:
         manager = SyncManager()
         folder = "2024/01/15/playlist1"
 
-        with patch.object(manager, "_get_files_to_sync") as mock_get_files:
+        with patch.object(manager, "_get_file_attrs_to_sync") as mock_get_files:
             with patch.object(manager, "_download_file_with_retry") as mock_download:
-                mock_get_files.return_value = ["video1.ts", "video2.ts", "video3.ts"]
+                mock_get_files.return_value = [
+                    create_file_attrs("video1.ts", 10),
+                    create_file_attrs("video2.ts", 20),
+                    create_file_attrs("video3.ts", 30),
+                ]
 
                 result = manager.sync_single_folder(folder)
 
@@ -1139,6 +1661,7 @@ class TestSyncSingleFolder:
                 assert calls[1][0][0].filename == "video2.ts"
                 assert calls[2][0][0].folder == folder
                 assert calls[2][0][0].filename == "video3.ts"
+                assert [call[0][0].size for call in calls] == [10, 20, 30]
 
     def test_sync_single_folder_calls_progress_callback(self):
         """Should call progress callback for each file."""
@@ -1146,9 +1669,9 @@ class TestSyncSingleFolder:
         folder = "2024/01/15/playlist1"
         progress_callback = MagicMock()
 
-        with patch.object(manager, "_get_files_to_sync") as mock_get_files:
+        with patch.object(manager, "_get_file_attrs_to_sync") as mock_get_files:
             with patch.object(manager, "_download_file_with_retry"):
-                mock_get_files.return_value = ["video1.ts", "video2.ts"]
+                mock_get_files.return_value = [create_file_attrs("video1.ts"), create_file_attrs("video2.ts")]
 
                 manager.sync_single_folder(folder, on_file_progress=progress_callback)
 
@@ -1157,14 +1680,34 @@ class TestSyncSingleFolder:
                 assert calls[0][0] == (1, 2, "video1.ts")
                 assert calls[1][0] == (2, 2, "video2.ts")
 
+    def test_sync_single_folder_batched_progress(self):
+        """Should call progress callback once per batch and for the last file."""
+        manager = SyncManager()
+        folder = "2024/01/15/playlist1"
+        progress_callback = MagicMock()
+        filenames = [f"video{i}.ts" for i in range(25)]
+
+        with patch.object(manager, "_get_file_attrs_to_sync") as mock_get_files:
+            with patch.object(manager, "_download_file_with_retry") as mock_download:
+                mock_get_files.return_value = [create_file_attrs(filename) for filename in filenames]
+
+                result = manager.sync_single_folder(folder, on_file_progress=progress_callback, progress_batch_size=10)
+
+                assert result == 25
+                assert mock_download.call_count == 25
+                assert progress_callback.call_count <= math.ceil(25 / 10) + 1
+                calls = progress_callback.call_args_list
+                assert calls[0][0] == (10, 25, "video9.ts")
+                assert calls[-1][0] == (25, 25, "video24.ts")
+
     def test_sync_single_folder_no_callback(self):
         """Should work without progress callback."""
         manager = SyncManager()
         folder = "2024/01/15/playlist1"
 
-        with patch.object(manager, "_get_files_to_sync") as mock_get_files:
+        with patch.object(manager, "_get_file_attrs_to_sync") as mock_get_files:
             with patch.object(manager, "_download_file_with_retry"):
-                mock_get_files.return_value = ["video1.ts"]
+                mock_get_files.return_value = [create_file_attrs("video1.ts")]
 
                 result = manager.sync_single_folder(folder, on_file_progress=None)
 
@@ -1175,9 +1718,9 @@ class TestSyncSingleFolder:
         manager = SyncManager()
         folder = "2024/01/15/playlist1"
 
-        with patch.object(manager, "_get_files_to_sync") as mock_get_files:
+        with patch.object(manager, "_get_file_attrs_to_sync") as mock_get_files:
             with patch.object(manager, "_download_file_with_retry") as mock_download:
-                mock_get_files.return_value = ["video1.ts"]
+                mock_get_files.return_value = [create_file_attrs("video1.ts")]
                 mock_download.side_effect = SyncError("Download failed")
 
                 with pytest.raises(SyncError, match="Download failed"):
@@ -1227,94 +1770,48 @@ class TestRemoveHlsFiles:
 
             assert result == 0
 
-    def test_remove_hls_files_empty_folder(self):
-        """Should return 0 when folder is empty."""
+    @pytest.mark.parametrize(
+        ("names", "expected_removed"),
+        [
+            pytest.param([], [], id="empty_folder"),
+            pytest.param(
+                ["video1.ts", "video2.ts", "playlist.m3u8"],
+                ["video1.ts", "video2.ts", "playlist.m3u8"],
+                id="removes_ts_and_m3u8",
+            ),
+            pytest.param(["video.ts", "frame.png", "notes.txt"], ["video.ts"], id="preserves_other_files"),
+            pytest.param(
+                ["video.ts", "video.tss", "playlist.m3u8", "playlist.m3u"],
+                ["video.ts", "playlist.m3u8"],
+                id="only_removes_exact_extensions",
+            ),
+        ],
+    )
+    def test_remove_hls_files_removes_only_hls_files(self, names, expected_removed):
+        """Should remove only files with exact .ts or .m3u8 extensions and return the count."""
         relative_path = "2024/01/15/playlist1"
+        entries = [create_dir_entry(name) for name in names]
 
         with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "iterdir", return_value=[]):
-                result = remove_hls_files(relative_path)
+            with patch("lab.sync.os.scandir", return_value=create_scandir(entries)):
+                with patch("lab.sync.os.unlink") as mock_unlink:
+                    result = remove_hls_files(relative_path)
 
-                assert result == 0
-
-    def test_remove_hls_files_removes_ts_and_m3u8(self):
-        """Should remove .ts and .m3u8 files and return count."""
-        relative_path = "2024/01/15/playlist1"
-
-        # Create mock files
-        mock_ts1 = MagicMock(spec=Path)
-        mock_ts1.suffix = ".ts"
-        mock_ts2 = MagicMock(spec=Path)
-        mock_ts2.suffix = ".ts"
-        mock_m3u8 = MagicMock(spec=Path)
-        mock_m3u8.suffix = ".m3u8"
-
-        with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "iterdir", return_value=[mock_ts1, mock_ts2, mock_m3u8]):
-                result = remove_hls_files(relative_path)
-
-                assert result == 3
-                mock_ts1.unlink.assert_called_once()
-                mock_ts2.unlink.assert_called_once()
-                mock_m3u8.unlink.assert_called_once()
-
-    def test_remove_hls_files_preserves_other_files(self):
-        """Should not remove non-HLS files."""
-        relative_path = "2024/01/15/playlist1"
-
-        # Create mock files
-        mock_ts = MagicMock(spec=Path)
-        mock_ts.suffix = ".ts"
-        mock_png = MagicMock(spec=Path)
-        mock_png.suffix = ".png"
-        mock_txt = MagicMock(spec=Path)
-        mock_txt.suffix = ".txt"
-
-        with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "iterdir", return_value=[mock_ts, mock_png, mock_txt]):
-                result = remove_hls_files(relative_path)
-
-                assert result == 1
-                mock_ts.unlink.assert_called_once()
-                mock_png.unlink.assert_not_called()
-                mock_txt.unlink.assert_not_called()
+                    assert result == len(expected_removed)
+                    removed = [call[0][0] for call in mock_unlink.call_args_list]
+                    assert removed == [f"/archive/{name}" for name in expected_removed]
 
     def test_remove_hls_files_constructs_correct_path(self):
         """Should construct path relative to ARCHIVE_DIR."""
         relative_path = "2024/01/15/playlist1"
 
-        with patch.object(Path, "exists") as mock_exists:
-            mock_exists.return_value = False
-
-            remove_hls_files(relative_path)
-
-            # The exists() call should be on the constructed path
-            # We need to verify the path was constructed correctly
-            mock_exists.assert_called_once()
-
-    def test_remove_hls_files_only_removes_exact_extensions(self):
-        """Should only remove files with exact .ts or .m3u8 extensions."""
-        relative_path = "2024/01/15/playlist1"
-
-        # Create mock files with various extensions
-        mock_ts = MagicMock(spec=Path)
-        mock_ts.suffix = ".ts"
-        mock_tss = MagicMock(spec=Path)
-        mock_tss.suffix = ".tss"  # Similar but not exact
-        mock_m3u8 = MagicMock(spec=Path)
-        mock_m3u8.suffix = ".m3u8"
-        mock_m3u = MagicMock(spec=Path)
-        mock_m3u.suffix = ".m3u"  # Similar but not exact
-
         with patch.object(Path, "exists", return_value=True):
-            with patch.object(Path, "iterdir", return_value=[mock_ts, mock_tss, mock_m3u8, mock_m3u]):
-                result = remove_hls_files(relative_path)
-
-                assert result == 2
-                mock_ts.unlink.assert_called_once()
-                mock_m3u8.unlink.assert_called_once()
-                mock_tss.unlink.assert_not_called()
-                mock_m3u.unlink.assert_not_called()
+            with patch("lab.sync.os.scandir", return_value=create_scandir([])) as mock_scandir:
+                remove_hls_files(relative_path)
+
+                mock_scandir.assert_called_once_with(ARCHIVE_DIR / relative_path)
+                # The directory handle is closed once the listing is done
+                mock_scandir.return_value.__exit__.assert_called_once()
 
 
 class TestRemoveEmptyDateDirs:
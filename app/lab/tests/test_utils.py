@@ -1,11 +1,13 @@
 """Unit tests for lab/utils.py business logic."""
 
-import base64
+import os
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import cv2
 import numpy as np
 import pytest
+from processor.types import DetectionBox
 
 from lab.exception import UserFacingError
 from lab.utils import (
@@ -49,6 +51,20 @@ class TestIsOutsideStorage:
 
         assert is_outside_storage(boundary_dir, sibling) is True
 
+    def test_sibling_sharing_name_prefix_is_outside(self, tmp_path):
+        boundary_dir = tmp_path / "images"
+        boundary_dir.mkdir()
+        sibling = tmp_path / "images_backup" / "file.png"
+
+        assert is_outside_storage(boundary_dir, sibling) is True
+
+    def test_parent_traversal_out_of_storage_is_outside(self, tmp_path):
+        boundary_dir = tmp_path / "images"
+        boundary_dir.mkdir()
+        escaped = boundary_dir / ".." / "outside" / "file.png"
+
+        assert is_outside_storage(boundary_dir, escaped) is True
+
 
 class TestValidateSelectedImage:
     """Tests for validate_png_selection function."""
@@ -107,6 +123,25 @@ class TestValidateSelectedImage:
 
         assert result is None
 
+    def test_nested_directory_swapped_for_outside_symlink_is_rejected(self, tmp_path):
+        boundary_dir = tmp_path / "images"
+        nested_dir = boundary_dir / "2024"
+        nested_dir.mkdir(parents=True)
+        outside_dir = tmp_path / "outside"
+        outside_dir.mkdir()
+        file_path = nested_dir / "image.png"
+
+        with patch("lab.utils.IMAGES_DIR", boundary_dir):
+            validate_selected_image(file_path)
+
+            nested_dir.rmdir()
+            nested_dir.symlink_to(outside_dir)
+
+            with pytest.raises(UserFacingError) as exc_info:
+                validate_selected_image(file_path)
+
+        assert exc_info.value.title == "Invalid selection"
+
 
 class TestLoadFrame:
     """Tests for load_frame function."""
@@ -136,6 +171,70 @@ class TestLoadFrame:
         assert exc_info.value.title == "Load error"
         assert exc_info.value.message == f"Could not read image at {nonexistent}"
 
+    def test_load_with_scale_decodes_reduced_frame(self, data_dir):
+        full = load_frame(data_dir / "bird.png")
+
+        reduced = load_frame(data_dir / "bird.png", scale=2)
+
+        assert reduced.shape[0] == (full.shape[0] + 1) // 2
+        assert reduced.shape[1] == (full.shape[1] + 1) // 2
+        assert reduced.shape[2] == 3
+
+    def test_repeated_load_reuses_decoded_frame(self, tmp_path, bird_frame):
+        image_path = tmp_path / "frame.png"
+        cv2.imwrite(str(image_path), bird_frame)
+
+        with patch("lab.utils.cv2.imdecode", wraps=cv2.imdecode) as mock_imdecode:
+            first = load_frame(image_path)
+            second = load_frame(image_path)
+
+        assert second is first
+        mock_imdecode.assert_called_once()
+
+    def test_cached_frame_is_read_only(self, tmp_path, bird_frame):
+        image_path = tmp_path / "frame.png"
+        cv2.imwrite(str(image_path), bird_frame)
+        frame = load_frame(image_path)
+
+        with pytest.raises(ValueError):
+            frame[0, 0] = 0
+
+        assert load_frame(image_path)[0, 0].tolist() == bird_frame[0, 0].tolist()
+
+    def test_rewritten_file_is_decoded_again(self, tmp_path, bird_frame):
+        image_path = tmp_path / "frame.png"
+        cv2.imwrite(str(image_path), bird_frame)
+        first = load_frame(image_path)
+
+        cv2.imwrite(str(image_path), bird_frame[:10, :10])
+        os.utime(image_path, ns=(0, os.stat(image_path).st_mtime_ns + 1))
+        second = load_frame(image_path)
+
+        assert second.shape[:2] == (10, 10)
+        assert first.shape != second.shape
+
+    def test_load_non_image_file_raises_error(self, tmp_path):
+        not_an_image = tmp_path / "broken.png"
+        not_an_image.write_bytes(b"not a png")
+
+        with pytest.raises(UserFacingError) as exc_info:
+            load_frame(not_an_image)
+
+        assert exc_info.value.message == f"Could not read image at {not_an_image}"
+
+    def test_load_empty_file_raises_error(self, tmp_path):
+        empty = tmp_path / "empty.png"
+        empty.write_bytes(b"")
+
+        with pytest.raises(UserFacingError) as exc_info:
+            load_frame(empty)
+
+        assert exc_info.value.message == f"Could not read image at {empty}"
+
+    def test_load_with_unsupported_scale_raises_value_error(self, data_dir):
+        with pytest.raises(ValueError):
+            load_frame(data_dir / "bird.png", scale=3)
+
 
 class TestAnnotateFrame:
     """Tests for annotate_frame function."""
@@ -169,6 +268,45 @@ class TestAnnotateFrame:
         result = annotate_frame(frame, boxes)
         assert result is not None
 
+    def test_box_edges_use_class_color_and_leave_interior_untouched(self):
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        boxes = [DetectionBox(10, 20, 50, 60, 1, 0.9)]
+
+        result = annotate_frame(frame, boxes)
+
+        blue = [255, 0, 0]
+        assert result[20, 30].tolist() == blue
+        assert result[21, 30].tolist() == blue
+        assert result[60, 30].tolist() == blue
+        assert result[40, 10].tolist() == blue
+        assert result[40, 50].tolist() == blue
+        assert result[40, 30].tolist() == [0, 0, 0]
+        assert result[19, 30].tolist() == [0, 0, 0]
+
+    def test_partially_outside_box_is_clipped_to_frame(self):
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+
+        result = annotate_frame(frame, [(-10, -10, 130, 30)])
+
+        assert result[0, 50].tolist() != [0, 0, 0]
+        assert result[15, 99].tolist() != [0, 0, 0]
+        assert result[15, 50].tolist() == [0, 0, 0]
+
+    def test_box_outside_frame_is_skipped(self):
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+
+        result = annotate_frame(frame, [(120, 120, 150, 150)])
+
+        assert np.array_equal(result, frame)
+
+    def test_in_place_draws_on_given_frame(self):
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+
+        result = annotate_frame(frame, [(10, 10, 50, 50)], in_place=True)
+
+        assert result is frame
+        assert frame[10, 30].tolist() != [0, 0, 0]
+
     def test_annotate_does_not_modify_original_frame(self, bird_frame):
         original_copy = bird_frame.copy()
         boxes = [(10, 10, 50, 50)]
@@ -223,7 +361,7 @@ class TestgetAnnotatedImageBytes:
         assert exc_info.value.title == "Load error"
         assert exc_info.value.message == f"Could not read image at {nonexistent_path}"
 
-    def test_get_annotated_image_bytes_returns_b64_encoded_png(self, mock_detector, data_dir):
+    def test_get_annotated_image_bytes_returns_decodable_png(self, mock_detector, data_dir, bird_frame):
         # Setup
         boxes = [(10, 10, 50, 50)]
         mock_detector.detect_boxes.return_value = boxes
@@ -231,12 +369,22 @@ class TestgetAnnotatedImageBytes:
         # Execute
         result = get_annotated_image_bytes(mock_detector, data_dir / "bird.png")
 
-        # Assert - verify it's valid base64
-        try:
-            decoded = base64.b64decode(result)
-            assert len(decoded) > 0
-        except Exception:
-            pytest.fail("result is not valid base64")
+        # Assert - raw PNG bytes that decode back to a frame of the original size
+        decoded = cv2.imdecode(np.frombuffer(result, dtype=np.uint8), cv2.IMREAD_COLOR)
+        assert decoded is not None
+        assert decoded.shape == bird_frame.shape
+
+    def test_get_annotated_image_bytes_encodes_png_with_fast_compression(self, mock_detector, data_dir):
+        # Setup
+        mock_detector.detect_boxes.return_value = [(10, 10, 50, 50)]
+
+        # Execute
+        with patch("lab.utils.cv2.imencode", wraps=cv2.imencode) as mock_imencode:
+            result = get_annotated_image_bytes(mock_detector, data_dir / "bird.png")
+
+        # Assert - still a PNG, written at low zlib effort
+        assert result.startswith(b"\x89PNG")
+        assert mock_imencode.call_args.args[2] == [cv2.IMWRITE_PNG_COMPRESSION, 1]
 
     def test_get_annotated_image_bytes_with_single_box(self, mock_detector, data_dir):
         # Setup
@@ -329,9 +477,22 @@ class TestgetAnnotatedImageBytes:
         assert exc_info.value.title == "No bird detected"
         assert exc_info.value.severity == "info"
 
+    def test_get_annotated_image_bytes_with_scale_maps_regions_to_reduced_frame(self, mock_detector, data_dir):
+        """Test get_annotated_image_bytes crops scaled-down regions from a reduced frame."""
+        # Setup
+        mock_detector.detect_boxes.return_value = [(1, 1, 5, 5)]
+        regions = [Region(20, 40, 100, 120)]
+
+        # Execute
+        get_annotated_image_bytes(mock_detector, data_dir / "bird.png", regions=regions, scale=4)
+
+        # Assert
+        cropped = mock_detector.detect_boxes.call_args.args[0]
+        assert cropped.shape[:2] == (20, 20)
 
-class TestRegionDataclass:
-    """Tests for Region dataclass."""
+
+class TestRegion:
+    """Tests for Region named tuple."""
 
     def test_region_creation(self):
         """Test Region can be created with coordinates."""
@@ -341,3 +502,10 @@ class TestRegionDataclass:
         assert region.y1 == 20
         assert region.x2 == 100
         assert region.y2 == 200
+
+    def test_region_from_coordinate_tuple(self):
+        """Should build a Region from a stored (x1, y1, x2, y2) tuple."""
+        region = Region._make((10, 20, 100, 200))
+
+        assert region == Region(10, 20, 100, 200)
+        assert region.x2 == 100